@@ -24,6 +24,7 @@ from app.models.oauth import OAuthAccount, OAuthState
 from app.models.scholarship_applications import ScholarshipApplication
 from app.models.college_applications import CollegeApplication
 from app.models.entity_image import EntityImage
+from app.models.scholarship_matches import UserScholarshipMatch
 
 config = context.config
 if config.config_file_name is not None:
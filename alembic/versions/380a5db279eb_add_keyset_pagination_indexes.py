@@ -0,0 +1,47 @@
+"""add keyset pagination indexes
+
+Revision ID: 380a5db279eb
+Revises: a49cb5395f79
+Create Date: 2026-10-16 21:02:28.573072
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '380a5db279eb'
+down_revision: Union[str, None] = 'a49cb5395f79'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Institutions: default listing order (data_completeness_score DESC, name, id)
+    op.create_index(
+        'ix_institutions_completeness_name_id',
+        'institutions',
+        [sa.text('data_completeness_score DESC'), 'name', 'id'],
+    )
+    op.create_index(
+        'ix_institutions_state_completeness_name_id',
+        'institutions',
+        ['state', sa.text('data_completeness_score DESC'), 'name', 'id'],
+    )
+
+    # Scholarships: public listing order (title, id) within a status
+    op.create_index(
+        'ix_scholarships_status_title_id',
+        'scholarships',
+        ['status', 'title', 'id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_scholarships_status_title_id', table_name='scholarships')
+    op.drop_index(
+        'ix_institutions_state_completeness_name_id', table_name='institutions'
+    )
+    op.drop_index('ix_institutions_completeness_name_id', table_name='institutions')
@@ -0,0 +1,50 @@
+"""add scholarship full text search
+
+Revision ID: 781fb153b602
+Revises: 380a5db279eb
+Create Date: 2026-10-16 21:13:20.528208
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '781fb153b602'
+down_revision: Union[str, None] = '380a5db279eb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Weighted document: title (A) > organization (B) > description (C)
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(organization, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        'scholarships',
+        sa.Column(
+            'search_vector',
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_SQL, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        'ix_scholarships_search_vector',
+        'scholarships',
+        ['search_vector'],
+        postgresql_using='gin',
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_scholarships_search_vector', table_name='scholarships')
+    op.drop_column('scholarships', 'search_vector')
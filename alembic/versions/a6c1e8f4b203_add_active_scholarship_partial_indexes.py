@@ -0,0 +1,38 @@
+"""add partial indexes over active scholarships
+
+Revision ID: a6c1e8f4b203
+Revises: f3b7d2a9c614
+Create Date: 2026-10-17 00:12:37.215904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6c1e8f4b203'
+down_revision: Union[str, None] = 'f3b7d2a9c614'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_scholarships_active_deadline',
+        'scholarships',
+        ['deadline'],
+        postgresql_where=sa.text("status = 'ACTIVE'"),
+    )
+    op.create_index(
+        'ix_scholarships_active_amount_max',
+        'scholarships',
+        [sa.text('amount_max DESC')],
+        postgresql_where=sa.text("status = 'ACTIVE'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_scholarships_active_amount_max', table_name='scholarships')
+    op.drop_index('ix_scholarships_active_deadline', table_name='scholarships')
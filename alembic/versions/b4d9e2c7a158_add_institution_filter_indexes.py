@@ -0,0 +1,98 @@
+"""add institution filter indexes
+
+Revision ID: b4d9e2c7a158
+Revises: a6c1e8f4b203
+Create Date: 2026-10-17 01:03:48.671220
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d9e2c7a158'
+down_revision: Union[str, None] = 'a6c1e8f4b203'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_institutions_control_completeness_name_id',
+        'institutions',
+        ['control_type', sa.text('data_completeness_score DESC'), 'name', 'id'],
+    )
+    op.create_index(
+        'ix_institutions_state_control_completeness_name_id',
+        'institutions',
+        [
+            'state',
+            'control_type',
+            sa.text('data_completeness_score DESC'),
+            'name',
+            'id',
+        ],
+    )
+    op.create_index(
+        'ix_institutions_size_locale',
+        'institutions',
+        ['size_category', 'locale'],
+        postgresql_ops={'locale': 'varchar_pattern_ops'},
+    )
+    op.create_index(
+        'ix_institutions_locale_pattern',
+        'institutions',
+        ['locale'],
+        postgresql_ops={'locale': 'varchar_pattern_ops'},
+    )
+    op.create_index(
+        'ix_institutions_state_tuition_in_state',
+        'institutions',
+        ['state', 'tuition_in_state'],
+    )
+    op.create_index(
+        'ix_institutions_tuition_in_state', 'institutions', ['tuition_in_state']
+    )
+    op.create_index(
+        'ix_institutions_tuition_out_of_state',
+        'institutions',
+        ['tuition_out_of_state'],
+    )
+    op.create_index(
+        'ix_institutions_acceptance_rate', 'institutions', ['acceptance_rate']
+    )
+    op.create_index(
+        'ix_institutions_sat_band',
+        'institutions',
+        [
+            sa.text('(sat_math_25th + sat_reading_25th)'),
+            sa.text('(sat_math_75th + sat_reading_75th)'),
+        ],
+    )
+    op.create_index(
+        'ix_institutions_act_band',
+        'institutions',
+        ['act_composite_25th', 'act_composite_75th'],
+    )
+    op.create_index('ix_institutions_name_id', 'institutions', ['name', 'id'])
+    op.create_index('ix_institutions_city_id', 'institutions', ['city', 'id'])
+
+
+def downgrade() -> None:
+    for name in (
+        'ix_institutions_city_id',
+        'ix_institutions_name_id',
+        'ix_institutions_act_band',
+        'ix_institutions_sat_band',
+        'ix_institutions_acceptance_rate',
+        'ix_institutions_tuition_out_of_state',
+        'ix_institutions_tuition_in_state',
+        'ix_institutions_state_tuition_in_state',
+        'ix_institutions_locale_pattern',
+        'ix_institutions_size_locale',
+        'ix_institutions_state_control_completeness_name_id',
+        'ix_institutions_control_completeness_name_id',
+    ):
+        op.drop_index(name, table_name='institutions')
@@ -0,0 +1,43 @@
+"""add institution trigram indexes
+
+Revision ID: c2f4a7d91e3b
+Revises: 781fb153b602
+Create Date: 2026-10-16 21:31:04.112845
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2f4a7d91e3b'
+down_revision: Union[str, None] = '781fb153b602'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # Fuzzy name/city search (/api/v1/institutions/search)
+    op.create_index(
+        'ix_institutions_name_trgm',
+        'institutions',
+        ['name'],
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_institutions_city_trgm',
+        'institutions',
+        ['city'],
+        postgresql_using='gin',
+        postgresql_ops={'city': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_institutions_city_trgm', table_name='institutions')
+    op.drop_index('ix_institutions_name_trgm', table_name='institutions')
@@ -0,0 +1,74 @@
+"""add institution cost of attendance columns
+
+Revision ID: c8f2a5d1e907
+Revises: b4d9e2c7a158
+Create Date: 2026-10-17 01:46:05.390117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8f2a5d1e907'
+down_revision: Union[str, None] = 'b4d9e2c7a158'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tuition + room and board (combined figure, else room + board)
+HOUSING_COST_SQL = (
+    "coalesce(room_and_board, coalesce(room_cost, 0) + coalesce(board_cost, 0))"
+)
+COST_IN_STATE_SQL = (
+    "coalesce(tuition_in_state, tuition_private, tuition_out_of_state) + "
+    + HOUSING_COST_SQL
+)
+COST_OUT_OF_STATE_SQL = (
+    "coalesce(tuition_out_of_state, tuition_private, tuition_in_state) + "
+    + HOUSING_COST_SQL
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        'institutions',
+        sa.Column(
+            'cost_in_state',
+            sa.Numeric(10, 2),
+            sa.Computed(COST_IN_STATE_SQL, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.add_column(
+        'institutions',
+        sa.Column(
+            'cost_out_of_state',
+            sa.Numeric(10, 2),
+            sa.Computed(COST_OUT_OF_STATE_SQL, persisted=True),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        'ix_institutions_cost_in_state_id', 'institutions', ['cost_in_state', 'id']
+    )
+    op.create_index(
+        'ix_institutions_cost_out_of_state_id',
+        'institutions',
+        ['cost_out_of_state', 'id'],
+    )
+    op.create_index(
+        'ix_institutions_state_cost_in_state_id',
+        'institutions',
+        ['state', 'cost_in_state', 'id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_institutions_state_cost_in_state_id', table_name='institutions')
+    op.drop_index('ix_institutions_cost_out_of_state_id', table_name='institutions')
+    op.drop_index('ix_institutions_cost_in_state_id', table_name='institutions')
+    op.drop_column('institutions', 'cost_out_of_state')
+    op.drop_column('institutions', 'cost_in_state')
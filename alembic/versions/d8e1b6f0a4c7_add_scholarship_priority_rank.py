@@ -0,0 +1,78 @@
+"""add scholarship priority rank
+
+Revision ID: d8e1b6f0a4c7
+Revises: c2f4a7d91e3b
+Create Date: 2026-10-16 21:44:37.902113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8e1b6f0a4c7'
+down_revision: Union[str, None] = 'c2f4a7d91e3b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same ranking as app.models.scholarship.compute_priority_rank at the time
+# of this migration; new writes are ranked by the ORM
+BACKFILL_SQL = """
+UPDATE scholarships SET priority_rank = CASE
+    WHEN title ILIKE '%Lowe%Educational%' THEN 1
+    WHEN title ILIKE '%Target%Community%' THEN 2
+    WHEN title ILIKE '%Google%Lime%' THEN 3
+    WHEN title ILIKE '%Coca%Cola%' THEN 4
+    WHEN title ILIKE '%Violet%Richardson%' THEN 5
+    WHEN title ILIKE '%National%Merit%' THEN 6
+    WHEN title ILIKE '%Do%Something%' THEN 7
+    WHEN primary_image_url IS NOT NULL THEN 8
+    ELSE 9
+END
+"""
+
+
+def upgrade() -> None:
+    op.add_column(
+        'scholarships',
+        sa.Column(
+            'priority_rank',
+            sa.SmallInteger(),
+            nullable=False,
+            server_default=sa.text('9'),
+        ),
+    )
+    op.execute(BACKFILL_SQL)
+    op.alter_column('scholarships', 'priority_rank', server_default=None)
+
+    op.create_index(
+        op.f('ix_scholarships_priority_rank'), 'scholarships', ['priority_rank']
+    )
+    op.create_index(
+        'ix_scholarships_status_priority_created',
+        'scholarships',
+        ['status', 'priority_rank', sa.text('created_at DESC')],
+    )
+    op.create_index(
+        'ix_scholarships_status_priority_deadline',
+        'scholarships',
+        ['status', 'priority_rank', 'deadline'],
+    )
+    op.create_index(
+        'ix_scholarships_status_priority_amount_max',
+        'scholarships',
+        ['status', 'priority_rank', sa.text('amount_max DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_scholarships_status_priority_amount_max', table_name='scholarships'
+    )
+    op.drop_index('ix_scholarships_status_priority_deadline', table_name='scholarships')
+    op.drop_index('ix_scholarships_status_priority_created', table_name='scholarships')
+    op.drop_index(op.f('ix_scholarships_priority_rank'), table_name='scholarships')
+    op.drop_column('scholarships', 'priority_rank')
@@ -0,0 +1,62 @@
+"""add user scholarship matches
+
+Revision ID: e5a9c3d27b14
+Revises: d8e1b6f0a4c7
+Create Date: 2026-10-16 22:08:51.447120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a9c3d27b14'
+down_revision: Union[str, None] = 'd8e1b6f0a4c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user_scholarship_matches',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('scholarship_id', sa.Integer(), nullable=False),
+        sa.Column('score', sa.Float(), nullable=False),
+        sa.Column('computed_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(
+            ['scholarship_id'], ['scholarships.id'], ondelete='CASCADE'
+        ),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'idx_user_match_score',
+        'user_scholarship_matches',
+        ['user_id', sa.text('score DESC')],
+    )
+    op.create_index(
+        'idx_user_match_scholarship',
+        'user_scholarship_matches',
+        ['user_id', 'scholarship_id'],
+        unique=True,
+    )
+    op.create_index(
+        op.f('ix_user_scholarship_matches_scholarship_id'),
+        'user_scholarship_matches',
+        ['scholarship_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f('ix_user_scholarship_matches_scholarship_id'),
+        table_name='user_scholarship_matches',
+    )
+    op.drop_index(
+        'idx_user_match_scholarship', table_name='user_scholarship_matches'
+    )
+    op.drop_index('idx_user_match_score', table_name='user_scholarship_matches')
+    op.drop_table('user_scholarship_matches')
@@ -0,0 +1,39 @@
+"""add entity_images gallery indexes
+
+Revision ID: e7b3c91f5a28
+Revises: c8f2a5d1e907
+Create Date: 2026-10-17 03:08:52.604117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b3c91f5a28'
+down_revision: Union[str, None] = 'c8f2a5d1e907'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# entity_images belongs to campusconnect-backend: this only adds the gallery
+# read indexes and leaves that service's own indexes alone.
+def upgrade() -> None:
+    op.create_index(
+        'ix_entity_images_entity_order',
+        'entity_images',
+        ['entity_type', 'entity_id', 'display_order', 'created_at'],
+    )
+    op.create_index(
+        'ix_entity_images_featured',
+        'entity_images',
+        ['entity_type', 'entity_id', 'display_order', 'created_at'],
+        postgresql_where=sa.text('is_featured'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_entity_images_featured', table_name='entity_images')
+    op.drop_index('ix_entity_images_entity_order', table_name='entity_images')
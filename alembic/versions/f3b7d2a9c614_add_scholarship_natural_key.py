@@ -0,0 +1,43 @@
+"""add scholarship (organization, title) unique index
+
+Revision ID: f3b7d2a9c614
+Revises: e5a9c3d27b14
+Create Date: 2026-10-16 23:41:12.803514
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b7d2a9c614'
+down_revision: Union[str, None] = 'e5a9c3d27b14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    duplicates = op.get_bind().execute(
+        sa.text(
+            "SELECT organization, title FROM scholarships "
+            "GROUP BY organization, title HAVING count(*) > 1 LIMIT 10"
+        )
+    ).all()
+    if duplicates:
+        raise RuntimeError(
+            "Resolve duplicate scholarships before adding the unique index: "
+            + "; ".join(f"{org!r} / {title!r}" for org, title in duplicates)
+        )
+
+    op.create_index(
+        'uq_scholarships_organization_title',
+        'scholarships',
+        ['organization', 'title'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_scholarships_organization_title', table_name='scholarships')
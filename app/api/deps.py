@@ -1,5 +1,8 @@
 # app/api/deps.py - SYNC VERSION
-from fastapi import Depends, HTTPException, status
+from decimal import Decimal
+from typing import Optional
+
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from sqlalchemy.orm import Session
@@ -7,7 +10,9 @@ from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.core.security import ALGORITHM, SECRET_KEY
 from app.services.user import UserService
+from app.models.institution import ControlType
 from app.models.user import User
+from app.schemas.institution import InstitutionSearchFilter
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
@@ -47,3 +52,55 @@ def get_current_user(
         )
 
     return user
+
+
+def get_current_superuser(
+    current_user: User = Depends(get_current_user),
+) -> User:
+    """Dependency for admin-only endpoints"""
+    if not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN, detail="Not enough permissions"
+        )
+    return current_user
+
+
+def institution_criteria(
+    state: Optional[str] = Query(
+        None, max_length=2, description="Filter by state code"
+    ),
+    control_type: Optional[ControlType] = Query(None),
+    search_query: Optional[str] = Query(
+        None, max_length=100, description="Name or city contains"
+    ),
+    size_category: Optional[str] = Query(None, max_length=50),
+    locale: Optional[str] = Query(
+        None, max_length=50, description='Prefix match, e.g. "City" or "Rural"'
+    ),
+    min_tuition: Optional[Decimal] = Query(None, ge=0),
+    max_tuition: Optional[Decimal] = Query(None, ge=0),
+    tuition_residency: str = Query("in_state", pattern="^(in_state|out_of_state)$"),
+    min_acceptance_rate: Optional[Decimal] = Query(None, ge=0, le=100),
+    max_acceptance_rate: Optional[Decimal] = Query(None, ge=0, le=100),
+    sat_score: Optional[int] = Query(
+        None, ge=400, le=1600, description="Within the middle-50% SAT band"
+    ),
+    act_score: Optional[int] = Query(
+        None, ge=1, le=36, description="Within the middle-50% ACT band"
+    ),
+) -> InstitutionSearchFilter:
+    """InstitutionSearchFilter criteria from query params (no sort)"""
+    return InstitutionSearchFilter(
+        state=state.upper() if state else None,
+        control_type=control_type,
+        search_query=search_query,
+        size_category=size_category,
+        locale=locale,
+        min_tuition=min_tuition,
+        max_tuition=max_tuition,
+        tuition_residency=tuition_residency,
+        min_acceptance_rate=min_acceptance_rate,
+        max_acceptance_rate=max_acceptance_rate,
+        sat_score=sat_score,
+        act_score=act_score,
+    )
@@ -2,11 +2,34 @@
 # FIXED: Proper route ordering - specific routes BEFORE generic routes
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, or_, func
 from typing import Optional
-from app.core.database import get_db
+from app.api.deps import institution_criteria
+from app.core.database import get_async_read_db
+from app.core.pagination import (
+    encode_cursor,
+    decode_sort_values,
+    keyset_after,
+    listing_total,
+)
 from app.models.institution import Institution
-from app.schemas.institution import InstitutionResponse
+from app.services.catalog_reads import CatalogReadRepository
+from app.services.institution import (
+    SUMMARY_COLUMNS,
+    count_filters,
+    filter_institutions,
+    listing_columns,
+    order_by_keys,
+    sort_keys,
+    sort_values,
+    without_placeholder_image,
+)
+from app.services.institution_snapshot import institution_snapshot, summary_stats
+from app.schemas.institution import (
+    InstitutionResponse,
+    InstitutionSearchFilter,
+    InstitutionStats,
+)
 
 # No prefix - main.py already adds /api/v1/institutions
 router = APIRouter()
@@ -20,15 +43,13 @@ router = APIRouter()
 
 @router.get("/by-id/{institution_id}", response_model=InstitutionResponse)
 async def get_institution_by_id(
-    institution_id: int, db: AsyncSession = Depends(get_db)
+    institution_id: int, db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Get a single institution by database ID.
     PUBLIC endpoint - no authentication required.
     """
-    query = select(Institution).where(Institution.id == institution_id)
-    result = await db.execute(query)
-    institution = result.scalar_one_or_none()
+    institution = await CatalogReadRepository(db).institution(institution_id)
 
     if not institution:
         raise HTTPException(status_code=404, detail="Institution not found")
@@ -36,16 +57,88 @@ async def get_institution_by_id(
     return institution
 
 
+@router.get("/search")
+async def search_institutions(
+    q: str = Query(..., min_length=2, max_length=100, description="Name or city"),
+    limit: int = Query(20, ge=1, le=50, description="Max results"),
+    state: Optional[str] = Query(
+        None, max_length=2, description="Filter by state code"
+    ),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    Typo-tolerant institution search by name or city.
+    Results are ranked by trigram word similarity (pg_trgm) and use the
+    slim summary fields.
+    PUBLIC endpoint - no authentication required.
+
+    Query params:
+    - q: Search text, e.g. "harvrd" or "ann arbor" (min 2 characters)
+    - limit: Max results (default: 20, max: 50)
+    - state: Optional 2-letter state code filter
+    """
+    q = q.strip()
+
+    # `column %> q` (word similarity above pg_trgm's threshold) and ILIKE
+    # are both served by the gin_trgm_ops indexes on name and city
+    similarity = func.greatest(
+        func.word_similarity(q, Institution.name),
+        func.word_similarity(q, Institution.city),
+    ).label("similarity")
+
+    query = (
+        select(*without_placeholder_image(SUMMARY_COLUMNS), similarity)
+        .where(
+            or_(
+                Institution.name.op("%>")(q),
+                Institution.city.op("%>")(q),
+                Institution.name.icontains(q, autoescape=True),
+            )
+        )
+        .order_by(
+            similarity.desc(),
+            Institution.data_completeness_score.desc(),
+            Institution.id,
+        )
+        .limit(limit)
+    )
+
+    if state:
+        query = query.where(Institution.state == state.upper())
+
+    result = await db.execute(query)
+
+    items = []
+    for row in result.all():
+        item = dict(row._mapping)
+        item["similarity"] = round(float(item["similarity"]), 4)
+        items.append(item)
+
+    return {"items": items, "query": q, "limit": limit}
+
+
+@router.get("/stats/summary", response_model=InstitutionStats)
+async def get_institution_stats(db: AsyncSession = Depends(get_async_read_db)):
+    """
+    Catalog totals by control type and state.
+    Served from the shared institution snapshot, so it costs no queries
+    once a snapshot is published.
+    PUBLIC endpoint - no authentication required.
+    """
+    snapshot = await db.run_sync(institution_snapshot.snapshot)
+    return summary_stats(snapshot)
+
+
 # This must come AFTER /by-id/{institution_id} but BEFORE the catch-all /
 @router.get("/{ipeds_id}", response_model=InstitutionResponse)
-async def get_institution(ipeds_id: int, db: AsyncSession = Depends(get_db)):
+async def get_institution(
+    ipeds_id: int, db: AsyncSession = Depends(get_async_read_db)
+):
     """
     Get a single institution by IPEDS ID.
     PUBLIC endpoint - no authentication required.
     """
-    query = select(Institution).where(Institution.ipeds_id == ipeds_id)
-    result = await db.execute(query)
-    institution = result.scalar_one_or_none()
+    institution = await CatalogReadRepository(db).institution_by_ipeds(ipeds_id)
 
     if not institution:
         raise HTTPException(status_code=404, detail="Institution not found")
@@ -53,74 +146,141 @@ async def get_institution(ipeds_id: int, db: AsyncSession = Depends(get_db)):
     return institution
 
 
+def institution_filters(
+    criteria: InstitutionSearchFilter = Depends(institution_criteria),
+    residency_state: Optional[str] = Query(
+        None,
+        min_length=2,
+        max_length=2,
+        description="sort_by=cost: in-state cost for institutions in this state",
+    ),
+    sort_by: str = Query(
+        "data_completeness_score",
+        pattern="^(name|city|state|data_completeness_score|cost)$",
+    ),
+    sort_order: str = Query("desc", pattern="^(asc|desc)$"),
+) -> InstitutionSearchFilter:
+    """institution_criteria() plus the listing sort from query params"""
+    return criteria.model_copy(
+        update={
+            "residency_state": residency_state.upper() if residency_state else None,
+            "sort_by": sort_by,
+            "sort_order": sort_order,
+        }
+    )
+
+
 # This MUST be last - it's the most generic route
 @router.get("/")
 async def get_institutions(
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     limit: int = Query(48, ge=1, le=100, description="Items per page"),
-    state: Optional[str] = Query(
-        None, max_length=2, description="Filter by state code"
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page (keyset mode)"
     ),
-    db: AsyncSession = Depends(get_db),
+    count: str = Query(
+        "exact",
+        pattern="^(exact|estimate)$",
+        description="How to compute total: exact or planner estimate",
+    ),
+    view: str = Query(
+        "full",
+        pattern="^(full|summary)$",
+        description="full (InstitutionResponse) or summary (card fields only)",
+    ),
+    filters: InstitutionSearchFilter = Depends(institution_filters),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """
-    Get paginated institutions with optional state filter.
-    Returns institutions sorted by data completeness score.
+    Get paginated institutions matching InstitutionSearchFilter criteria.
+    By default institutions are sorted by data completeness score.
     PUBLIC endpoint - no authentication required.
 
     Query params:
     - page: Page number (default: 1)
     - limit: Items per page (default: 48, max: 100)
-    - state: Optional 2-letter state code filter
+    - state, control_type, size_category: Exact filters
+    - locale: Prefix filter ("City" matches "City: Large")
+    - search_query: Name or city contains
+    - min_tuition / max_tuition: Range on in-state or out-of-state tuition
+      (tuition_residency)
+    - min_acceptance_rate / max_acceptance_rate: Range in percent
+    - sat_score / act_score: Institutions whose middle-50% band contains it
+    - sort_by / sort_order: name, city, state, data_completeness_score or
+      cost (default: data_completeness_score desc)
+    - residency_state: For sort_by=cost, the student's state: institutions
+      there are ranked by in-state cost, others by out-of-state cost
+      (without it, tuition_residency picks the cost). Cost mode skips
+      institutions without cost data and adds cost_of_attendance to items.
+    - cursor: Opaque next_cursor from a previous response. When given, the
+      page is read with keyset pagination (no OFFSET, no COUNT) and
+      total/page/total_pages are null. Cursors are tied to the sort.
+    - count: "exact" (cached COUNT) or "estimate" (planner row estimate for
+      broad filters; total_estimated is true when one was used)
+    - view: "full" (default, every InstitutionResponse field) or "summary"
+      (InstitutionSummary fields only, for grid pages)
     """
-    # Calculate offset from page number
-    offset = (page - 1) * limit
+    # Core select of the view's response columns: rows are serialized as
+    # they come back (no ORM objects, no per-row re-validation)
+    query = filter_institutions(select(*listing_columns(filters, view)), filters)
 
-    # Build base query
-    query = select(Institution)
+    # Unique sort key (ends with id) so the order and cursors are stable
+    keys = sort_keys(filters)
+    query = order_by_keys(query, keys)
 
-    # Apply state filter if provided
-    if state:
-        query = query.where(Institution.state == state.upper())
+    if cursor:
+        try:
+            values = decode_sort_values(cursor, keys)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
 
-    # Get total count for pagination
-    count_query = select(func.count()).select_from(Institution)
-    if state:
-        count_query = count_query.where(Institution.state == state.upper())
+        query = query.where(keyset_after(keys, values))
 
-    # Execute count query without streaming
-    result = await db.execute(count_query)
-    total = result.scalar()  # Get the count value
+        # Fetch one extra row to know if there is a next page
+        result = await db.execute(query.limit(limit + 1))
+        institutions = result.all()
+        has_more = len(institutions) > limit
+        institutions = institutions[:limit]
+        total = page = total_pages = None
+        total_estimated = False
+    else:
+        # Calculate offset from page number
+        offset = (page - 1) * limit
 
-    # Sort by data completeness score (best schools first), then name
-    query = query.order_by(Institution.data_completeness_score.desc(), Institution.name)
+        # Total for pagination metadata (cached per filter set)
+        total, total_estimated = await listing_total(
+            db,
+            "institutions",
+            count_filters(filters),
+            query,
+            count,
+        )
 
-    # Apply pagination
-    query = query.limit(limit).offset(offset)
+        # Apply pagination
+        query = query.limit(limit).offset(offset)
 
-    # Execute institutions query
-    institutions_result = await db.execute(query)
-    institutions = (
-        institutions_result.scalars().all()
-    )  # Use scalars() for list of objects
+        # Execute institutions query
+        institutions_result = await db.execute(query)
+        institutions = institutions_result.all()
 
-    # Calculate pagination metadata
-    total_pages = (total + limit - 1) // limit  # Ceiling division
+        # Calculate pagination metadata
+        total_pages = (total + limit - 1) // limit  # Ceiling division
+        has_more = page < total_pages
 
-    # Clean up institution data - remove invalid default image URLs
-    items = []
-    for inst in institutions:
-        inst_dict = InstitutionResponse.model_validate(inst).model_dump()
-        # Remove the problematic default image URL
-        if inst_dict.get("primary_image_url") == "/images/default-institution.jpg":
-            inst_dict["primary_image_url"] = None
-        items.append(inst_dict)
+    # Rows already hold the response fields (default image nulled in SQL)
+    items = [dict(row._mapping) for row in institutions]
+
+    next_cursor = None
+    if has_more and institutions:
+        next_cursor = encode_cursor({"k": sort_values(institutions[-1], filters)})
 
     return {
         "items": items,
         "total": total,
+        "total_estimated": total_estimated,
         "page": page,
         "limit": limit,
         "total_pages": total_pages,
-        "has_more": page < total_pages,
+        "has_more": has_more,
+        "next_cursor": next_cursor,
     }
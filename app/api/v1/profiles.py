@@ -1,16 +1,18 @@
 # app/api/v1/profiles.py - WORKS WITH USER OBJECTS + SETTINGS SUPPORT
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, Query, status, UploadFile, File
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import os
 import shutil
 from pathlib import Path
 from typing import List, Dict, Any
-from app.models.institution import Institution
 
-from app.core.database import get_db
-from app.api.deps import get_current_user
+from app.core.database import get_db, get_read_db
+from app.api.deps import get_current_user, institution_criteria
 from app.services.profile import ProfileService
+from app.services.scholarship_matches import ScholarshipMatchService
+from app.services.admissions_fit import AdmissionsFitService
+from app.services.institution_directory import InstitutionDirectoryService
 from app.schemas.profile import (
     ProfileUpdate,
     ProfileResponse,
@@ -18,7 +20,8 @@ from app.schemas.profile import (
     ProfileCreate,
     SettingsUpdate,
 )
-from app.schemas.institution import InstitutionResponse
+from app.schemas.institution import InstitutionSearchFilter
+from app.schemas.scholarship import ScholarshipResponse
 from app.services.resume_parser import ResumeParser
 from app.services.file_extractor import FileExtractor
 from app.services.digitalocean_spaces import DigitalOceanSpaces
@@ -79,13 +82,15 @@ async def update_my_profile(
 
 @router.get("/me/matching-institutions")
 async def get_matching_institutions(
-    limit: int = 50,
+    limit: int = Query(50, ge=1),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
+    read_db: Session = Depends(get_read_db),
 ) -> Dict[str, Any]:
     """
     Get institutions matching user's location preference
     Returns both institutions and total count
+    Served from the cached per-state directory (shared by all users)
     """
     profile_service = ProfileService(db)
 
@@ -96,28 +101,79 @@ async def get_matching_institutions(
     if not profile or not profile.location_preference:
         return {"institutions": [], "total": 0, "location_preference": None}
 
-    # Get ALL matching institutions (no limit) to count them
-    all_institutions = (
-        db.query(Institution)
-        .filter(Institution.state == profile.location_preference)
-        .order_by(Institution.name)
-        .all()
+    institutions, total_count = InstitutionDirectoryService(read_db).matching(
+        profile.location_preference, limit
     )
 
-    total_count = len(all_institutions)
+    return {
+        "institutions": institutions,
+        "total": total_count,
+        "location_preference": profile.location_preference,
+    }
 
-    # Return limited set for display
-    limited_institutions = all_institutions[:limit]
+
+@router.get("/me/scholarship-matches")
+async def get_scholarship_matches(
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_user),
+    read_db: Session = Depends(get_read_db),
+) -> Dict[str, Any]:
+    """
+    Get the current user's precomputed scholarship matches, best first.
+    Matches are refreshed when the profile's GPA, graduation year or major
+    changes, or when a relevant scholarship is added or edited.
+    """
+    matches = ScholarshipMatchService(read_db).get_matches(
+        current_user.id, limit=limit
+    )
 
     return {
-        "institutions": [
-            InstitutionResponse.model_validate(i) for i in limited_institutions
+        "matches": [
+            {
+                **ScholarshipResponse.model_validate(scholarship).model_dump(),
+                "match_score": score,
+            }
+            for scholarship, score in matches
         ],
-        "total": total_count,
-        "location_preference": profile.location_preference,
+        "total": len(matches),
     }
 
 
+@router.get("/me/admissions-fit")
+def get_admissions_fit(
+    category: Optional[str] = Query(
+        None, pattern="^(reach|match|safety|unknown)$", description="Only this fit"
+    ),
+    page: int = Query(1, ge=1),
+    limit: int = Query(50, ge=1, le=100),
+    filters: InstitutionSearchFilter = Depends(institution_criteria),
+    current_user: User = Depends(get_current_user),
+    read_db: Session = Depends(get_read_db),
+) -> Dict[str, Any]:
+    """
+    Classify institutions as reach, match or safety for the current user's
+    SAT/ACT scores (against each institution's middle-50% bands and
+    acceptance rate). Accepts the institution listing filters (not its
+    sort); results are in the listing's default order (data completeness,
+    name, id), with per-category counts.
+    """
+    profile = ProfileService(read_db).get_by_user_id(current_user.id)
+    if not profile or not (profile.sat_score or profile.act_score):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Add an SAT or ACT score to your profile to see admissions fit",
+        )
+
+    return AdmissionsFitService(read_db).fit_page(
+        profile.sat_score,
+        profile.act_score,
+        filters=filters,
+        category=category,
+        page=page,
+        limit=limit,
+    )
+
+
 # ===========================
 # SETTINGS ENDPOINTS
 # ===========================
@@ -435,12 +491,16 @@ async def upload_resume_and_update_profile(
         # If GPA exists, get scholarship matches
         scholarship_matches = []
         if not needs_gpa:
-            from app.services.scholarship import ScholarshipService
-
-            scholarship_service = ScholarshipService(db)
-            scholarship_matches = scholarship_service.find_by_gpa(
-                gpa=updated_profile.gpa, limit=10
-            )
+            # update_profile refreshed the stored matches if anything changed
+            # (computed here if none are stored yet); the primary session
+            # sees those writes without replica lag
+            match_service = ScholarshipMatchService(db)
+            scholarship_matches = [
+                scholarship
+                for scholarship, _ in match_service.get_or_compute_matches(
+                    user_id, limit=10
+                )
+            ]
 
         # Return comprehensive response
         return {
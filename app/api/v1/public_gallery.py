@@ -1,94 +1,176 @@
 """
 Public gallery endpoints for MagicScholar.
 Displays gallery images from the unified database (managed by Abacadaba).
+Reads go through CatalogReadRepository (Core rows, no ORM instances).
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from app.core.database import get_db
-from app.models.entity_image import EntityImage
-from app.models.institution import Institution
-from app.schemas.entity_image import EntityImageResponse
+from app.core.database import get_async_read_db
+from app.schemas.entity_image import (
+    EntityImageResponse,
+    FeaturedImagesBatch,
+    GalleriesBatch,
+)
+from app.services.catalog_reads import CatalogReadRepository
 
 router = APIRouter(tags=["gallery"])
 
+# Entity ids accepted by one batch request (a grid page is 48 cards)
+MAX_BATCH_IDS = 100
+# Largest Postgres integer
+MAX_ENTITY_ID = 2**31 - 1
+
+
+def batch_ids(
+    ids: Optional[List[int]] = Query(
+        None, description="Entity ids, repeated (?ids=1&ids=2)"
+    ),
+) -> List[int]:
+    """Requested ids without duplicates, in request order"""
+    # Checked here, not by a required Query(...): on FastAPI 0.104 /
+    # pydantic 2.4 the 422 for a missing list parameter fails to serialize
+    if not ids or len(ids) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=422, detail=f"Pass between 1 and {MAX_BATCH_IDS} ids"
+        )
+    # Bound as a Postgres integer[] (see catalog_reads.any_of)
+    if not all(0 < entity_id <= MAX_ENTITY_ID for entity_id in ids):
+        raise HTTPException(status_code=422, detail="Invalid id")
+    return list(dict.fromkeys(ids))
+
+
+# ============================================================================
+# BATCH ENDPOINTS - one query for a whole grid page.
+# Registered first: /institutions/ipeds/featured would otherwise match
+# /institutions/{institution_id}/featured
+# ============================================================================
+
+
+@router.get("/institutions/featured", response_model=FeaturedImagesBatch)
+async def get_institutions_featured_images(
+    ids: List[int] = Depends(batch_ids), db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Featured image for each of up to 100 institutions (by database ID).
+    PUBLIC endpoint.
+    """
+    images = await CatalogReadRepository(db).featured_images("institution", ids)
+    return {"images": images}
+
+
+@router.get("/institutions/images", response_model=GalleriesBatch)
+async def get_institutions_galleries(
+    ids: List[int] = Depends(batch_ids), db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Gallery images for each of up to 100 institutions (by database ID).
+    PUBLIC endpoint.
+    """
+    galleries = await CatalogReadRepository(db).galleries("institution", ids)
+    return {"galleries": galleries}
+
+
+@router.get("/institutions/ipeds/featured", response_model=FeaturedImagesBatch)
+async def get_institutions_featured_images_by_ipeds(
+    ids: List[int] = Depends(batch_ids), db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Featured image for each of up to 100 institutions, keyed by IPEDS ID.
+    Unknown IPEDS IDs map to null.
+    """
+    images = await CatalogReadRepository(db).featured_images(
+        "institution", ids, by_ipeds=True
+    )
+    return {"images": images}
+
+
+@router.get("/institutions/ipeds/images", response_model=GalleriesBatch)
+async def get_institutions_galleries_by_ipeds(
+    ids: List[int] = Depends(batch_ids), db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Gallery images for each of up to 100 institutions, keyed by IPEDS ID.
+    Unknown IPEDS IDs map to an empty gallery.
+    """
+    galleries = await CatalogReadRepository(db).galleries(
+        "institution", ids, by_ipeds=True
+    )
+    return {"galleries": galleries}
+
+
+@router.get("/scholarships/featured", response_model=FeaturedImagesBatch)
+async def get_scholarships_featured_images(
+    ids: List[int] = Depends(batch_ids), db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Featured image for each of up to 100 scholarships.
+    PUBLIC endpoint.
+    """
+    images = await CatalogReadRepository(db).featured_images("scholarship", ids)
+    return {"images": images}
+
+
+@router.get("/scholarships/images", response_model=GalleriesBatch)
+async def get_scholarships_galleries(
+    ids: List[int] = Depends(batch_ids), db: AsyncSession = Depends(get_async_read_db)
+):
+    """
+    Gallery images for each of up to 100 scholarships.
+    PUBLIC endpoint.
+    """
+    galleries = await CatalogReadRepository(db).galleries("scholarship", ids)
+    return {"galleries": galleries}
+
+
+# ============================================================================
+# SINGLE-ENTITY ENDPOINTS
+# ============================================================================
+
 
 @router.get(
     "/institutions/{institution_id}/images", response_model=List[EntityImageResponse]
 )
-def get_institution_gallery(institution_id: int, db: Session = Depends(get_db)):
+async def get_institution_gallery(
+    institution_id: int, db: AsyncSession = Depends(get_async_read_db)
+):
     """
     Get all gallery images for an institution.
     PUBLIC endpoint - no authentication required.
     """
-    images = (
-        db.query(EntityImage)
-        .filter(
-            and_(
-                EntityImage.entity_type == "institution",
-                EntityImage.entity_id == institution_id,
-            )
-        )
-        .order_by(EntityImage.display_order, EntityImage.created_at)
-        .all()
-    )
-
-    return images
+    return await CatalogReadRepository(db).gallery("institution", institution_id)
 
 
 @router.get(
     "/institutions/{institution_id}/featured",
     response_model=Optional[EntityImageResponse],
 )
-def get_institution_featured_image(institution_id: int, db: Session = Depends(get_db)):
+async def get_institution_featured_image(
+    institution_id: int, db: AsyncSession = Depends(get_async_read_db)
+):
     """
     Get the featured/primary image for an institution.
     PUBLIC endpoint.
     """
-    image = (
-        db.query(EntityImage)
-        .filter(
-            and_(
-                EntityImage.entity_type == "institution",
-                EntityImage.entity_id == institution_id,
-                EntityImage.is_featured == True,
-            )
-        )
-        .first()
+    return await CatalogReadRepository(db).featured_image(
+        "institution", institution_id
     )
 
-    return image
-
 
 @router.get(
     "/institutions/ipeds/{ipeds_id}/images", response_model=List[EntityImageResponse]
 )
-def get_institution_gallery_by_ipeds(ipeds_id: int, db: Session = Depends(get_db)):
+async def get_institution_gallery_by_ipeds(
+    ipeds_id: int, db: AsyncSession = Depends(get_async_read_db)
+):
     """
     Get gallery images for an institution by IPEDS ID.
     More convenient since MagicScholar uses IPEDS IDs.
     """
-    # First get the institution
-    institution = db.query(Institution).filter(Institution.ipeds_id == ipeds_id).first()
-
-    if not institution:
+    images = await CatalogReadRepository(db).institution_images_by_ipeds(ipeds_id)
+    if images is None:
         raise HTTPException(status_code=404, detail="Institution not found")
-
-    # Then get its gallery
-    images = (
-        db.query(EntityImage)
-        .filter(
-            and_(
-                EntityImage.entity_type == "institution",
-                EntityImage.entity_id == institution.id,
-            )
-        )
-        .order_by(EntityImage.display_order, EntityImage.created_at)
-        .all()
-    )
-
     return images
 
 
@@ -96,76 +178,44 @@ def get_institution_gallery_by_ipeds(ipeds_id: int, db: Session = Depends(get_db
     "/institutions/ipeds/{ipeds_id}/featured",
     response_model=Optional[EntityImageResponse],
 )
-def get_institution_featured_image_by_ipeds(
-    ipeds_id: int, db: Session = Depends(get_db)
+async def get_institution_featured_image_by_ipeds(
+    ipeds_id: int, db: AsyncSession = Depends(get_async_read_db)
 ):
     """
     Get the featured image for an institution by IPEDS ID.
     """
-    # First get the institution
-    institution = db.query(Institution).filter(Institution.ipeds_id == ipeds_id).first()
-
-    if not institution:
-        raise HTTPException(status_code=404, detail="Institution not found")
-
-    # Then get its featured image
-    image = (
-        db.query(EntityImage)
-        .filter(
-            and_(
-                EntityImage.entity_type == "institution",
-                EntityImage.entity_id == institution.id,
-                EntityImage.is_featured == True,
-            )
-        )
-        .first()
+    images = await CatalogReadRepository(db).institution_images_by_ipeds(
+        ipeds_id, featured=True
     )
-
-    return image
+    if images is None:
+        raise HTTPException(status_code=404, detail="Institution not found")
+    return images[0] if images else None
 
 
 @router.get(
     "/scholarships/{scholarship_id}/images", response_model=List[EntityImageResponse]
 )
-def get_scholarship_gallery(scholarship_id: int, db: Session = Depends(get_db)):
+async def get_scholarship_gallery(
+    scholarship_id: int, db: AsyncSession = Depends(get_async_read_db)
+):
     """
     Get all gallery images for a scholarship.
     PUBLIC endpoint.
     """
-    images = (
-        db.query(EntityImage)
-        .filter(
-            and_(
-                EntityImage.entity_type == "scholarship",
-                EntityImage.entity_id == scholarship_id,
-            )
-        )
-        .order_by(EntityImage.display_order, EntityImage.created_at)
-        .all()
-    )
-
-    return images
+    return await CatalogReadRepository(db).gallery("scholarship", scholarship_id)
 
 
 @router.get(
     "/scholarships/{scholarship_id}/featured",
     response_model=Optional[EntityImageResponse],
 )
-def get_scholarship_featured_image(scholarship_id: int, db: Session = Depends(get_db)):
+async def get_scholarship_featured_image(
+    scholarship_id: int, db: AsyncSession = Depends(get_async_read_db)
+):
     """
     Get the featured image for a scholarship.
     PUBLIC endpoint.
     """
-    image = (
-        db.query(EntityImage)
-        .filter(
-            and_(
-                EntityImage.entity_type == "scholarship",
-                EntityImage.entity_id == scholarship_id,
-                EntityImage.is_featured == True,
-            )
-        )
-        .first()
+    return await CatalogReadRepository(db).featured_image(
+        "scholarship", scholarship_id
     )
-
-    return image
@@ -1,16 +1,52 @@
 # app/api/v1/scholarships.py
 # FIXED: Proper route ordering - specific routes BEFORE generic routes
-from fastapi import APIRouter, Depends, HTTPException, Query
+import codecs
+
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    UploadFile,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy.orm import Session
+from sqlalchemy import select
 from typing import Optional
-from datetime import datetime
-from app.core.database import get_db
-from app.models.scholarship import Scholarship, ScholarshipStatus
-from app.schemas.scholarship import ScholarshipResponse
+from datetime import date, datetime
+from decimal import Decimal
+from app.api.deps import get_current_superuser
+from app.core.database import get_async_read_db, get_db
+from app.core.pagination import (
+    decode_sort_values,
+    encode_cursor,
+    keyset_after,
+    listing_total,
+)
+from app.models.scholarship import Scholarship, ScholarshipStatus, ScholarshipType
+from app.models.user import User
+from app.schemas.scholarship import (
+    BulkIngestResult,
+    ScholarshipCreate,
+    ScholarshipResponse,
+    ScholarshipSearchFilter,
+    ScholarshipUpdate,
+)
+from app.services.catalog_reads import SCHOLARSHIP_COLUMNS, CatalogReadRepository
+from app.services.scholarship import ScholarshipConflictError, ScholarshipService
+from app.services.scholarship_ingest import ScholarshipIngestService
+from app.services.scholarship_matches import (
+    refresh_all_matches,
+    refresh_matches_for_scholarship,
+)
 
 router = APIRouter()
 
+# Listing sort as (column, descending) keys; cursors carry their values
+LISTING_KEYS = [(Scholarship.title, False), (Scholarship.id, False)]
+
 
 # ============================================================================
 # IMPORTANT: Route order matters!
@@ -18,16 +54,229 @@ router = APIRouter()
 # ============================================================================
 
 
+def search_filters(
+    scholarship_type: Optional[ScholarshipType] = Query(None),
+    active_only: bool = Query(True),
+    verified_only: bool = Query(False),
+    featured_only: bool = Query(False),
+    search_query: Optional[str] = Query(
+        None, max_length=200, description="Title, organization, description"
+    ),
+    min_amount: Optional[int] = Query(None, ge=0),
+    max_amount: Optional[int] = Query(None, ge=0),
+    renewable_only: Optional[bool] = Query(None),
+    min_gpa_filter: Optional[Decimal] = Query(
+        None, ge=0, le=4.0, description="Only scholarships this GPA qualifies for"
+    ),
+    deadline_before: Optional[date] = Query(None),
+    deadline_after: Optional[date] = Query(None),
+    academic_year: Optional[str] = Query(None, max_length=20),
+) -> ScholarshipSearchFilter:
+    """ScholarshipSearchFilter criteria from query params (shared by
+    /search and /facets)"""
+    return ScholarshipSearchFilter(
+        scholarship_type=scholarship_type,
+        active_only=active_only,
+        verified_only=verified_only,
+        featured_only=featured_only,
+        search_query=search_query,
+        min_amount=min_amount,
+        max_amount=max_amount,
+        renewable_only=renewable_only,
+        min_gpa_filter=min_gpa_filter,
+        deadline_before=deadline_before,
+        deadline_after=deadline_after,
+        academic_year=academic_year,
+    )
+
+
 # Specific route must come BEFORE the catch-all /{scholarship_id}
+@router.get("/search")
+async def search_scholarships(
+    page: int = Query(1, ge=1, description="Page number (1-indexed)"),
+    limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    sort_by: str = Query(
+        "created_at",
+        pattern="^(created_at|amount_min|amount_max|deadline|title|views_count)$",
+    ),
+    sort_order: str = Query("desc", pattern="^(asc|desc)$"),
+    count: str = Query(
+        "exact",
+        pattern="^(exact|estimate)$",
+        description="How to compute total: exact or planner estimate",
+    ),
+    criteria: ScholarshipSearchFilter = Depends(search_filters),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    Search scholarships with the full ScholarshipSearchFilter.
+    Result pages are cached per normalized filter set (Redis, or in-process
+    when Redis is unavailable) and dropped on scholarship writes.
+    PUBLIC endpoint - no authentication required.
+    """
+    filters = criteria.model_copy(
+        update={
+            "page": page,
+            "limit": limit,
+            "sort_by": sort_by,
+            "sort_order": sort_order,
+            "count": count,
+        }
+    )
+
+    try:
+        items, total = await db.run_sync(
+            lambda session: ScholarshipService(session).search_scholarships_cached(
+                filters
+            )
+        )
+    except Exception as e:
+        print(f"Error searching scholarships: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to search scholarships: {str(e)}"
+        )
+
+    total_pages = (total + limit - 1) // limit
+    return {
+        "items": items,
+        "total": total,
+        "page": page,
+        "limit": limit,
+        "total_pages": total_pages,
+        "has_more": page < total_pages,
+    }
+
+
+@router.get("/facets")
+async def scholarship_facets(
+    filters: ScholarshipSearchFilter = Depends(search_filters),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """
+    Counts per scholarship_type, amount bucket, renewable flag and deadline
+    month for the scholarships matching the /search filters, computed in
+    one grouped query and cached per normalized filter set.
+    PUBLIC endpoint - no authentication required.
+    """
+    try:
+        return await db.run_sync(
+            lambda session: ScholarshipService(session).facet_counts(filters)
+        )
+    except Exception as e:
+        print(f"Error counting scholarship facets: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to count scholarship facets: {str(e)}"
+        )
+
+
+@router.post("/bulk-ingest", response_model=BulkIngestResult)
+def bulk_ingest_scholarships(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(..., description="CSV with ScholarshipCreate columns"),
+    current_user: User = Depends(get_current_superuser),
+    db: Session = Depends(get_db),
+):
+    """
+    Bulk upsert scholarships from a CSV upload (COPY into a staging table,
+    then INSERT ... ON CONFLICT (organization, title)).
+    Invalid rows are rejected and reported; valid rows are still loaded.
+    ADMIN endpoint - requires a superuser.
+    """
+    stream = codecs.iterdecode(file.file, "utf-8-sig")
+    try:
+        result = ScholarshipIngestService(db).ingest_csv(stream)
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="CSV must be UTF-8 encoded")
+    except Exception as e:
+        print(f"Error ingesting scholarships: {str(e)}")
+        raise HTTPException(
+            status_code=500, detail=f"Failed to ingest scholarships: {str(e)}"
+        )
+
+    if result.inserted or result.updated:
+        # Stored per-user matches are rebuilt after the response is sent
+        background_tasks.add_task(refresh_all_matches)
+    return result
+
+
+@router.post("/", response_model=ScholarshipResponse, status_code=201)
+def create_scholarship(
+    scholarship_data: ScholarshipCreate,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_superuser),
+    db: Session = Depends(get_db),
+):
+    """
+    Create a scholarship. 409 if (organization, title) already exists.
+    Affected user matches are refreshed after the response is sent.
+    ADMIN endpoint - requires a superuser.
+    """
+    try:
+        scholarship = ScholarshipService(db).create_scholarship(scholarship_data)
+    except ScholarshipConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        print(f"Error creating scholarship: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    background_tasks.add_task(refresh_matches_for_scholarship, scholarship.id)
+    return scholarship
+
+
+@router.patch("/{scholarship_id}", response_model=ScholarshipResponse)
+def update_scholarship(
+    scholarship_id: int,
+    scholarship_data: ScholarshipUpdate,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(get_current_superuser),
+    db: Session = Depends(get_db),
+):
+    """
+    Update a scholarship. 409 if the new (organization, title) is taken.
+    Affected user matches are refreshed after the response is sent.
+    ADMIN endpoint - requires a superuser.
+    """
+    try:
+        scholarship = ScholarshipService(db).update_scholarship(
+            scholarship_id, scholarship_data
+        )
+    except ScholarshipConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        print(f"Error updating scholarship: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    if not scholarship:
+        raise HTTPException(status_code=404, detail="Scholarship not found")
+
+    background_tasks.add_task(refresh_matches_for_scholarship, scholarship.id)
+    return scholarship
+
+
+@router.delete("/{scholarship_id}", status_code=204)
+def delete_scholarship(
+    scholarship_id: int,
+    current_user: User = Depends(get_current_superuser),
+    db: Session = Depends(get_db),
+):
+    """
+    Delete a scholarship (stored user matches go with it).
+    ADMIN endpoint - requires a superuser.
+    """
+    if not ScholarshipService(db).delete_scholarship(scholarship_id):
+        raise HTTPException(status_code=404, detail="Scholarship not found")
+    return None
+
+
 @router.get("/{scholarship_id}", response_model=ScholarshipResponse)
-async def get_scholarship(scholarship_id: int, db: AsyncSession = Depends(get_db)):
+async def get_scholarship(
+    scholarship_id: int, db: AsyncSession = Depends(get_async_read_db)
+):
     """
     Get a single scholarship by ID.
     PUBLIC endpoint - no authentication required.
     """
-    query = select(Scholarship).where(Scholarship.id == scholarship_id)
-    result = await db.execute(query)
-    scholarship = result.scalar_one_or_none()
+    scholarship = await CatalogReadRepository(db).scholarship(scholarship_id)
 
     if not scholarship:
         raise HTTPException(status_code=404, detail="Scholarship not found")
@@ -41,7 +290,15 @@ async def get_scholarships(
     page: int = Query(1, ge=1, description="Page number (1-indexed)"),
     limit: int = Query(48, ge=1, le=100, description="Items per page"),
     active_only: bool = Query(True, description="Only show active scholarships"),
-    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page (keyset mode)"
+    ),
+    count: str = Query(
+        "exact",
+        pattern="^(exact|estimate)$",
+        description="How to compute total: exact or planner estimate",
+    ),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """
     Get paginated scholarships.
@@ -51,47 +308,74 @@ async def get_scholarships(
     - page: Page number (default: 1)
     - limit: Items per page (default: 48, max: 100)
     - active_only: Filter to only active scholarships (default: true)
+    - cursor: Opaque next_cursor from a previous response. When given, the
+      page is read with keyset pagination (no OFFSET, no COUNT) and
+      total/page/total_pages are null.
+    - count: "exact" (cached COUNT) or "estimate" (planner row estimate for
+      broad filters; total_estimated is true when one was used)
     """
-    try:
-        # Calculate offset from page number
-        offset = (page - 1) * limit
+    cursor_values = None
+    if cursor:
+        try:
+            cursor_values = decode_sort_values(cursor, LISTING_KEYS)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
 
-        # Build base query
-        query = select(Scholarship)
+    try:
+        # Build base query (Core rows of the response columns, no ORM objects)
+        query = select(*SCHOLARSHIP_COLUMNS)
 
         # FIXED: Use 'status' field instead of 'is_active'
         if active_only:
             query = query.where(Scholarship.status == ScholarshipStatus.ACTIVE)
 
-        # Get total count for pagination
-        count_query = select(func.count()).select_from(Scholarship)
-        if active_only:
-            count_query = count_query.where(
-                Scholarship.status == ScholarshipStatus.ACTIVE
-            )
+        # Sort by title; id breaks ties so the order (and cursors) are stable
+        query = query.order_by(Scholarship.title, Scholarship.id)
+
+        if cursor_values:
+            # Rows after (title, id), seeking on the (status, title, id) index
+            query = query.where(keyset_after(LISTING_KEYS, cursor_values))
 
-        total_result = await db.execute(count_query)
-        total = total_result.scalar()  # FIXED: Use scalar() for single value
+            # Fetch one extra row to know if there is a next page
+            result = await db.execute(query.limit(limit + 1))
+            scholarships = result.all()
+            has_more = len(scholarships) > limit
+            scholarships = scholarships[:limit]
+            total = page = total_pages = None
+            total_estimated = False
+        else:
+            # Calculate offset from page number
+            offset = (page - 1) * limit
+
+            # Total for pagination metadata (cached per filter set)
+            total, total_estimated = await listing_total(
+                db, "scholarships", {"active_only": active_only}, query, count
+            )
 
-        # Sort by title
-        query = query.order_by(Scholarship.title)
+            # Apply pagination
+            query = query.limit(limit).offset(offset)
 
-        # Apply pagination
-        query = query.limit(limit).offset(offset)
+            result = await db.execute(query)
+            scholarships = result.all()
 
-        result = await db.execute(query)
-        scholarships = result.scalars().all()  # Use scalars() for list of objects
+            # Calculate pagination metadata
+            total_pages = (total + limit - 1) // limit  # Ceiling division
+            has_more = page < total_pages
 
-        # Calculate pagination metadata
-        total_pages = (total + limit - 1) // limit  # Ceiling division
+        next_cursor = None
+        if has_more and scholarships:
+            last = scholarships[-1]
+            next_cursor = encode_cursor({"k": [last.title, last.id]})
 
         return {
-            "items": [ScholarshipResponse.model_validate(sch) for sch in scholarships],
+            "items": [dict(row._mapping) for row in scholarships],
             "total": total,
+            "total_estimated": total_estimated,
             "page": page,
             "limit": limit,
             "total_pages": total_pages,
-            "has_more": page < total_pages,
+            "has_more": has_more,
+            "next_cursor": next_cursor,
         }
 
     except Exception as e:
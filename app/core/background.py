@@ -0,0 +1,82 @@
+# app/core/background.py
+"""
+Minimal periodic background tasks running on the app's event loop.
+Registered tasks are started on app startup and cancelled on shutdown.
+"""
+
+import asyncio
+import inspect
+import logging
+from typing import Awaitable, Callable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """
+    Runs `func` every `interval` seconds.
+    Sync functions run in a worker thread so they never block the loop.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        interval: float,
+        func: Callable[[], Union[None, Awaitable[None]]],
+    ):
+        self.name = name
+        self.interval = interval
+        self.func = func
+        self._task: Optional[asyncio.Task] = None
+
+    async def run_once(self) -> None:
+        if inspect.iscoroutinefunction(self.func):
+            await self.func()
+        else:
+            await asyncio.to_thread(self.func)
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Background task {self.name} failed: {str(e)}")
+
+    def start(self) -> None:
+        if self.interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._loop(), name=self.name)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+periodic_tasks: List[PeriodicTask] = []
+
+
+def register_periodic_task(
+    name: str, interval: float, func: Callable[[], Union[None, Awaitable[None]]]
+) -> PeriodicTask:
+    """Register a task to be started with the app"""
+    task = PeriodicTask(name, interval, func)
+    periodic_tasks.append(task)
+    return task
+
+
+def start_periodic_tasks() -> None:
+    for task in periodic_tasks:
+        task.start()
+
+
+async def stop_periodic_tasks() -> None:
+    for task in periodic_tasks:
+        await task.stop()
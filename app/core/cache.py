@@ -0,0 +1,252 @@
+# app/core/cache.py
+"""
+In-process caches for public catalog reads.
+
+Entries are keyed by (namespace, ...) tuples. A namespace is the catalog
+table a value was computed from, so a committed ORM write to that table
+drops every entry built from it. The TTL bounds staleness for writes made
+outside this process (other workers, Abacadaba, import scripts).
+
+RedisTTLCache shares entries between workers through Redis and falls back
+to an in-process TTLCache when Redis is not installed or unreachable.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Protocol, Tuple, TypeVar
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+try:
+    import redis
+except ImportError:  # Optional - RedisTTLCache falls back to in-process
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# Tables whose writes invalidate cached catalog reads
+CATALOG_NAMESPACES = {"institutions", "scholarships", "entity_images"}
+
+# Counters that change on every view and never affect listings or totals
+IGNORED_COLUMNS = {"views_count", "applications_count", "updated_at"}
+
+
+class TTLCache:
+    """Small thread-safe TTL cache with per-namespace invalidation"""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[Hashable, ...], Tuple[float, Any]] = {}
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Tuple[Hashable, ...], value: Any) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            if len(self._entries) >= self.max_entries and key not in self._entries:
+                # Drop the entry closest to expiry to make room
+                oldest = min(self._entries, key=lambda k: self._entries[k][0])
+                del self._entries[oldest]
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def invalidate(self, namespace: str) -> None:
+        """Drop every entry whose key starts with `namespace`"""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == namespace]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisTTLCache:
+    """
+    TTLCache-compatible cache stored in Redis, shared by every worker.
+
+    Keys include a per-namespace generation number, so invalidating a
+    namespace is a single INCR and stale entries simply expire. Values must
+    be JSON-serializable. While Redis is unavailable, reads and writes go
+    to an in-process TTLCache and Redis is retried every RETRY_SECONDS.
+    """
+
+    RETRY_SECONDS = 30
+
+    def __init__(
+        self,
+        url: str,
+        ttl_seconds: float,
+        prefix: str,
+        password: Optional[str] = None,
+        max_local_entries: int = 1024,
+    ):
+        self.url = url
+        self.password = password or None
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+        self.local = TTLCache(ttl_seconds, max_local_entries)
+        self._client = None
+        self._down_until = 0.0
+
+    def _redis(self):
+        """Redis client, or None while Redis is absent or marked down"""
+        if redis is None or not self.url or time.monotonic() < self._down_until:
+            return None
+        if self._client is None:
+            self._client = redis.Redis.from_url(
+                self.url,
+                password=self.password,
+                socket_connect_timeout=0.25,
+                socket_timeout=0.25,
+            )
+        return self._client
+
+    def _mark_down(self, error: Exception) -> None:
+        logger.warning(
+            f"Redis cache unavailable ({error}); using in-process cache for "
+            f"{self.RETRY_SECONDS}s"
+        )
+        self._down_until = time.monotonic() + self.RETRY_SECONDS
+
+    def _generation_key(self, namespace: str) -> str:
+        return f"{self.prefix}:gen:{namespace}"
+
+    def _entry_key(self, client, key: Tuple[Hashable, ...]) -> str:
+        namespace = key[0]
+        generation = int(client.get(self._generation_key(namespace)) or 0)
+        digest = hashlib.sha1(
+            json.dumps(key, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return f"{self.prefix}:{namespace}:{generation}:{digest}"
+
+    def get(self, key: Tuple[Hashable, ...]) -> Optional[Any]:
+        client = self._redis()
+        if client is None:
+            return self.local.get(key)
+        try:
+            raw = client.get(self._entry_key(client, key))
+        except redis.RedisError as e:
+            self._mark_down(e)
+            return self.local.get(key)
+        return None if raw is None else json.loads(raw)
+
+    def set(self, key: Tuple[Hashable, ...], value: Any) -> None:
+        if self.ttl_seconds <= 0:
+            return
+        client = self._redis()
+        if client is None:
+            self.local.set(key, value)
+            return
+        try:
+            client.set(
+                self._entry_key(client, key),
+                json.dumps(value, default=str),
+                ex=max(1, int(self.ttl_seconds)),
+            )
+        except redis.RedisError as e:
+            self._mark_down(e)
+            self.local.set(key, value)
+
+    def invalidate(self, namespace: str) -> None:
+        self.local.invalidate(namespace)
+        client = self._redis()
+        if client is None:
+            return
+        try:
+            client.incr(self._generation_key(namespace))
+        except redis.RedisError as e:
+            self._mark_down(e)
+
+    def clear(self) -> None:
+        self.local.clear()
+        client = self._redis()
+        if client is None:
+            return
+        try:
+            for key in client.scan_iter(match=f"{self.prefix}:*"):
+                client.delete(key)
+        except redis.RedisError as e:
+            self._mark_down(e)
+
+
+class CacheBackend(Protocol):
+    """Anything holding catalog-derived state that writes must invalidate"""
+
+    def invalidate(self, namespace: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+CacheT = TypeVar("CacheT", bound=CacheBackend)
+
+_caches = []
+
+
+def register_cache(cache: CacheT) -> CacheT:
+    """Track a cache so catalog writes invalidate it"""
+    _caches.append(cache)
+    return cache
+
+
+def invalidate_namespace(namespace: str) -> None:
+    """Invalidate one catalog namespace in every registered cache"""
+    for cache in _caches:
+        cache.invalidate(namespace)
+
+
+def clear_caches() -> None:
+    for cache in _caches:
+        cache.clear()
+
+
+# ===========================
+# ORM WRITE INVALIDATION
+# ===========================
+
+
+def _changes_catalog_data(obj) -> bool:
+    return any(
+        attr.history.has_changes()
+        for attr in inspect(obj).attrs
+        if attr.key not in IGNORED_COLUMNS
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_catalog_writes(session, flush_context):
+    touched = session.info.setdefault("catalog_writes", set())
+    for obj in list(session.new) + list(session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table in CATALOG_NAMESPACES:
+            touched.add(table)
+    for obj in session.dirty:
+        table = getattr(obj, "__tablename__", None)
+        if table in CATALOG_NAMESPACES and _changes_catalog_data(obj):
+            touched.add(table)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_catalog_writes(session):
+    for namespace in session.info.pop("catalog_writes", ()):
+        invalidate_namespace(namespace)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_catalog_writes(session, previous_transaction):
+    session.info.pop("catalog_writes", None)
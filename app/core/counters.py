@@ -0,0 +1,224 @@
+# app/core/counters.py
+"""
+Write-behind counters for hot, non-critical columns (e.g. views_count).
+
+Increments are buffered in Redis (shared by workers) or in process when
+Redis is unavailable, and a periodic flush applies them in batches with
+one UPDATE ... FROM (VALUES ...) per chunk. One worker at a time flushes
+the Redis buffer (flush lock); its increments stay in Redis until they
+are applied.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import Integer, Table, column, update, values
+from sqlalchemy.orm import Session
+
+from app.core.cache import redis
+
+logger = logging.getLogger(__name__)
+
+# Atomically add every field of KEYS[1] into KEYS[2], delete KEYS[1] and
+# return KEYS[2] (flat field/value list). Increments arriving meanwhile
+# land in a fresh KEYS[1].
+CLAIM_SCRIPT = """
+local moved = redis.call('HGETALL', KEYS[1])
+for i = 1, #moved, 2 do
+    redis.call('HINCRBY', KEYS[2], moved[i], moved[i + 1])
+end
+redis.call('DEL', KEYS[1])
+return redis.call('HGETALL', KEYS[2])
+"""
+
+# Delete the lock KEYS[1] only if it still holds our token ARGV[1]
+UNLOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class BufferedCounter:
+    """
+    Buffered `table.<column> += n` increments keyed by row id.
+
+    increment() never touches the database. flush() drains the buffer and
+    applies it; rows that no longer exist are skipped by the join.
+    """
+
+    RETRY_SECONDS = 30
+    # A worker that dies mid-flush releases the flush lock after this long
+    FLUSH_LOCK_SECONDS = 300
+
+    def __init__(
+        self,
+        table: Table,
+        column_name: str,
+        redis_url: str = "",
+        redis_password: Optional[str] = None,
+        batch_size: int = 1000,
+    ):
+        self.table = table
+        self.column_name = column_name
+        self.batch_size = batch_size
+        self.redis_url = redis_url
+        self.redis_password = redis_password or None
+        self.redis_key = f"ms:counter:{table.name}:{column_name}"
+        # Shared increments being flushed, kept until applied (_claim_shared)
+        self.flushing_key = f"{self.redis_key}:flushing"
+        self.lock_key = f"{self.redis_key}:flush-lock"
+        self._lock = threading.Lock()
+        self._pending: Counter = Counter()
+        self._client = None
+        self._down_until = 0.0
+
+    def _redis(self):
+        """Redis client, or None while Redis is absent or marked down"""
+        if (
+            redis is None
+            or not self.redis_url
+            or time.monotonic() < self._down_until
+        ):
+            return None
+        if self._client is None:
+            self._client = redis.Redis.from_url(
+                self.redis_url,
+                password=self.redis_password,
+                socket_connect_timeout=0.25,
+                socket_timeout=0.25,
+            )
+        return self._client
+
+    def _mark_down(self, error: Exception) -> None:
+        logger.warning(
+            f"Redis counter unavailable ({error}); buffering "
+            f"{self.table.name}.{self.column_name} in process"
+        )
+        self._down_until = time.monotonic() + self.RETRY_SECONDS
+
+    def increment(self, row_id: int, amount: int = 1) -> None:
+        client = self._redis()
+        if client is not None:
+            try:
+                client.hincrby(self.redis_key, row_id, amount)
+                return
+            except redis.RedisError as e:
+                self._mark_down(e)
+        with self._lock:
+            self._pending[row_id] += amount
+
+    def pending(self) -> Dict[int, int]:
+        """Increments buffered in this process (not yet flushed)"""
+        with self._lock:
+            return dict(self._pending)
+
+    def clear(self) -> None:
+        """Drop the increments buffered in this process (tests)"""
+        self._drain_local()
+
+    def _drain_local(self) -> Counter:
+        with self._lock:
+            deltas, self._pending = self._pending, Counter()
+        return deltas
+
+    def _claim_shared(self) -> Tuple[Counter, Optional[str]]:
+        """
+        Under the flush lock, move the shared Redis hash into the flushing
+        hash and return its contents with the lock token. The flushing hash
+        is deleted only once its increments are applied, so after a failed
+        read or flush (or a worker dying mid-flush) they stay there and are
+        merged into the next flush. Returns no increments while another
+        worker holds the lock.
+        """
+        client = self._redis()
+        if client is None:
+            return Counter(), None
+        token = uuid.uuid4().hex
+        try:
+            if not client.set(
+                self.lock_key, token, nx=True, ex=self.FLUSH_LOCK_SECONDS
+            ):
+                return Counter(), None
+            flat = client.eval(CLAIM_SCRIPT, 2, self.redis_key, self.flushing_key)
+        except redis.RedisError as e:
+            self._mark_down(e)
+            return Counter(), None
+        shared = Counter(
+            {int(row_id): int(amount) for row_id, amount in zip(flat[::2], flat[1::2])}
+        )
+        return shared, token
+
+    def _release_shared(self) -> None:
+        """Drop the flushing hash once its increments are applied"""
+        client = self._redis()
+        if client is None:
+            raise RuntimeError("Redis unavailable; flushing hash kept for retry")
+        client.delete(self.flushing_key)
+
+    def _unlock(self, token: str) -> None:
+        client = self._redis()
+        if client is None:
+            return  # Expires on its own
+        try:
+            client.eval(UNLOCK_SCRIPT, 1, self.lock_key, token)
+        except redis.RedisError as e:
+            self._mark_down(e)
+
+    def flush(self, db: Session) -> int:
+        """
+        Apply buffered increments; returns the number of rows updated.
+        On failure the increments are kept for the next flush.
+        """
+        local = self._drain_local()
+        shared, token = self._claim_shared()
+        try:
+            return self._apply(db, local, shared)
+        finally:
+            if token:
+                self._unlock(token)
+
+    def _apply(self, db: Session, local: Counter, shared: Counter) -> int:
+        deltas = local.copy()
+        deltas.update(shared)
+        deltas = {row_id: amount for row_id, amount in deltas.items() if amount}
+        if not deltas:
+            if shared:
+                self._release_shared()
+            return 0
+
+        items = sorted(deltas.items())
+        updated = 0
+        target = self.table.c[self.column_name]
+        released = False
+        try:
+            for start in range(0, len(items), self.batch_size):
+                batch = values(
+                    column("id", Integer), column("delta", Integer), name="v"
+                ).data(items[start : start + self.batch_size])
+                stmt = (
+                    update(self.table)
+                    .where(self.table.c.id == batch.c.id)
+                    .values({target: target + batch.c.delta})
+                )
+                updated += db.execute(stmt).rowcount
+            if shared:
+                # Released before the commit: a failed commit re-buffers the
+                # increments below, a failed release leaves them in Redis
+                self._release_shared()
+                released = True
+            db.commit()
+        except Exception:
+            db.rollback()
+            with self._lock:
+                self._pending.update(local)
+                if released:
+                    self._pending.update(shared)
+            raise
+
+        return updated
@@ -1,18 +1,108 @@
-# app/core/database.py - SYNC VERSION
-from typing import Generator
+# app/core/database.py - SYNC + ASYNC VERSION
+from typing import AsyncGenerator, Generator
+from fastapi import Request
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
 from app.core.config import settings
+from app.core.db_pool import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    expire_idle_connections,
+    register_engine,
+    registered_engines,
+    set_statement_timeout,
+)
+from app.core.query_stats import instrument_engine
 
 # Remove +asyncpg from the URL
 DATABASE_URL = settings.DATABASE_URL.replace("+asyncpg", "")
 
-# Create sync engine
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+
+def build_async_url(url: str) -> str:
+    """
+    Convert a plain/psycopg2 Postgres URL into an asyncpg URL.
+    asyncpg does not understand libpq's `sslmode`, so it is passed as `ssl`.
+    """
+    parsed = make_url(url).set(drivername="postgresql+asyncpg")
+    query = dict(parsed.query)
+    if "sslmode" in query:
+        query["ssl"] = query.pop("sslmode")
+    return parsed.set(query=query).render_as_string(hide_password=False)
+
+
+ASYNC_DATABASE_URL = build_async_url(DATABASE_URL)
+
+# Pool sizing comes from settings so several workers fit under max_connections.
+# Pre-ping is off by default; the background liveness check and idle
+# connection expiry replace it.
+POOL_OPTIONS = {
+    "pool_size": settings.DB_POOL_SIZE,
+    "max_overflow": settings.DB_MAX_OVERFLOW,
+    "pool_recycle": settings.DB_POOL_RECYCLE,
+    "pool_timeout": settings.DB_POOL_TIMEOUT,
+    "pool_pre_ping": settings.DB_POOL_PRE_PING,
+}
+
+# Create sync engine (auth, profiles, tracking - anything that writes)
+engine = create_engine(DATABASE_URL, poolclass=InstrumentedQueuePool, **POOL_OPTIONS)
+set_statement_timeout(engine, settings.DB_STATEMENT_TIMEOUT_MS)
+register_engine("primary", engine)
 
 # Create sync session maker
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Create async engine (public catalog reads - institutions, scholarships, gallery)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL, poolclass=InstrumentedAsyncQueuePool, **POOL_OPTIONS
+)
+set_statement_timeout(async_engine, settings.DB_PUBLIC_STATEMENT_TIMEOUT_MS)
+register_engine("catalog", async_engine)
+
+# Create async session maker
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+# Read replica engines - fall back to the primary engines when not configured
+if settings.DATABASE_REPLICA_URL:
+    REPLICA_DATABASE_URL = settings.DATABASE_REPLICA_URL.replace("+asyncpg", "")
+
+    replica_engine = create_engine(
+        REPLICA_DATABASE_URL, poolclass=InstrumentedQueuePool, **POOL_OPTIONS
+    )
+    set_statement_timeout(replica_engine, settings.DB_STATEMENT_TIMEOUT_MS)
+    register_engine("replica", replica_engine)
+
+    async_replica_engine = create_async_engine(
+        build_async_url(REPLICA_DATABASE_URL),
+        poolclass=InstrumentedAsyncQueuePool,
+        **POOL_OPTIONS,
+    )
+    set_statement_timeout(
+        async_replica_engine, settings.DB_PUBLIC_STATEMENT_TIMEOUT_MS
+    )
+    register_engine("catalog-replica", async_replica_engine)
+else:
+    replica_engine = engine
+    async_replica_engine = async_engine
+
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+AsyncReadSessionLocal = async_sessionmaker(
+    bind=async_replica_engine, autoflush=False, expire_on_commit=False
+)
+
+# Per-request query counting on every engine. Without pre-ping, connections
+# idle for longer than a liveness interval are replaced on checkout.
+for _engine in registered_engines().values():
+    instrument_engine(_engine)
+    if not settings.DB_POOL_PRE_PING:
+        expire_idle_connections(_engine, settings.DB_LIVENESS_INTERVAL_SECONDS)
+
+# Cookie set after a user's write; while present, reads go to the primary
+RECENT_WRITE_COOKIE = "ms_recent_write"
+
 # Base class for models
 Base = declarative_base()
 
@@ -27,3 +117,42 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for getting async database sessions (asyncpg).
+    Use from `async def` routes so queries don't block the event loop.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def read_from_primary(request: Request) -> bool:
+    """True while the caller is inside their read-your-writes window"""
+    return RECENT_WRITE_COOKIE in request.cookies
+
+
+def get_read_db(request: Request) -> Generator[Session, None, None]:
+    """
+    Dependency for read-only sync sessions (replica when configured).
+    Never write through this session.
+    """
+    session_factory = SessionLocal if read_from_primary(request) else ReadSessionLocal
+    db = session_factory()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency for read-only async sessions (replica when configured).
+    Used by the public catalog routes.
+    """
+    session_factory = (
+        AsyncSessionLocal if read_from_primary(request) else AsyncReadSessionLocal
+    )
+    async with session_factory() as db:
+        yield db
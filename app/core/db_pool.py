@@ -0,0 +1,213 @@
+# app/core/db_pool.py
+"""
+Connection pool instrumentation and liveness checking.
+
+- Instrumented pool classes record checkout counts and wait times
+- A background liveness check and idle-connection expiry replace
+  per-checkout pre-ping
+- pool_status() feeds the /health/db endpoint
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Union
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+logger = logging.getLogger(__name__)
+
+
+class PoolStats:
+    """Thread-safe checkout counters for one pool"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_ms_total = 0.0
+        self.wait_ms_max = 0.0
+
+    def record(self, wait_ms: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_ms_total += wait_ms
+            self.wait_ms_max = max(self.wait_ms_max, wait_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            attempts = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_ms_total": round(self.wait_ms_total, 2),
+                "wait_ms_avg": round(self.wait_ms_total / attempts, 3)
+                if attempts
+                else 0.0,
+                "wait_ms_max": round(self.wait_ms_max, 2),
+            }
+
+
+class _InstrumentedPoolMixin:
+    """Times every checkout from the underlying QueuePool"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.record((time.perf_counter() - started) * 1000, timed_out=True)
+            raise
+        self.stats.record((time.perf_counter() - started) * 1000)
+        return record
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """QueuePool for sync engines"""
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    """QueuePool for asyncio engines"""
+
+
+# ===========================
+# STATEMENT TIMEOUTS
+# ===========================
+
+
+def set_statement_timeout(engine: Union[Engine, AsyncEngine], timeout_ms: int) -> None:
+    """
+    Apply statement_timeout to every new connection of an engine.
+    This is a session-level SET on connect, so it needs a direct connection
+    or PgBouncer in session pooling. With transaction pooling the setting
+    stays on whichever server connection received it; set the timeout on
+    the database role instead.
+    """
+    if not timeout_ms:
+        return
+
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+
+    @event.listens_for(sync_engine, "connect", insert=True)
+    def _set_timeout(dbapi_connection, connection_record):
+        # Autocommit so the pool's rollback-on-return can't undo the SET
+        existing_autocommit = dbapi_connection.autocommit
+        dbapi_connection.autocommit = True
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"SET SESSION statement_timeout = {int(timeout_ms)}")
+        cursor.close()
+        dbapi_connection.autocommit = existing_autocommit
+
+
+def expire_idle_connections(
+    engine: Union[Engine, AsyncEngine], max_idle_seconds: int
+) -> None:
+    """
+    Replace pooled connections idle for longer than `max_idle_seconds` when
+    they are checked out. The liveness check only pings one connection per
+    pool; this covers connections dropped one at a time (firewall or
+    PgBouncer idle timeouts) without a ping on every checkout.
+    """
+    if not max_idle_seconds:
+        return
+
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+
+    @event.listens_for(sync_engine, "checkin")
+    def _checked_in(dbapi_connection, connection_record):
+        connection_record.info["checked_in_at"] = time.monotonic()
+
+    @event.listens_for(sync_engine, "checkout")
+    def _check_idle(dbapi_connection, connection_record, connection_proxy):
+        checked_in_at = connection_record.info.pop("checked_in_at", None)
+        if checked_in_at is None:
+            return
+        idle = time.monotonic() - checked_in_at
+        if idle > max_idle_seconds:
+            # The pool invalidates the connection and checks out a fresh one
+            raise exc.DisconnectionError(f"Connection idle for {idle:.0f}s")
+
+
+# ===========================
+# ENGINE REGISTRY + LIVENESS
+# ===========================
+
+_engines: Dict[str, Union[Engine, AsyncEngine]] = {}
+_liveness: Dict[str, Dict[str, Any]] = {}
+
+
+def register_engine(name: str, engine: Union[Engine, AsyncEngine]) -> None:
+    """Track an engine for liveness checks and pool telemetry"""
+    _engines[name] = engine
+    _liveness[name] = {"healthy": None, "last_checked": None, "error": None}
+
+
+def registered_engines() -> Dict[str, Union[Engine, AsyncEngine]]:
+    return dict(_engines)
+
+
+async def dispose_engines() -> None:
+    """Close the pools of every registered engine (shutdown)"""
+    for engine in _engines.values():
+        if isinstance(engine, AsyncEngine):
+            await engine.dispose()
+        else:
+            await asyncio.to_thread(engine.dispose)
+
+
+def _ping_sync(engine: Engine) -> None:
+    with engine.connect() as conn:
+        conn.exec_driver_sql("SELECT 1")
+
+
+async def check_liveness() -> None:
+    """
+    Ping every registered engine once.
+    A disconnect error makes SQLAlchemy invalidate the whole pool, so stale
+    connections are replaced on their next checkout instead of failing a request.
+    The ping only reaches one connection; expire_idle_connections() handles
+    connections that are dropped individually.
+    """
+    for name, engine in _engines.items():
+        try:
+            if isinstance(engine, AsyncEngine):
+                async with engine.connect() as conn:
+                    await conn.exec_driver_sql("SELECT 1")
+            else:
+                await asyncio.to_thread(_ping_sync, engine)
+            _liveness[name].update(healthy=True, error=None)
+        except Exception as e:
+            logger.warning(f"Database liveness check failed for {name}: {str(e)}")
+            _liveness[name].update(healthy=False, error=str(e))
+        _liveness[name]["last_checked"] = datetime.now(timezone.utc).isoformat()
+
+
+def pool_status(name: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """Current pool gauges, checkout counters and liveness per engine"""
+    status = {}
+    for engine_name, engine in _engines.items():
+        if name and engine_name != name:
+            continue
+        pool = engine.pool
+        stats = pool.stats.snapshot() if hasattr(pool, "stats") else {}
+        status[engine_name] = {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            **stats,
+            "liveness": dict(_liveness[engine_name]),
+        }
+    return status
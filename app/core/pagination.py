@@ -0,0 +1,196 @@
+# app/core/pagination.py
+"""
+Pagination helpers for catalog listings.
+
+- Opaque cursors for keyset (cursor) pagination: the sort key of the last
+  row on a page, JSON-encoded and base64url'd, read back with
+  decode_sort_values() and turned into a predicate by keyset_after()
+- Listing totals: exact COUNT(*) results cached per normalized filter set,
+  or planner row estimates for broad filters (count=estimate)
+"""
+
+import base64
+import json
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, func, or_, select, text
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from app.core.cache import TTLCache, register_cache
+from app.core.config import settings
+
+
+def encode_cursor(values: Dict[str, Any]) -> str:
+    """Encode the last row's sort key values into an opaque cursor"""
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+    Raises ValueError for anything that isn't a valid cursor.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(values, dict):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def decode_sort_values(cursor: str, keys: Sequence[Tuple[Any, bool]]) -> List[Any]:
+    """
+    The sort key values of a cursor produced by encode_cursor({"k": values})
+    for ORDER BY `keys`, typed for their columns (JSON round trip: strings
+    and ints must arrive as such, Decimals etc. are restored).
+    Raises ValueError for anything that doesn't fit the sort.
+    """
+    values = decode_cursor(cursor).get("k")
+    if not isinstance(values, list) or len(values) != len(keys):
+        raise ValueError("Cursor does not match the sort")
+
+    typed = []
+    for (column, _), value in zip(keys, values):
+        python_type = column.type.python_type
+        if python_type in (str, int):
+            if not isinstance(value, python_type) or isinstance(value, bool):
+                raise ValueError("Cursor does not match the sort")
+            typed.append(value)
+            continue
+        try:
+            typed.append(python_type(value))
+        except (TypeError, ArithmeticError):
+            raise ValueError("Cursor does not match the sort")
+    return typed
+
+
+def keyset_after(keys: Sequence[Tuple[Any, bool]], values: Sequence[Any]):
+    """
+    WHERE clause for the rows after `values` in ORDER BY `keys`, given as
+    (column, descending) pairs (columns must be NOT NULL). Directions may
+    be mixed; the leading column also gets a plain bound so Postgres can
+    start the index scan at the cursor.
+    """
+
+    def past(column, descending, value):
+        return column < value if descending else column > value
+
+    branches = []
+    for position, (column, descending) in enumerate(keys):
+        equal = [c == v for (c, _), v in zip(keys[:position], values)]
+        branches.append(and_(*equal, past(column, descending, values[position])))
+
+    first, descending = keys[0]
+    bound = first <= values[0] if descending else first >= values[0]
+    return and_(bound, or_(*branches))
+
+
+# ===========================
+# LISTING TOTALS
+# ===========================
+
+count_cache = register_cache(TTLCache(settings.COUNT_CACHE_TTL_SECONDS))
+
+
+def count_cache_key(
+    namespace: str, filters: Dict[str, Any], mode: str
+) -> Tuple[Hashable, ...]:
+    """
+    Cache key for a listing total. Unset filters are dropped and values are
+    stringified so equivalent filter sets share one entry.
+    """
+    normalized = tuple(
+        sorted(
+            (name, str(value).strip())
+            for name, value in filters.items()
+            if value is not None
+        )
+    )
+    return (namespace, normalized, mode)
+
+
+def exact_count_query(query: Select) -> Select:
+    return select(func.count()).select_from(query.order_by(None).subquery())
+
+
+def explain_query(query: Select):
+    """
+    EXPLAIN for a listing query with its filter values inlined.
+    Colons are escaped so text() doesn't read literals as bind params.
+    """
+    compiled = query.order_by(None).compile(
+        dialect=asyncpg.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    return text("EXPLAIN (FORMAT JSON) " + str(compiled).replace(":", "\\:"))
+
+
+def plan_rows(plan: Any) -> int:
+    """Top-level row estimate from EXPLAIN (FORMAT JSON) output"""
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def _lookup(namespace: str, filters: Dict[str, Any], mode: str) -> Optional[tuple]:
+    # An exact total can answer an estimate request, never the reverse
+    cached = count_cache.get(count_cache_key(namespace, filters, "exact"))
+    if cached is None and mode == "estimate":
+        cached = count_cache.get(count_cache_key(namespace, filters, "estimate"))
+    return cached
+
+
+def _store(namespace: str, filters: Dict[str, Any], total: int, estimated: bool):
+    mode = "estimate" if estimated else "exact"
+    count_cache.set(count_cache_key(namespace, filters, mode), (total, estimated))
+    return total, estimated
+
+
+async def listing_total(
+    db, namespace: str, filters: Dict[str, Any], query: Select, mode: str = "exact"
+) -> Tuple[int, bool]:
+    """
+    Total rows for a listing query as (total, is_estimate).
+
+    With mode="estimate" the planner's row estimate is used when it is large
+    enough that an approximate total is fine for pagination; small results
+    are still counted exactly.
+    """
+    cached = _lookup(namespace, filters, mode)
+    if cached is not None:
+        return cached
+
+    if mode == "estimate":
+        result = await db.execute(explain_query(query))
+        estimate = plan_rows(result.scalar())
+        if estimate >= settings.COUNT_ESTIMATE_EXACT_BELOW:
+            return _store(namespace, filters, estimate, True)
+
+    result = await db.execute(exact_count_query(query))
+    return _store(namespace, filters, result.scalar(), False)
+
+
+def listing_total_sync(
+    db: Session,
+    namespace: str,
+    filters: Dict[str, Any],
+    query: Select,
+    mode: str = "exact",
+) -> Tuple[int, bool]:
+    """listing_total for sync sessions (services)"""
+    cached = _lookup(namespace, filters, mode)
+    if cached is not None:
+        return cached
+
+    if mode == "estimate":
+        estimate = plan_rows(db.execute(explain_query(query)).scalar())
+        if estimate >= settings.COUNT_ESTIMATE_EXACT_BELOW:
+            return _store(namespace, filters, estimate, True)
+
+    total = db.execute(exact_count_query(query)).scalar()
+    return _store(namespace, filters, total, False)
@@ -0,0 +1,90 @@
+# app/core/query_stats.py
+"""
+Per-request SQL query counting, timing and N+1 detection.
+
+Engine event hooks record every statement into the current request's
+QueryStats (held in a ContextVar), and the middleware in main.py turns
+them into X-DB-Queries / X-DB-Time-ms headers and log lines.
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import List, Optional, Tuple, Union
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# Collapse expanded IN lists so "IN (1, 2)" and "IN (1, 2, 3)"
+# count as the same statement shape
+_IN_LIST = re.compile(r"\bIN \((?:[^()]|\([^()]*\))*\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a parameterized statement into a comparable shape"""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    return _IN_LIST.sub("IN (...)", shape)
+
+
+class QueryStats:
+    """Queries issued while serving one request"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated_shapes(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statement shapes run at least `threshold` times (probable N+1)"""
+        return [
+            (shape, count)
+            for shape, count in self.shapes.most_common()
+            if count >= threshold
+        ]
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "query_stats", default=None
+)
+
+
+def start_request_stats() -> QueryStats:
+    """Begin collecting stats for the current request context"""
+    stats = QueryStats()
+    _current_stats.set(stats)
+    return stats
+
+
+def current_request_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_start_time"].pop()
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, (time.perf_counter() - started) * 1000)
+
+
+def instrument_engine(engine: Union[Engine, AsyncEngine]) -> None:
+    """Attach query counting hooks to an engine (idempotent)"""
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    if event.contains(sync_engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
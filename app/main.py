@@ -1,7 +1,18 @@
 # app/main.py
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.core.database import RECENT_WRITE_COOKIE
+from app.core.db_pool import check_liveness, dispose_engines, pool_status
+from app.core.query_stats import start_request_stats
+from app.services.institution_directory import warm_directories
+from app.services.institution_snapshot import refresh_institution_snapshot
+from app.services.scholarship import expire_scholarships, flush_view_counts
+from app.core.background import (
+    register_periodic_task,
+    start_periodic_tasks,
+    stop_periodic_tasks,
+)
 from app.api.v1 import (
     user,
     oauth,
@@ -14,6 +25,11 @@ from app.api.v1 import (
 )
 from fastapi.routing import APIRoute
 from fastapi.responses import PlainTextResponse
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
 
 
 app = FastAPI(
@@ -31,6 +47,63 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+@app.middleware("http")
+async def read_your_writes(request: Request, call_next):
+    """
+    After an authenticated write, pin the caller's reads to the primary
+    for READ_YOUR_WRITES_SECONDS so replica lag can't hide their change.
+    """
+    response = await call_next(request)
+
+    if (
+        settings.DATABASE_REPLICA_URL
+        and settings.READ_YOUR_WRITES_SECONDS
+        and request.method in ("POST", "PUT", "PATCH", "DELETE")
+        and "authorization" in request.headers
+        and response.status_code < 400
+    ):
+        response.set_cookie(
+            RECENT_WRITE_COOKIE,
+            "1",
+            max_age=settings.READ_YOUR_WRITES_SECONDS,
+            httponly=True,
+            samesite="lax",
+        )
+
+    return response
+
+
+@app.middleware("http")
+async def query_stats(request: Request, call_next):
+    """
+    Count queries and DB time per request.
+    Adds X-DB-Queries / X-DB-Time-ms headers and logs probable N+1 patterns.
+    """
+    if not settings.DB_QUERY_STATS_ENABLED:
+        return await call_next(request)
+
+    stats = start_request_stats()
+    started = time.perf_counter()
+    response = await call_next(request)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    response.headers["X-DB-Queries"] = str(stats.count)
+    response.headers["X-DB-Time-ms"] = f"{stats.total_ms:.1f}"
+
+    logger.info(
+        f"{request.method} {request.url.path} -> {response.status_code} "
+        f"in {elapsed_ms:.1f}ms, {stats.count} queries, {stats.total_ms:.1f}ms DB"
+    )
+    for shape, count in stats.repeated_shapes(settings.DB_N_PLUS_ONE_THRESHOLD):
+        logger.warning(
+            f"Probable N+1 on {request.method} {request.url.path}: "
+            f"{count}x {shape[:200]}"
+        )
+
+    return response
+
+
 # Include routers (only the ones that exist)
 app.include_router(user.router, prefix="/api/v1/auth", tags=["Authentication"])
 app.include_router(oauth.router, prefix="/api/v1/oauth", tags=["OAuth"])
@@ -60,6 +133,62 @@ app.include_router(
 )
 
 
+register_periodic_task(
+    "db-liveness", settings.DB_LIVENESS_INTERVAL_SECONDS, check_liveness
+)
+register_periodic_task(
+    "scholarship-view-flush", settings.VIEW_COUNT_FLUSH_SECONDS, flush_view_counts
+)
+register_periodic_task(
+    "scholarship-expiry",
+    settings.SCHOLARSHIP_EXPIRY_SWEEP_SECONDS,
+    expire_scholarships,
+)
+register_periodic_task(
+    "institution-snapshot",
+    settings.INSTITUTION_SNAPSHOT_MAX_AGE_SECONDS,
+    refresh_institution_snapshot,
+)
+
+
+async def warm_caches() -> None:
+    """Prefill per-state institution directories without delaying startup"""
+    try:
+        await asyncio.to_thread(warm_directories)
+    except Exception as e:
+        logger.error(f"Institution directory warm-up failed: {str(e)}")
+
+
+async def warm_institution_snapshot() -> None:
+    """Publish a current snapshot before the first periodic refresh"""
+    try:
+        await asyncio.to_thread(refresh_institution_snapshot)
+    except Exception as e:
+        logger.error(f"Institution snapshot refresh failed: {str(e)}")
+
+
+@app.on_event("startup")
+async def startup():
+    """Start background tasks (DB liveness, ...) and warm caches"""
+    start_periodic_tasks()
+    if settings.INSTITUTION_DIRECTORY_WARM_ON_STARTUP:
+        app.state.warm_caches = asyncio.create_task(warm_caches())
+    if settings.INSTITUTION_SNAPSHOT_MAX_AGE_SECONDS:
+        app.state.warm_snapshot = asyncio.create_task(warm_institution_snapshot())
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Stop background tasks, flush buffered views, close every engine's pool"""
+    await stop_periodic_tasks()
+    if settings.VIEW_COUNT_FLUSH_ON_SHUTDOWN:
+        try:
+            await asyncio.to_thread(flush_view_counts)
+        except Exception as e:
+            logger.error(f"Final view count flush failed: {str(e)}")
+    await dispose_engines()
+
+
 @app.get("/")
 def root():
     """Root endpoint"""
@@ -72,6 +201,16 @@ def health_check():
     return {"status": "healthy", "service": "CampusConnect API"}
 
 
+@app.get("/health/db")
+def database_health():
+    """
+    Connection pool telemetry per engine.
+    Gauges: size, checked_in, checked_out, overflow.
+    Counters: checkouts, timeouts, wait_ms_total/avg/max.
+    """
+    return {"pools": pool_status()}
+
+
 @app.get("/routes-simple", response_class=PlainTextResponse)
 def get_routes_simple():
     """
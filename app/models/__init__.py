@@ -18,6 +18,9 @@ from app.models.scholarship_applications import ScholarshipApplication
 
 from app.models.college_applications import CollegeApplication
 
+# Precomputed per-user scholarship matches
+from app.models.scholarship_matches import UserScholarshipMatch
+
 # CampusConnect images
 
 from app.models.entity_image import EntityImage
@@ -35,5 +38,6 @@ __all__ = [
     "GraduationData",
     "ScholarshipApplication",
     "CollegeApplication",
+    "UserScholarshipMatch",
     "EntityImage",
 ]
@@ -3,7 +3,17 @@ Entity Image model for gallery support.
 READ-ONLY model - images are managed by campusconnect-backend.
 This allows MagicScholar to display gallery images from the unified database.
 """
-from sqlalchemy import Column, Integer, String, Boolean, Text, DateTime, CheckConstraint
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Boolean,
+    Text,
+    DateTime,
+    CheckConstraint,
+    Index,
+    text,
+)
 from sqlalchemy.sql import func
 from app.core.database import Base
 
@@ -33,6 +43,24 @@ class EntityImage(Base):
             "entity_type IN ('institution', 'scholarship')",
             name="check_entity_type"
         ),
+        # Galleries: one entity's images in display order (single and batch
+        # reads, see app.services.catalog_reads)
+        Index(
+            "ix_entity_images_entity_order",
+            entity_type,
+            entity_id,
+            display_order,
+            created_at,
+        ),
+        # Featured lookups only touch the (few) featured rows
+        Index(
+            "ix_entity_images_featured",
+            entity_type,
+            entity_id,
+            display_order,
+            created_at,
+            postgresql_where=text("is_featured"),
+        ),
     )
 
     def __repr__(self):
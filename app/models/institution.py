@@ -13,6 +13,8 @@ from sqlalchemy import (
     Enum as SQLEnum,
     Boolean,
     SmallInteger,
+    Index,
+    Computed,
     text,
 )
 from sqlalchemy.orm import relationship
@@ -21,6 +23,23 @@ from app.core.database import Base
 from enum import Enum
 
 
+# Room and board: the combined figure when reported, else room + board
+HOUSING_COST_SQL = (
+    "coalesce(room_and_board, coalesce(room_cost, 0) + coalesce(board_cost, 0))"
+)
+
+# Total cost of attendance (tuition + housing); NULL without any tuition.
+# Private institutions report one tuition, used for both residencies.
+COST_IN_STATE_SQL = (
+    "coalesce(tuition_in_state, tuition_private, tuition_out_of_state) + "
+    + HOUSING_COST_SQL
+)
+COST_OUT_OF_STATE_SQL = (
+    "coalesce(tuition_out_of_state, tuition_private, tuition_in_state) + "
+    + HOUSING_COST_SQL
+)
+
+
 class ControlType(str, Enum):
     """Institution control types"""
 
@@ -97,6 +116,15 @@ class Institution(Base):
     board_cost = Column(Numeric(10, 2), nullable=True)
     room_and_board = Column(Numeric(10, 2), nullable=True)
 
+    # Generated by Postgres from the columns above, so every write path
+    # (ORM, bulk loads, raw SQL) keeps them current
+    cost_in_state = Column(
+        Numeric(10, 2), Computed(COST_IN_STATE_SQL, persisted=True), nullable=True
+    )
+    cost_out_of_state = Column(
+        Numeric(10, 2), Computed(COST_OUT_OF_STATE_SQL, persisted=True), nullable=True
+    )
+
     application_fee_undergrad = Column(Numeric(10, 2), nullable=True)
     application_fee_grad = Column(Numeric(10, 2), nullable=True)
 
@@ -158,6 +186,87 @@ class Institution(Base):
         DateTime, server_default=func.now(), onupdate=func.now(), nullable=False
     )
 
+    # ===========================
+    # INDEXES
+    # ===========================
+    # Keyset pagination for the default listing order
+    # (data_completeness_score DESC, name, id), with and without a state filter
+    __table_args__ = (
+        Index(
+            "ix_institutions_completeness_name_id",
+            data_completeness_score.desc(),
+            name,
+            id,
+        ),
+        Index(
+            "ix_institutions_state_completeness_name_id",
+            state,
+            data_completeness_score.desc(),
+            name,
+            id,
+        ),
+        # Filtered listings (InstitutionSearchFilter): equality filters
+        # followed by the default sort so keyset pages read in index order
+        Index(
+            "ix_institutions_control_completeness_name_id",
+            control_type,
+            data_completeness_score.desc(),
+            name,
+            id,
+        ),
+        Index(
+            "ix_institutions_state_control_completeness_name_id",
+            state,
+            control_type,
+            data_completeness_score.desc(),
+            name,
+            id,
+        ),
+        Index(
+            "ix_institutions_size_locale",
+            size_category,
+            locale,
+            postgresql_ops={"locale": "varchar_pattern_ops"},
+        ),
+        # Locale prefix match (LIKE 'City%')
+        Index(
+            "ix_institutions_locale_pattern",
+            locale,
+            postgresql_ops={"locale": "varchar_pattern_ops"},
+        ),
+        # Range filters
+        Index("ix_institutions_state_tuition_in_state", state, tuition_in_state),
+        Index("ix_institutions_tuition_in_state", tuition_in_state),
+        Index("ix_institutions_tuition_out_of_state", tuition_out_of_state),
+        Index("ix_institutions_acceptance_rate", acceptance_rate),
+        # Cost-sorted listings (sort_by=cost), with and without a state
+        Index("ix_institutions_cost_in_state_id", cost_in_state, id),
+        Index("ix_institutions_cost_out_of_state_id", cost_out_of_state, id),
+        Index("ix_institutions_state_cost_in_state_id", state, cost_in_state, id),
+        Index(
+            "ix_institutions_sat_band",
+            sat_math_25th + sat_reading_25th,
+            sat_math_75th + sat_reading_75th,
+        ),
+        Index("ix_institutions_act_band", act_composite_25th, act_composite_75th),
+        # Keyset pagination for sort_by=name / city
+        Index("ix_institutions_name_id", name, id),
+        Index("ix_institutions_city_id", city, id),
+        # Typo-tolerant name/city search (/institutions/search, pg_trgm)
+        Index(
+            "ix_institutions_name_trgm",
+            name,
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_institutions_city_trgm",
+            city,
+            postgresql_using="gin",
+            postgresql_ops={"city": "gin_trgm_ops"},
+        ),
+    )
+
     # ===========================
     # RELATIONSHIPS (OPTIONAL - if you still have enrollment/graduation tables)
     # ===========================
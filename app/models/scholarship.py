@@ -13,11 +13,59 @@ from sqlalchemy import (
     Date,
     Numeric,
     Enum as SQLEnum,
+    Index,
+    Computed,
+    SmallInteger,
+    event,
+    text,
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.sql import func
 from app.core.database import Base
 from enum import Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
+import re
+
+# Text search config used by the generated search_vector column and queries
+SEARCH_CONFIG = "english"
+
+# Weighted document for full-text search: title > organization > description
+SEARCH_VECTOR_SQL = (
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(organization, '')), 'B') || "
+    f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'C')"
+)
+
+# Pinned scholarships, in display order. Each entry is a sequence of words
+# that must appear in the title in order (like ILIKE '%Lowe%Educational%').
+PRIORITY_PINS = (
+    ("Lowe", "Educational"),
+    ("Target", "Community"),
+    ("Google", "Lime"),
+    ("Coca", "Cola"),
+    ("Violet", "Richardson"),
+    ("National", "Merit"),
+    ("Do", "Something"),
+)
+
+# Ranks after the pins: scholarships with images, then everything else
+PRIORITY_WITH_IMAGE = len(PRIORITY_PINS) + 1
+PRIORITY_DEFAULT = len(PRIORITY_PINS) + 2
+
+_PRIORITY_PATTERNS = [
+    re.compile(".*".join(re.escape(word) for word in words), re.IGNORECASE)
+    for words in PRIORITY_PINS
+]
+
+
+def compute_priority_rank(title: str, primary_image_url: str = None) -> int:
+    """Listing priority for a scholarship (lower sorts first)"""
+    for rank, pattern in enumerate(_PRIORITY_PATTERNS, start=1):
+        if title and pattern.search(title):
+            return rank
+    if primary_image_url is not None:
+        return PRIORITY_WITH_IMAGE
+    return PRIORITY_DEFAULT
 
 
 class ScholarshipType(str, Enum):
@@ -119,17 +167,81 @@ class Scholarship(Base):
     views_count = Column(Integer, default=0, nullable=False)
     applications_count = Column(Integer, default=0, nullable=False)
 
+    # Stored listing priority (see compute_priority_rank); kept up to date
+    # on ORM insert/update so listings can sort on an index
+    priority_rank = Column(
+        SmallInteger, default=PRIORITY_DEFAULT, nullable=False, index=True
+    )
+
     # ===========================
     # TIMESTAMPS
     # ===========================
     created_at = Column(DateTime, default=func.now(), nullable=False)
     updated_at = Column(DateTime, onupdate=func.now())
 
+    # ===========================
+    # SEARCH
+    # ===========================
+    # Generated by Postgres; deferred so listings don't fetch it
+    search_vector = deferred(
+        Column(TSVECTOR, Computed(SEARCH_VECTOR_SQL, persisted=True))
+    )
+
     # ===========================
     # RELATIONSHIPS
     # ===========================
     applications = relationship("ScholarshipApplication", back_populates="scholarship")
 
+    # ===========================
+    # INDEXES
+    # ===========================
+    __table_args__ = (
+        # Keyset pagination for the public listing (title, id)
+        Index("ix_scholarships_status_title_id", status, title, id),
+        # Full-text search (websearch_to_tsquery @@ search_vector)
+        Index(
+            "ix_scholarships_search_vector", "search_vector", postgresql_using="gin"
+        ),
+        # Priority-ordered listings, one per sort the services use
+        Index(
+            "ix_scholarships_status_priority_created",
+            status,
+            priority_rank,
+            created_at.desc(),
+        ),
+        Index(
+            "ix_scholarships_status_priority_deadline",
+            status,
+            priority_rank,
+            deadline,
+        ),
+        Index(
+            "ix_scholarships_status_priority_amount_max",
+            status,
+            priority_rank,
+            amount_max.desc(),
+        ),
+        # Partial indexes over the active catalog only (expired rows are
+        # swept out of it, see ScholarshipService.expire_past_deadline)
+        Index(
+            "ix_scholarships_active_deadline",
+            deadline,
+            postgresql_where=text("status = 'ACTIVE'"),
+        ),
+        Index(
+            "ix_scholarships_active_amount_max",
+            amount_max.desc(),
+            postgresql_where=text("status = 'ACTIVE'"),
+        ),
+        # Natural key for bulk ingest upserts (ON CONFLICT target)
+        Index(
+            "uq_scholarships_organization_title",
+            organization,
+            title,
+            unique=True,
+        ),
+    )
+
     def __repr__(self):
         return f"<Scholarship(id={self.id}, title='{self.title}', amount=${self.amount_min}-${self.amount_max})>"
 
@@ -139,3 +251,11 @@ class Scholarship(Base):
         if self.amount_min == self.amount_max:
             return f"${self.amount_min:,}"
         return f"${self.amount_min:,} - ${self.amount_max:,}"
+
+
+@event.listens_for(Scholarship, "before_insert")
+@event.listens_for(Scholarship, "before_update")
+def _set_priority_rank(mapper, connection, target):
+    target.priority_rank = compute_priority_rank(
+        target.title, target.primary_image_url
+    )
@@ -0,0 +1,43 @@
+# app/models/scholarship_matches.py
+"""
+Precomputed scholarship matches per user (see app.services.scholarship_matches)
+"""
+
+from sqlalchemy import Column, Integer, Float, ForeignKey, DateTime, Index
+from datetime import datetime
+
+from app.core.database import Base
+
+
+class UserScholarshipMatch(Base):
+    """
+    One row per (user, matching scholarship), with the matcher's score.
+    Rebuilt per user when their profile or a relevant scholarship changes.
+    """
+
+    __tablename__ = "user_scholarship_matches"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    scholarship_id = Column(
+        Integer,
+        ForeignKey("scholarships.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    score = Column(Float, nullable=False)
+    computed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Composite Indexes
+    __table_args__ = (
+        # Reads: a user's matches, best first
+        Index("idx_user_match_score", "user_id", score.desc()),
+        Index(
+            "idx_user_match_scholarship", "user_id", "scholarship_id", unique=True
+        ),
+    )
+
+    def __repr__(self):
+        return f"<UserScholarshipMatch(user_id={self.user_id}, scholarship_id={self.scholarship_id}, score={self.score})>"
@@ -25,7 +25,11 @@ from app.schemas.institution import (
 )
 
 # CampusConnect images
-from app.schemas.entity_image import EntityImageResponse
+from app.schemas.entity_image import (
+    EntityImageResponse,
+    FeaturedImagesBatch,
+    GalleriesBatch,
+)
 
 __all__ = [
     # Institution schemas
@@ -42,6 +46,8 @@ __all__ = [
     "AdmissionsSummary",
     "EnrollmentSummary",
     "GraduationSummary",
-    # Entity image schema
+    # Entity image schemas
     "EntityImageResponse",
+    "FeaturedImagesBatch",
+    "GalleriesBatch",
 ]
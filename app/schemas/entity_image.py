@@ -3,7 +3,7 @@ Schemas for entity images (gallery).
 Used for API responses when displaying institution/scholarship galleries.
 """
 from pydantic import BaseModel
-from typing import Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 
@@ -28,3 +28,13 @@ class EntityImageResponse(EntityImageBase):
 
     class Config:
         from_attributes = True
+
+
+class FeaturedImagesBatch(BaseModel):
+    """Featured image per requested entity id (null when it has none)"""
+    images: Dict[int, Optional[EntityImageResponse]]
+
+
+class GalleriesBatch(BaseModel):
+    """Gallery per requested entity id (empty when it has none)"""
+    galleries: Dict[int, List[EntityImageResponse]]
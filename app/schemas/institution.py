@@ -113,6 +113,10 @@ class InstitutionResponse(InstitutionBase):
     application_fee_undergrad: Optional[Decimal] = None
     application_fee_grad: Optional[Decimal] = None
 
+    # Total cost of attendance (tuition + room and board, precomputed)
+    cost_in_state: Optional[Decimal] = None
+    cost_out_of_state: Optional[Decimal] = None
+
     # Admissions Data
     acceptance_rate: Optional[Decimal] = None
     sat_reading_25th: Optional[int] = None
@@ -207,7 +211,33 @@ class InstitutionSearchFilter(BaseModel):
     state: Optional[str] = Field(None, min_length=2, max_length=2)
     control_type: Optional[ControlType] = None
     search_query: Optional[str] = None
-    sort_by: str = Field("name", pattern="^(name|city|state|data_completeness_score)$")
+
+    # Characteristics (locale matches by prefix: "City" -> "City: Large")
+    size_category: Optional[str] = None
+    locale: Optional[str] = None
+
+    # Tuition range, on in-state or out-of-state tuition
+    min_tuition: Optional[Decimal] = Field(None, ge=0)
+    max_tuition: Optional[Decimal] = Field(None, ge=0)
+    tuition_residency: str = Field("in_state", pattern="^(in_state|out_of_state)$")
+
+    # Acceptance rate range (percent)
+    min_acceptance_rate: Optional[Decimal] = Field(None, ge=0, le=100)
+    max_acceptance_rate: Optional[Decimal] = Field(None, ge=0, le=100)
+
+    # Test scores: institutions whose middle-50% band contains the score
+    sat_score: Optional[int] = Field(None, ge=400, le=1600)
+    act_score: Optional[int] = Field(None, ge=1, le=36)
+
+    # sort_by=cost: total cost of attendance, in-state where the institution
+    # is in residency_state and out-of-state elsewhere (without a
+    # residency_state, tuition_residency picks the cost). Institutions
+    # without cost data are left out.
+    residency_state: Optional[str] = Field(None, min_length=2, max_length=2)
+
+    sort_by: str = Field(
+        "name", pattern="^(name|city|state|data_completeness_score|cost)$"
+    )
     sort_order: str = Field("asc", pattern="^(asc|desc)$")
 
 
@@ -90,10 +90,20 @@ class ScholarshipBase(BaseModel):
 # ===========================
 
 
+def strip_natural_key(value):
+    """
+    (organization, title) is the scholarship natural key: every write path
+    stores it without surrounding whitespace so " Acme" can't duplicate "Acme"
+    """
+    return value.strip() if isinstance(value, str) else value
+
+
 class ScholarshipCreate(ScholarshipBase):
     """Schema for creating a new scholarship"""
 
-    pass
+    @validator("title", "organization", pre=True)
+    def strip_key(cls, v):
+        return strip_natural_key(v)
 
 
 # ===========================
@@ -135,6 +145,10 @@ class ScholarshipUpdate(BaseModel):
     verified: Optional[bool] = None
     featured: Optional[bool] = None
 
+    @validator("title", "organization", pre=True)
+    def strip_key(cls, v):
+        return strip_natural_key(v)
+
 
 # ===========================
 # RESPONSE SCHEMA
@@ -197,6 +211,9 @@ class ScholarshipSearchFilter(BaseModel):
     )
     sort_order: str = Field("desc", pattern="^(asc|desc)$")
 
+    # Total: exact (cached COUNT) or planner estimate for broad filters
+    count: str = Field("exact", pattern="^(exact|estimate)$")
+
 
 # ===========================
 # BULK OPERATIONS
@@ -215,3 +232,13 @@ class BulkScholarshipCreate(BaseModel):
         if len(v) > 100:
             raise ValueError("Maximum 100 scholarships per batch")
         return v
+
+
+class BulkIngestResult(BaseModel):
+    """Outcome of a bulk ingest (COPY + upsert) run"""
+
+    inserted: int = 0
+    updated: int = 0
+    rejected: int = 0
+    duplicates: int = 0  # Repeated (organization, title) rows in the input
+    errors: List[dict] = []  # First rejected rows: {"row": n, "error": "..."}
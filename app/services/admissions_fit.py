@@ -0,0 +1,154 @@
+# app/services/admissions_fit.py
+"""
+Admissions fit (reach / match / safety) for a student's test scores.
+
+Every institution is classified in one vectorized pass over the shared
+institution snapshot:
+- per test, a score below the middle-50% band is a reach, inside it a
+  match and above it a safety; the better of SAT and ACT counts
+- very selective institutions are a reach for everyone, and selective
+  ones are never a safety
+- institutions without band data for the student's tests are unknown
+
+Page items are read from the snapshot too; only extra listing filters
+touch the database.
+"""
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.institution import Institution
+from app.schemas.institution import InstitutionSearchFilter, InstitutionSummary
+from app.services.institution import (
+    DEFAULT_IMAGE_URL,
+    SUMMARY_COLUMNS,
+    filter_institutions,
+    has_criteria,
+)
+from app.services.institution_snapshot import InstitutionArrays, institution_snapshot
+
+SUMMARY_FIELDS = [column.key for column in SUMMARY_COLUMNS]
+
+# Category codes, worst fit first (so np.fmax picks the better test)
+UNKNOWN = 0
+REACH = 1
+MATCH = 2
+SAFETY = 3
+
+CATEGORY_NAMES = {
+    UNKNOWN: "unknown",
+    REACH: "reach",
+    MATCH: "match",
+    SAFETY: "safety",
+}
+CATEGORY_CODES = {name: code for code, name in CATEGORY_NAMES.items()}
+
+# Acceptance rate (percent) below which an institution is always a reach
+REACH_ACCEPTANCE_BELOW = 15.0
+# ... and below which it is at best a match
+SAFETY_ACCEPTANCE_MIN = 30.0
+
+
+def _band_position(score: Optional[int], low: np.ndarray, high: np.ndarray):
+    """REACH/MATCH/SAFETY per institution for one test (NaN: no band)"""
+    position = np.full(low.shape, np.nan)
+    if score is None:
+        return position
+    known = ~(np.isnan(low) | np.isnan(high))
+    position[known] = MATCH
+    position[known & (score < low)] = REACH
+    position[known & (score > high)] = SAFETY
+    return position
+
+
+def classify(
+    arrays: InstitutionArrays,
+    sat_score: Optional[int] = None,
+    act_score: Optional[int] = None,
+) -> np.ndarray:
+    """Category code (int8) for every institution, in snapshot order"""
+    position = np.fmax(
+        _band_position(sat_score, arrays.sat_25th, arrays.sat_75th),
+        _band_position(act_score, arrays.act_25th, arrays.act_75th),
+    )
+    categories = np.where(np.isnan(position), UNKNOWN, position).astype(np.int8)
+
+    # NaN comparisons are False, so unknown rates change nothing
+    rate = arrays.acceptance_rate
+    selective = (rate < SAFETY_ACCEPTANCE_MIN) & (categories == SAFETY)
+    categories[selective] = MATCH
+    categories[rate < REACH_ACCEPTANCE_BELOW] = REACH
+    return categories
+
+
+def category_counts(categories: np.ndarray) -> Dict[str, int]:
+    """Institutions per category name"""
+    counts = np.bincount(categories, minlength=len(CATEGORY_NAMES))
+    return {name: int(counts[code]) for code, name in CATEGORY_NAMES.items()}
+
+
+class AdmissionsFitService:
+    """Classified, paginated institution lists for a student's scores"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def fit_page(
+        self,
+        sat_score: Optional[int],
+        act_score: Optional[int],
+        filters: Optional[InstitutionSearchFilter] = None,
+        category: Optional[str] = None,
+        page: int = 1,
+        limit: int = 50,
+    ) -> Dict[str, Any]:
+        """
+        One page of institutions (InstitutionSummary + admissions_fit) in
+        snapshot order (data completeness desc, name, id), optionally
+        narrowed by the criteria in `filters` (its sort is not used) and a
+        category. `counts` covers every category after `filters`.
+        """
+        snapshot = institution_snapshot.snapshot(self.db)
+        arrays = institution_snapshot.arrays_for(snapshot)
+        categories = classify(arrays, sat_score, act_score)
+
+        selected = np.ones(len(arrays), dtype=bool)
+        if filters is not None and has_criteria(filters):
+            # Filtering stays in SQL (indexed); only ids come back
+            ids = self.db.execute(
+                filter_institutions(select(Institution.id), filters)
+            ).scalars()
+            selected &= np.isin(arrays.ids, np.fromiter(ids, dtype=np.int64))
+
+        counts = category_counts(categories[selected])
+        if category:
+            selected &= categories == CATEGORY_CODES[category]
+
+        rows = np.flatnonzero(selected)
+        page_rows = rows[(page - 1) * limit : page * limit]
+
+        # Page items come straight from the mapped snapshot columns
+        items = []
+        for row in page_rows:
+            record = snapshot.record(int(row), SUMMARY_FIELDS)
+            # Like every listing: no placeholder image (see without_placeholder_image)
+            if record["primary_image_url"] == DEFAULT_IMAGE_URL:
+                record["primary_image_url"] = None
+            item = InstitutionSummary.model_validate(record).model_dump()
+            item["admissions_fit"] = CATEGORY_NAMES[int(categories[row])]
+            items.append(item)
+
+        total = int(rows.size)
+        total_pages = (total + limit - 1) // limit
+        return {
+            "items": items,
+            "counts": counts,
+            "total": total,
+            "page": page,
+            "limit": limit,
+            "total_pages": total_pages,
+            "has_more": page < total_pages,
+        }
@@ -0,0 +1,177 @@
+# app/services/catalog_reads.py
+"""
+Read-only Core queries for the public catalog endpoints.
+
+Each read selects exactly the columns of its response schema with Core
+select(). The result rows (tuple-backed, with attribute access) go straight
+to serialization: no ORM instances, identity map or attribute
+instrumentation. response_model routes validate rows via from_attributes.
+Listing items use dict(row._mapping).
+
+Writes stay on the ORM services.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+from pydantic import BaseModel
+from sqlalchemy import Integer, and_, any_, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.entity_image import EntityImage
+from app.models.institution import Institution
+from app.models.scholarship import Scholarship
+from app.schemas.entity_image import EntityImageResponse
+from app.schemas.institution import InstitutionResponse
+from app.schemas.scholarship import ScholarshipResponse
+
+
+def schema_columns(model, schema: Type[BaseModel], **overrides) -> List[Any]:
+    """
+    Columns of `model` for every field of `schema`, in field order.
+    `overrides` replace a column with a SQL expression (labelled with the
+    field name).
+    """
+    return [
+        overrides[name].label(name) if name in overrides else getattr(model, name)
+        for name in schema.model_fields
+    ]
+
+
+INSTITUTION_COLUMNS = schema_columns(Institution, InstitutionResponse)
+SCHOLARSHIP_COLUMNS = schema_columns(Scholarship, ScholarshipResponse)
+ENTITY_IMAGE_COLUMNS = schema_columns(EntityImage, EntityImageResponse)
+
+# Gallery order
+IMAGE_ORDER = (EntityImage.display_order, EntityImage.created_at)
+
+
+def any_of(column, ids: Sequence[int]):
+    """`column = ANY(:ids)`: one statement shape for any number of ids"""
+    return column == any_(literal(list(ids), ARRAY(Integer)))
+
+
+class CatalogReadRepository:
+    """Public catalog reads on an (async) read session"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def _first(self, query) -> Optional[Row]:
+        result = await self.db.execute(query.limit(1))
+        return result.first()
+
+    async def institution(self, institution_id: int) -> Optional[Row]:
+        """InstitutionResponse row by database id"""
+        return await self._first(
+            select(*INSTITUTION_COLUMNS).where(Institution.id == institution_id)
+        )
+
+    async def institution_by_ipeds(self, ipeds_id: int) -> Optional[Row]:
+        """InstitutionResponse row by IPEDS id"""
+        return await self._first(
+            select(*INSTITUTION_COLUMNS).where(Institution.ipeds_id == ipeds_id)
+        )
+
+    async def institution_images_by_ipeds(
+        self, ipeds_id: int, featured: bool = False
+    ) -> Optional[List[Row]]:
+        """
+        EntityImageResponse rows for an institution by IPEDS id, in gallery
+        order (only the first featured image if `featured`); None if there
+        is no such institution. One query: the institution LEFT JOINs its
+        images, so an institution without images still yields a row.
+        """
+        on = [
+            EntityImage.entity_type == "institution",
+            EntityImage.entity_id == Institution.id,
+        ]
+        if featured:
+            on.append(EntityImage.is_featured.is_(True))
+
+        query = (
+            select(*ENTITY_IMAGE_COLUMNS)
+            .select_from(Institution)
+            .outerjoin(EntityImage, and_(*on))
+            .where(Institution.ipeds_id == ipeds_id)
+            .order_by(*IMAGE_ORDER)
+        )
+        if featured:
+            query = query.limit(1)
+
+        rows = (await self.db.execute(query)).all()
+        if not rows:
+            return None
+        return [row for row in rows if row.id is not None]
+
+    async def scholarship(self, scholarship_id: int) -> Optional[Row]:
+        """ScholarshipResponse row by id"""
+        return await self._first(
+            select(*SCHOLARSHIP_COLUMNS).where(Scholarship.id == scholarship_id)
+        )
+
+    async def gallery(self, entity_type: str, entity_id: int) -> Sequence[Row]:
+        """EntityImageResponse rows for one entity, in gallery order"""
+        result = await self.db.execute(
+            select(*ENTITY_IMAGE_COLUMNS)
+            .where(
+                EntityImage.entity_type == entity_type,
+                EntityImage.entity_id == entity_id,
+            )
+            .order_by(*IMAGE_ORDER)
+        )
+        return result.all()
+
+    async def featured_image(self, entity_type: str, entity_id: int) -> Optional[Row]:
+        """The entity's featured EntityImageResponse row"""
+        return await self._first(
+            select(*ENTITY_IMAGE_COLUMNS).where(
+                EntityImage.entity_type == entity_type,
+                EntityImage.entity_id == entity_id,
+                EntityImage.is_featured.is_(True),
+            )
+        )
+
+    def _batch_images(self, entity_type: str, ids: Sequence[int], by_ipeds: bool):
+        """
+        Image rows for many entities with the requested id as `batch_key`
+        (institution IPEDS ids are resolved in the same query), and the key
+        column for ordering
+        """
+        key = Institution.ipeds_id if by_ipeds else EntityImage.entity_id
+        query = (
+            select(key.label("batch_key"), *ENTITY_IMAGE_COLUMNS)
+            .select_from(EntityImage)
+            .where(EntityImage.entity_type == entity_type, any_of(key, ids))
+        )
+        if by_ipeds:
+            query = query.join(Institution, Institution.id == EntityImage.entity_id)
+        return query, key
+
+    async def galleries(
+        self, entity_type: str, ids: Sequence[int], by_ipeds: bool = False
+    ) -> Dict[int, List[Row]]:
+        """Gallery rows per requested id (one query for every id)"""
+        query, key = self._batch_images(entity_type, ids, by_ipeds)
+        result = await self.db.execute(query.order_by(key, *IMAGE_ORDER))
+
+        galleries: Dict[int, List[Row]] = {entity_id: [] for entity_id in ids}
+        for row in result.all():
+            galleries[row.batch_key].append(row)
+        return galleries
+
+    async def featured_images(
+        self, entity_type: str, ids: Sequence[int], by_ipeds: bool = False
+    ) -> Dict[int, Optional[Row]]:
+        """Featured image row per requested id (one query for every id)"""
+        query, key = self._batch_images(entity_type, ids, by_ipeds)
+        result = await self.db.execute(
+            query.where(EntityImage.is_featured.is_(True))
+            .distinct(key)
+            .order_by(key, *IMAGE_ORDER)
+        )
+
+        featured: Dict[int, Optional[Row]] = dict.fromkeys(ids)
+        featured.update((row.batch_key, row) for row in result.all())
+        return featured
@@ -0,0 +1,197 @@
+# app/services/institution.py
+"""
+Institution listing queries shared by the (async) institution routes.
+
+Builds SELECT statements for InstitutionSearchFilter criteria and the
+matching keyset sort keys; the routes execute them on their own sessions.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import case, func, or_
+from sqlalchemy.sql import Select
+
+from app.models.institution import Institution
+from app.schemas.institution import InstitutionSearchFilter
+from app.services.catalog_reads import INSTITUTION_COLUMNS
+
+# Columns needed for InstitutionSummary (slim list views)
+SUMMARY_COLUMNS = (
+    Institution.id,
+    Institution.ipeds_id,
+    Institution.name,
+    Institution.city,
+    Institution.state,
+    Institution.control_type,
+    Institution.primary_image_url,
+    Institution.student_faculty_ratio,
+    Institution.data_completeness_score,
+    Institution.is_featured,
+    Institution.tuition_in_state,
+    Institution.tuition_out_of_state,
+    Institution.acceptance_rate,
+)
+
+# Placeholder image stored for institutions without a real one
+DEFAULT_IMAGE_URL = "/images/default-institution.jpg"
+
+# Middle-50% combined SAT band (matches the ix_institutions_sat_band index)
+SAT_25TH = Institution.sat_math_25th + Institution.sat_reading_25th
+SAT_75TH = Institution.sat_math_75th + Institution.sat_reading_75th
+
+TUITION_COLUMNS = {
+    "in_state": Institution.tuition_in_state,
+    "out_of_state": Institution.tuition_out_of_state,
+}
+
+COST_COLUMNS = {
+    "in_state": Institution.cost_in_state,
+    "out_of_state": Institution.cost_out_of_state,
+}
+
+# Filter fields that don't change which rows match
+NON_FILTER_FIELDS = {"page", "limit", "sort_by", "sort_order"}
+
+
+def cost_expression(filters: InstitutionSearchFilter):
+    """
+    Cost of attendance for the filter's residency: in-state cost where the
+    institution is in residency_state, out-of-state cost elsewhere
+    """
+    if filters.residency_state:
+        return case(
+            (
+                Institution.state == filters.residency_state.upper(),
+                Institution.cost_in_state,
+            ),
+            else_=Institution.cost_out_of_state,
+        )
+    return COST_COLUMNS[filters.tuition_residency]
+
+
+def count_filters(filters: InstitutionSearchFilter) -> Dict[str, Any]:
+    """Criteria that decide which rows match (the listing total's cache key)"""
+    values = filters.model_dump(exclude=NON_FILTER_FIELDS)
+    # The cost sort also drops institutions without cost data
+    values["has_cost"] = filters.sort_by == "cost" or None
+    return values
+
+
+def has_criteria(filters: InstitutionSearchFilter) -> bool:
+    """True when `filters` narrows the institutions at all"""
+    values = count_filters(filters)
+    # Only qualify other criteria (tuition range, cost sort)
+    values.pop("tuition_residency")
+    values.pop("residency_state")
+    return any(value is not None for value in values.values())
+
+
+def filter_institutions(query: Select, filters: InstitutionSearchFilter) -> Select:
+    """Apply every set InstitutionSearchFilter criterion to `query`"""
+    if filters.state:
+        query = query.where(Institution.state == filters.state.upper())
+
+    if filters.control_type:
+        query = query.where(Institution.control_type == filters.control_type)
+
+    if filters.search_query and filters.search_query.strip():
+        # Served by the gin_trgm_ops indexes on name and city
+        text = filters.search_query.strip()
+        query = query.where(
+            or_(
+                Institution.name.icontains(text, autoescape=True),
+                Institution.city.icontains(text, autoescape=True),
+            )
+        )
+
+    if filters.size_category:
+        query = query.where(Institution.size_category == filters.size_category)
+
+    if filters.locale:
+        query = query.where(
+            Institution.locale.startswith(filters.locale, autoescape=True)
+        )
+
+    tuition = TUITION_COLUMNS[filters.tuition_residency]
+    if filters.min_tuition is not None:
+        query = query.where(tuition >= filters.min_tuition)
+    if filters.max_tuition is not None:
+        query = query.where(tuition <= filters.max_tuition)
+
+    if filters.min_acceptance_rate is not None:
+        query = query.where(Institution.acceptance_rate >= filters.min_acceptance_rate)
+    if filters.max_acceptance_rate is not None:
+        query = query.where(Institution.acceptance_rate <= filters.max_acceptance_rate)
+
+    if filters.sat_score is not None:
+        query = query.where(
+            SAT_25TH <= filters.sat_score, SAT_75TH >= filters.sat_score
+        )
+
+    if filters.act_score is not None:
+        query = query.where(
+            Institution.act_composite_25th <= filters.act_score,
+            Institution.act_composite_75th >= filters.act_score,
+        )
+
+    if filters.sort_by == "cost":
+        query = query.where(cost_expression(filters).is_not(None))
+
+    return query
+
+
+def sort_keys(filters: InstitutionSearchFilter) -> List[Tuple[Any, bool]]:
+    """
+    Unique ORDER BY keys as (column, descending) pairs; id breaks ties so
+    the order (and cursors) are stable
+    """
+    descending = filters.sort_order == "desc"
+    if filters.sort_by == "cost":
+        return [(cost_expression(filters), descending), (Institution.id, False)]
+    column = getattr(Institution, filters.sort_by)
+    if filters.sort_by == "data_completeness_score":
+        return [
+            (column, descending),
+            (Institution.name, False),
+            (Institution.id, False),
+        ]
+    return [(column, descending), (Institution.id, False)]
+
+
+def without_placeholder_image(columns) -> List[Any]:
+    """`columns` with the placeholder primary_image_url nulled in SQL"""
+    return [
+        (
+            func.nullif(column, DEFAULT_IMAGE_URL).label(column.key)
+            if column.key == "primary_image_url"
+            else column
+        )
+        for column in columns
+    ]
+
+
+def listing_columns(filters: InstitutionSearchFilter, view: str = "full") -> List[Any]:
+    """
+    Core select columns for the listing: every InstitutionResponse field
+    (view="full") or the InstitutionSummary card fields (view="summary").
+    The cost sort adds cost_of_attendance.
+    """
+    columns = without_placeholder_image(
+        SUMMARY_COLUMNS if view == "summary" else INSTITUTION_COLUMNS
+    )
+    if filters.sort_by == "cost":
+        columns.append(cost_expression(filters).label("cost_of_attendance"))
+    return columns
+
+
+def sort_values(row: Any, filters: InstitutionSearchFilter) -> List[Any]:
+    """The sort_keys() values of a listing_columns() row (for cursors)"""
+    if filters.sort_by == "cost":
+        return [row.cost_of_attendance, row.id]
+    return [getattr(row, column.key) for column, _ in sort_keys(filters)]
+
+
+def order_by_keys(query: Select, keys: List[Tuple[Any, bool]]) -> Select:
+    return query.order_by(
+        *[column.desc() if descending else column for column, descending in keys]
+    )
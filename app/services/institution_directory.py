@@ -0,0 +1,138 @@
+# app/services/institution_directory.py
+"""
+Per-state institution directories for matching-institutions.
+
+A directory holds a state's institution count and its first
+INSTITUTION_DIRECTORY_SIZE institutions by name (serialized
+InstitutionResponse dicts). It is built with one query and cached in Redis
+under the "institutions" namespace, so requests for the same state (from
+any user, on any worker) are served without touching the database and
+institution writes drop every directory (see app.core.cache).
+
+All directories are warmed at startup (two queries in total).
+"""
+
+import logging
+from typing import Any, Dict, List, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.cache import RedisTTLCache, register_cache
+from app.core.config import settings
+from app.models.institution import Institution
+from app.schemas.institution import InstitutionResponse
+from app.services.catalog_reads import INSTITUTION_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+DIRECTORY_ORDER = (Institution.name, Institution.id)
+
+# Serialized directories, shared by workers through Redis.
+# Institution writes invalidate them (see app.core.cache).
+directory_cache = register_cache(
+    RedisTTLCache(
+        settings.REDIS_URL,
+        settings.INSTITUTION_DIRECTORY_TTL_SECONDS,
+        prefix="ms:directory",
+        password=settings.REDIS_PASSWORD,
+    )
+)
+
+
+def _directory_key(state: str) -> Tuple[str, ...]:
+    return ("institutions", "directory", state)
+
+
+def _serialize(rows) -> List[Dict[str, Any]]:
+    return [
+        InstitutionResponse.model_validate(row).model_dump(mode="json")
+        for row in rows
+    ]
+
+
+class InstitutionDirectoryService:
+    """Cached per-state institution directories"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _query(self, state: str, limit: int):
+        """One state's first `limit` rows, each carrying the state total"""
+        return (
+            select(*INSTITUTION_COLUMNS, func.count().over().label("total"))
+            .where(Institution.state == state)
+            .order_by(*DIRECTORY_ORDER)
+            .limit(limit)
+        )
+
+    def directory(self, state: str) -> Dict[str, Any]:
+        """{"total", "institutions"} for `state` (cached)"""
+        state = state.strip().upper()
+        key = _directory_key(state)
+        cached = directory_cache.get(key)
+        if cached is not None:
+            return cached
+
+        rows = self.db.execute(
+            self._query(state, settings.INSTITUTION_DIRECTORY_SIZE)
+        ).all()
+        directory = {
+            "total": rows[0].total if rows else 0,
+            "institutions": _serialize(rows),
+        }
+        directory_cache.set(key, directory)
+        return directory
+
+    def matching(self, state: str, limit: int) -> Tuple[List[Dict[str, Any]], int]:
+        """A state's first `limit` institutions by name and its total"""
+        if limit <= settings.INSTITUTION_DIRECTORY_SIZE:
+            directory = self.directory(state)
+            return directory["institutions"][:limit], directory["total"]
+
+        # Larger than a directory: count and limit in SQL, uncached
+        rows = self.db.execute(self._query(state.strip().upper(), limit)).all()
+        return _serialize(rows), rows[0].total if rows else 0
+
+    def warm(self) -> int:
+        """Build and cache every state's directory; returns states warmed"""
+        totals = dict(
+            self.db.execute(
+                select(Institution.state, func.count()).group_by(Institution.state)
+            ).all()
+        )
+
+        position = (
+            func.row_number()
+            .over(partition_by=Institution.state, order_by=DIRECTORY_ORDER)
+            .label("position")
+        )
+        ranked = select(*INSTITUTION_COLUMNS, position).subquery()
+        rows = self.db.execute(
+            select(ranked)
+            .where(ranked.c.position <= settings.INSTITUTION_DIRECTORY_SIZE)
+            .order_by(ranked.c.state, ranked.c.position)
+        ).all()
+
+        by_state: Dict[str, list] = {state: [] for state in totals}
+        for row in rows:
+            by_state[row.state].append(row)
+        for state, state_rows in by_state.items():
+            directory_cache.set(
+                _directory_key(state),
+                {"total": totals[state], "institutions": _serialize(state_rows)},
+            )
+
+        logger.info(f"Warmed institution directories for {len(by_state)} states")
+        return len(by_state)
+
+
+def warm_directories() -> int:
+    """warm() on its own session (startup)"""
+    from app.core.database import ReadSessionLocal
+
+    db = ReadSessionLocal()
+    try:
+        return InstitutionDirectoryService(db).warm()
+    finally:
+        db.close()
@@ -0,0 +1,408 @@
+# app/services/institution_snapshot.py
+"""
+Memory-mapped columnar snapshot of the institutions table, shared by all
+workers on a host.
+
+The table is exported once per data version to a directory of .npy files
+(one per column, rows in the default listing order) and published by
+atomically replacing manifest.json. Every worker maps the current files
+read-only (np.load(mmap_mode="r")), so the OS page cache holds a single
+copy and reads cost no database round trips.
+
+Freshness:
+- a background task (refresh_institution_snapshot, at startup and every
+  INSTITUTION_SNAPSHOT_MAX_AGE_SECONDS) checks the data version, a digest
+  of every row; a changed version triggers a rebuild under a file lock, so
+  only one worker exports it
+- requests never query: they remap the files when the manifest was
+  replaced (a stat per access). Only a request that finds nothing
+  published at all builds the first snapshot itself
+
+Build or refresh by hand:
+
+    python -m app.services.institution_snapshot
+"""
+
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+from sqlalchemy import Enum as SQLEnum, text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.institution import Institution
+from app.services.institution import DEFAULT_IMAGE_URL
+
+logger = logging.getLogger(__name__)
+
+# Bump when the export layout changes so old snapshots are rebuilt
+FORMAT_VERSION = 1
+
+MANIFEST = "manifest.json"
+BUILD_LOCK = ".build.lock"
+
+# Rows are stored in the default listing order
+SNAPSHOT_ORDER = (
+    Institution.data_completeness_score.desc(),
+    Institution.name,
+    Institution.id,
+)
+
+
+def _column_array(column, values: List[Any]) -> np.ndarray:
+    """
+    NumPy array for one column:
+    - NOT NULL integers -> int64
+    - other numbers -> float64 (NaN for NULL)
+    - booleans -> bool (NULL is False)
+    - strings/enums -> fixed-width unicode ("" for NULL)
+    - datetimes -> datetime64[us] (NaT for NULL)
+    """
+    if isinstance(column.type, SQLEnum):
+        values = [v.value if v is not None else None for v in values]
+        python_type = str
+    else:
+        python_type = column.type.python_type
+
+    if python_type is bool:
+        return np.array([bool(v) for v in values], dtype=bool)
+    if python_type is int and not column.nullable:
+        return np.array(values, dtype=np.int64)
+    if python_type in (int, float, Decimal):
+        return np.array(
+            [np.nan if v is None else float(v) for v in values], dtype=np.float64
+        )
+    if python_type is datetime:
+        return np.array(
+            [np.datetime64("NaT") if v is None else v for v in values],
+            dtype="datetime64[us]",
+        )
+    width = max([len(v) for v in values if v is not None] or [1])
+    return np.array([v or "" for v in values], dtype=f"<U{width}")
+
+
+@dataclass(frozen=True)
+class ColumnarSnapshot:
+    """One mapped snapshot version: column name -> read-only array"""
+
+    version: str
+    columns: Dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def record(self, row: int, fields: Iterable[str]) -> Dict[str, Any]:
+        """Row `row` as plain Python values (NaN/""/NaT -> None)"""
+        record = {}
+        for name in fields:
+            value = self.columns[name][row]
+            if isinstance(value, np.floating):
+                value = None if np.isnan(value) else float(value)
+            elif isinstance(value, np.datetime64):
+                value = None if np.isnat(value) else value.astype(datetime)
+            elif isinstance(value, np.generic):
+                value = value.item()
+            if value == "":
+                value = None
+            record[name] = value
+        return record
+
+
+@dataclass(frozen=True)
+class InstitutionArrays:
+    """Derived arrays for admissions fit (row i = snapshot row i)"""
+
+    ids: np.ndarray  # int64
+    sat_25th: np.ndarray  # float64 combined math + reading, NaN if unknown
+    sat_75th: np.ndarray  # float64
+    act_25th: np.ndarray  # float64, NaN if unknown
+    act_75th: np.ndarray  # float64
+    acceptance_rate: np.ndarray  # float64 percent, NaN if unknown
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def build_arrays(rows) -> InstitutionArrays:
+    """Build InstitutionArrays from (id, sat_math_25th, sat_math_75th,
+    sat_reading_25th, sat_reading_75th, act_composite_25th,
+    act_composite_75th, acceptance_rate) rows"""
+    rows = list(rows)
+    columns = list(zip(*rows)) if rows else [()] * 8
+
+    def floats(values) -> np.ndarray:
+        return np.array(
+            [np.nan if v is None else float(v) for v in values], dtype=np.float64
+        )
+
+    return _derive_arrays(
+        np.array(columns[0], dtype=np.int64),
+        *[floats(values) for values in columns[1:]],
+    )
+
+
+def _derive_arrays(
+    ids,
+    sat_math_25th,
+    sat_math_75th,
+    sat_reading_25th,
+    sat_reading_75th,
+    act_25th,
+    act_75th,
+    acceptance_rate,
+) -> InstitutionArrays:
+    return InstitutionArrays(
+        ids=ids,
+        # NaN + x = NaN: a combined band needs both sections
+        sat_25th=sat_math_25th + sat_reading_25th,
+        sat_75th=sat_math_75th + sat_reading_75th,
+        act_25th=act_25th,
+        act_75th=act_75th,
+        acceptance_rate=acceptance_rate,
+    )
+
+
+def _value_counts(array: np.ndarray) -> Dict[str, int]:
+    values, counts = np.unique(array, return_counts=True)
+    return {str(value): int(count) for value, count in zip(values, counts) if value}
+
+
+def summary_stats(snapshot: ColumnarSnapshot) -> Dict[str, Any]:
+    """Catalog totals (InstitutionStats fields) computed from the snapshot"""
+    images = snapshot["primary_image_url"]
+    with_images = (images != "") & (images != DEFAULT_IMAGE_URL)
+    return {
+        "total_institutions": len(snapshot),
+        "by_control_type": _value_counts(snapshot["control_type"]),
+        "by_state": _value_counts(snapshot["state"]),
+        "with_images": int(np.count_nonzero(with_images)),
+    }
+
+
+# Digest of every institutions row, so in-place edits that leave
+# updated_at alone still change the version. A full scan: only the
+# background refresh runs it.
+ROWS_DIGEST = text(
+    "SELECT md5(string_agg(i::text, '|' ORDER BY i.id)) FROM institutions AS i"
+)
+
+
+def data_version(db: Session) -> str:
+    """Stamp that changes whenever institutions rows change"""
+    digest = db.execute(ROWS_DIGEST).scalar()
+    raw = f"{FORMAT_VERSION}:{digest}"
+    return hashlib.sha1(raw.encode()).hexdigest()[:16]
+
+
+def read_manifest(directory: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(os.path.join(directory, MANIFEST)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+@contextmanager
+def _build_lock(directory: str):
+    """Exclusive lock across processes while a snapshot is built"""
+    with open(os.path.join(directory, BUILD_LOCK), "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def export_snapshot(db: Session, directory: str, version: str) -> Dict[str, Any]:
+    """
+    Write every institutions column to <directory>/<version>-<id>/*.npy and
+    publish it by atomically replacing the manifest. Returns the manifest.
+    """
+    table = Institution.__table__
+    rows = db.execute(table.select().order_by(*SNAPSHOT_ORDER)).all()
+
+    name = f"{version}-{uuid.uuid4().hex[:8]}"
+    staging = os.path.join(directory, f".{name}.tmp")
+    os.makedirs(staging)
+    for index, column in enumerate(table.columns):
+        array = _column_array(column, [row[index] for row in rows])
+        np.save(os.path.join(staging, f"{column.name}.npy"), array)
+    os.rename(staging, os.path.join(directory, name))
+
+    manifest = {
+        "version": version,
+        "path": name,
+        "rows": len(rows),
+        "columns": [column.name for column in table.columns],
+        "built_at": datetime.utcnow().isoformat(),
+    }
+    manifest_tmp = os.path.join(directory, f".{MANIFEST}.{uuid.uuid4().hex[:8]}")
+    with open(manifest_tmp, "w") as f:
+        json.dump(manifest, f)
+    os.replace(manifest_tmp, os.path.join(directory, MANIFEST))
+
+    # Readers keep their open mappings of older versions after the unlink
+    for entry in os.listdir(directory):
+        path = os.path.join(directory, entry)
+        if entry != name and os.path.isdir(path):
+            shutil.rmtree(path, ignore_errors=True)
+
+    logger.info(f"Exported institution snapshot {version} ({len(rows)} rows)")
+    return manifest
+
+
+def load_snapshot(directory: str, manifest: Dict[str, Any]) -> ColumnarSnapshot:
+    """Map a published snapshot read-only"""
+    path = os.path.join(directory, manifest["path"])
+    return ColumnarSnapshot(
+        version=manifest["version"],
+        columns={
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+            for name in manifest["columns"]
+        },
+    )
+
+
+class InstitutionSnapshot:
+    """
+    This process's view of the shared snapshot.
+    Institution writes show up once the refresh task publishes them.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._snapshot: Optional[ColumnarSnapshot] = None
+        self._arrays: Optional[InstitutionArrays] = None
+        self._manifest_stat = None
+
+    def clear(self) -> None:
+        self._snapshot = self._arrays = None
+        self._manifest_stat = None
+
+    def _manifest_changed(self) -> bool:
+        try:
+            stat = os.stat(os.path.join(self.directory, MANIFEST))
+        except OSError:
+            return True
+        return (stat.st_mtime_ns, stat.st_ino) != self._manifest_stat
+
+    def _load(self) -> Optional[ColumnarSnapshot]:
+        """Map the published snapshot (None if nothing is published)"""
+        try:
+            # Stat first: a swap right after it is noticed on next access
+            stat = os.stat(os.path.join(self.directory, MANIFEST))
+        except OSError:
+            return None
+        manifest = read_manifest(self.directory)
+        if manifest is None:
+            return None
+        try:
+            snapshot = load_snapshot(self.directory, manifest)
+        except OSError:
+            return None  # Replaced and cleaned up since the manifest read
+        self._snapshot = snapshot
+        self._arrays = None
+        self._manifest_stat = (stat.st_mtime_ns, stat.st_ino)
+        return self._snapshot
+
+    def refresh(self, db: Session, force: bool = False) -> ColumnarSnapshot:
+        """Check the data version; export a new snapshot if it changed"""
+        os.makedirs(self.directory, exist_ok=True)
+        version = data_version(db)
+        manifest = read_manifest(self.directory)
+        if force or manifest is None or manifest["version"] != version:
+            with _build_lock(self.directory):
+                # Another worker may have built it while we waited
+                manifest = read_manifest(self.directory)
+                if force or manifest is None or manifest["version"] != version:
+                    export_snapshot(db, self.directory, version)
+        snapshot = self._load()
+        if snapshot is None:
+            # Files were replaced or removed under us; publish our own
+            with _build_lock(self.directory):
+                export_snapshot(db, self.directory, version)
+            snapshot = self._load()
+        return snapshot
+
+    def snapshot(self, db: Session) -> ColumnarSnapshot:
+        """
+        The published snapshot, remapped when the manifest was replaced.
+        `db` is only used when nothing is published yet (first start)
+        """
+        with self._lock:
+            if self._snapshot is None or self._manifest_changed():
+                # On a failed remap keep serving the current mapping
+                if self._load() is None and self._snapshot is None:
+                    return self.refresh(db)
+            return self._snapshot
+
+    def arrays(self, db: Session) -> InstitutionArrays:
+        """Admissions-fit arrays for the current snapshot"""
+        return self.arrays_for(self.snapshot(db))
+
+    def arrays_for(self, snapshot: ColumnarSnapshot) -> InstitutionArrays:
+        """Admissions-fit arrays for `snapshot` (cached per version)"""
+        arrays = self._arrays
+        if arrays is None or arrays.ids is not snapshot["id"]:
+            arrays = _derive_arrays(
+                snapshot["id"],
+                snapshot["sat_math_25th"],
+                snapshot["sat_math_75th"],
+                snapshot["sat_reading_25th"],
+                snapshot["sat_reading_75th"],
+                snapshot["act_composite_25th"],
+                snapshot["act_composite_75th"],
+                snapshot["acceptance_rate"],
+            )
+            self._arrays = arrays
+        return arrays
+
+
+def _default_directory() -> str:
+    return settings.INSTITUTION_SNAPSHOT_DIR or os.path.join(
+        tempfile.gettempdir(), "magicscholar-institution-snapshot"
+    )
+
+
+# Shared per-process view
+institution_snapshot = InstitutionSnapshot(_default_directory())
+
+
+def refresh_institution_snapshot() -> None:
+    """institution_snapshot.refresh() on its own session (startup, periodic)"""
+    from app.core.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        institution_snapshot.refresh(db)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    from app.core.database import SessionLocal
+
+    logging.basicConfig(level=logging.INFO)
+    db = SessionLocal()
+    try:
+        built = institution_snapshot.refresh(db, force=True)
+        print(f"Institution snapshot {built.version}: {len(built)} rows")
+    finally:
+        db.close()
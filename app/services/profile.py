@@ -2,10 +2,14 @@
 from sqlalchemy.orm import Session
 from typing import Optional, List
 from datetime import datetime
+import logging
 
 from app.models.profile import UserProfile
 from app.models.institution import Institution
 from app.schemas.profile import ProfileCreate, ProfileUpdate
+from app.services.scholarship_matches import MATCH_FIELDS, ScholarshipMatchService
+
+logger = logging.getLogger(__name__)
 
 
 class ProfileService:
@@ -31,6 +35,9 @@ class ProfileService:
         self.db.add(db_profile)
         self.db.commit()
         self.db.refresh(db_profile)
+
+        if any(getattr(db_profile, field) is not None for field in MATCH_FIELDS):
+            self._refresh_matches(user_id)
         return db_profile
 
     def update_profile(
@@ -42,14 +49,29 @@ class ProfileService:
             return None
 
         update_data = profile_data.dict(exclude_unset=True)
+        matches_changed = any(
+            field in update_data and update_data[field] != getattr(db_profile, field)
+            for field in MATCH_FIELDS
+        )
         for field, value in update_data.items():
             setattr(db_profile, field, value)
 
         db_profile.updated_at = datetime.utcnow()
         self.db.commit()
         self.db.refresh(db_profile)
+
+        if matches_changed:
+            self._refresh_matches(user_id)
         return db_profile
 
+    def _refresh_matches(self, user_id: int) -> None:
+        """Recompute the user's stored scholarship matches"""
+        try:
+            ScholarshipMatchService(self.db).refresh_user(user_id)
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Error refreshing scholarship matches: {str(e)}")
+
     def delete_profile(self, user_id: int) -> bool:
         """Delete a user profile"""
         db_profile = self.get_by_user_id(user_id)
@@ -3,12 +3,26 @@
 Scholarship service - updated to work with new essential fields
 """
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, desc, asc, and_, case
+from sqlalchemy import or_, desc, asc, and_, case, func, select, tuple_, update
+from datetime import date
 from typing import List, Tuple, Optional
-from app.models.scholarship import Scholarship, ScholarshipStatus, ScholarshipType
+from app.core.cache import RedisTTLCache, invalidate_namespace, register_cache
+from app.core.config import settings
+from app.core.counters import BufferedCounter
+from app.core.database import SessionLocal
+from app.services.scholarship_matching import scholarship_matcher
+from app.core.pagination import count_cache_key, listing_total_sync
+from app.models.scholarship import (
+    Scholarship,
+    ScholarshipStatus,
+    ScholarshipType,
+    SEARCH_CONFIG,
+)
 from app.schemas.scholarship import (
     ScholarshipCreate,
+    ScholarshipResponse,
     ScholarshipSearchFilter,
     ScholarshipUpdate,
 )
@@ -16,10 +30,84 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Natural key index (organization, title), see the Scholarship model
+NATURAL_KEY_INDEX = "uq_scholarships_organization_title"
+
+
+class ScholarshipConflictError(ValueError):
+    """Another scholarship already has this (organization, title)"""
+
+    def __init__(self, organization: str, title: str):
+        super().__init__(
+            f"A scholarship titled '{title}' from '{organization}' already exists"
+        )
+        self.organization = organization
+        self.title = title
+
+
+# Search terms shorter than this use ILIKE instead of full-text search;
+# stemming makes 1-2 character prefixes match nothing useful
+FULL_TEXT_MIN_LENGTH = 3
+
+# Serialized search result pages, shared by workers through Redis.
+# Scholarship writes invalidate it (see app.core.cache).
+search_cache = register_cache(
+    RedisTTLCache(
+        settings.REDIS_URL,
+        settings.SEARCH_CACHE_TTL_SECONDS,
+        prefix="ms:search",
+        password=settings.REDIS_PASSWORD,
+    )
+)
+
+# Facet amount buckets on amount_max: (label, lower bound inclusive)
+AMOUNT_FACET_BUCKETS = (
+    ("under_1000", 0),
+    ("1000_4999", 1000),
+    ("5000_9999", 5000),
+    ("10000_24999", 10000),
+    ("25000_plus", 25000),
+)
+
+# Filters that don't change which rows match (paging, sorting, totals)
+NON_FILTER_FIELDS = {"page", "limit", "sort_by", "sort_order", "count"}
+
+# Scholarships expired per UPDATE/commit round by expire_past_deadline()
+EXPIRY_BATCH_SIZE = 1000
+
+# Write-behind views_count increments, applied by flush_view_counts()
+scholarship_views = BufferedCounter(
+    Scholarship.__table__,
+    "views_count",
+    redis_url=settings.REDIS_URL,
+    redis_password=settings.REDIS_PASSWORD,
+)
+
+
+def flush_view_counts() -> int:
+    """Apply buffered scholarship views (periodic task and shutdown)"""
+    db = SessionLocal()
+    try:
+        return scholarship_views.flush(db)
+    finally:
+        db.close()
+
+
+def expire_scholarships() -> int:
+    """Expire past-deadline scholarships (periodic task)"""
+    db = SessionLocal()
+    try:
+        return ScholarshipService(db).expire_past_deadline()
+    finally:
+        db.close()
+
 
 class ScholarshipService:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, read_db: Optional[Session] = None):
         self.db = db
+        # Search/listing reads can go to a replica (see get_read_db);
+        # writes and by-id lookups used for updates always use `db`
+        self.read_db = read_db or db
 
     def get_scholarship_by_id(self, scholarship_id: int) -> Optional[Scholarship]:
         """Get a single scholarship by ID"""
@@ -32,7 +120,7 @@ class ScholarshipService:
     ) -> List[Scholarship]:
         """Get all scholarships"""
         try:
-            query = self.db.query(Scholarship)
+            query = self.read_db.query(Scholarship)
 
             if active_only:
                 query = query.filter(Scholarship.status == ScholarshipStatus.ACTIVE)
@@ -47,9 +135,13 @@ class ScholarshipService:
         try:
             scholarship = Scholarship(**scholarship_data.model_dump())
             self.db.add(scholarship)
-            self.db.commit()
+            self._commit_natural_key(
+                scholarship_data.organization, scholarship_data.title
+            )
             self.db.refresh(scholarship)
             return scholarship
+        except ScholarshipConflictError:
+            raise
         except Exception as e:
             self.db.rollback()
             logger.error(f"Error creating scholarship: {str(e)}")
@@ -69,62 +161,75 @@ class ScholarshipService:
             for field, value in update_data.items():
                 setattr(scholarship, field, value)
 
-            self.db.commit()
+            self._commit_natural_key(scholarship.organization, scholarship.title)
             self.db.refresh(scholarship)
             return scholarship
+        except ScholarshipConflictError:
+            raise
         except Exception as e:
             self.db.rollback()
             logger.error(f"Error updating scholarship: {str(e)}")
             raise Exception(f"Failed to update scholarship: {str(e)}")
 
+    def _commit_natural_key(self, organization: str, title: str) -> None:
+        """Commit, raising ScholarshipConflictError for a duplicate natural key"""
+        try:
+            self.db.commit()
+        except IntegrityError as e:
+            self.db.rollback()
+            if NATURAL_KEY_INDEX in str(e.orig):
+                raise ScholarshipConflictError(organization, title)
+            raise
+
     def increment_view_count(self, scholarship_id: int) -> bool:
-        """Increment scholarship view count"""
+        """
+        Record a scholarship view. Buffered - no database round trip; the
+        periodic flush applies it (views of deleted rows are dropped then).
+        """
         try:
-            scholarship = self.get_scholarship_by_id(scholarship_id)
-            if scholarship:
-                scholarship.views_count += 1
-                self.db.commit()
-                return True
-            return False
+            scholarship_views.increment(scholarship_id)
+            return True
         except Exception as e:
-            self.db.rollback()
             logger.error(f"Error incrementing view count: {str(e)}")
             return False
 
-    def search_scholarships(
-        self, filters: ScholarshipSearchFilter
-    ) -> Tuple[List[Scholarship], int]:
+    def _filtered_query(self, filters: ScholarshipSearchFilter):
         """
-        Search scholarships with all available filters
+        Query for the scholarships matching `filters` (no ordering or
+        paging), plus the full-text rank expression when searching
         """
-        try:
-            query = self.db.query(Scholarship)
-
-            # Status filters
-            if filters.active_only:
-                query = query.filter(Scholarship.status == ScholarshipStatus.ACTIVE)
-
-            if filters.verified_only:
-                query = query.filter(Scholarship.verified == True)
+        query = self.read_db.query(Scholarship)
 
-            if filters.featured_only:
-                query = query.filter(Scholarship.featured == True)
-
-            # Scholarship type filter
-            if filters.scholarship_type:
-                try:
-                    scholarship_type = ScholarshipType(filters.scholarship_type)
-                    query = query.filter(
-                        Scholarship.scholarship_type == scholarship_type
-                    )
-                except ValueError:
-                    logger.warning(
-                        f"Invalid scholarship type: {filters.scholarship_type}"
-                    )
+        # Status filters
+        if filters.active_only:
+            query = query.filter(Scholarship.status == ScholarshipStatus.ACTIVE)
 
-            # Text search (title, organization, description)
-            if filters.search_query:
-                search_term = f"%{filters.search_query}%"
+        if filters.verified_only:
+            query = query.filter(Scholarship.verified == True)
+
+        if filters.featured_only:
+            query = query.filter(Scholarship.featured == True)
+
+        # Scholarship type filter
+        if filters.scholarship_type:
+            try:
+                scholarship_type = ScholarshipType(filters.scholarship_type)
+                query = query.filter(Scholarship.scholarship_type == scholarship_type)
+            except ValueError:
+                logger.warning(f"Invalid scholarship type: {filters.scholarship_type}")
+
+        # Text search (title, organization, description)
+        search_rank = None
+        if filters.search_query:
+            search_text = filters.search_query.strip()
+            if len(search_text) >= FULL_TEXT_MIN_LENGTH:
+                # Full-text search on the generated, GIN-indexed search_vector
+                ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, search_text)
+                query = query.filter(Scholarship.search_vector.op("@@")(ts_query))
+                search_rank = func.ts_rank(Scholarship.search_vector, ts_query)
+            else:
+                # Very short prefixes: substring match
+                search_term = f"%{search_text}%"
                 query = query.filter(
                     or_(
                         Scholarship.title.ilike(search_term),
@@ -133,71 +238,76 @@ class ScholarshipService:
                     )
                 )
 
-            # Financial filters - check if award amount overlaps with filter range
-            if filters.min_amount:
-                # Scholarship max amount must be >= filter min
-                query = query.filter(Scholarship.amount_max >= filters.min_amount)
+        # Financial filters - check if award amount overlaps with filter range
+        if filters.min_amount:
+            # Scholarship max amount must be >= filter min
+            query = query.filter(Scholarship.amount_max >= filters.min_amount)
 
-            if filters.max_amount:
-                # Scholarship min amount must be <= filter max
-                query = query.filter(Scholarship.amount_min <= filters.max_amount)
+        if filters.max_amount:
+            # Scholarship min amount must be <= filter max
+            query = query.filter(Scholarship.amount_min <= filters.max_amount)
 
-            # Renewable filter
-            if filters.renewable_only:
-                query = query.filter(Scholarship.is_renewable == True)
+        # Renewable filter
+        if filters.renewable_only:
+            query = query.filter(Scholarship.is_renewable == True)
 
-            # GPA filter - show scholarships where user meets or exceeds requirement
-            if filters.min_gpa_filter:
-                # Show scholarships with no GPA requirement OR where user's GPA >= requirement
-                query = query.filter(
-                    or_(
-                        Scholarship.min_gpa == None,
-                        Scholarship.min_gpa <= filters.min_gpa_filter,
-                    )
+        # GPA filter - show scholarships where user meets or exceeds requirement
+        if filters.min_gpa_filter:
+            # Show scholarships with no GPA requirement OR where user's GPA >= requirement
+            query = query.filter(
+                or_(
+                    Scholarship.min_gpa == None,
+                    Scholarship.min_gpa <= filters.min_gpa_filter,
                 )
+            )
 
-            # Date filters
-            if filters.deadline_before:
-                query = query.filter(
-                    and_(
-                        Scholarship.deadline != None,
-                        Scholarship.deadline <= filters.deadline_before,
-                    )
+        # Date filters
+        if filters.deadline_before:
+            query = query.filter(
+                and_(
+                    Scholarship.deadline != None,
+                    Scholarship.deadline <= filters.deadline_before,
                 )
+            )
 
-            if filters.deadline_after:
-                query = query.filter(
-                    and_(
-                        Scholarship.deadline != None,
-                        Scholarship.deadline >= filters.deadline_after,
-                    )
+        if filters.deadline_after:
+            query = query.filter(
+                and_(
+                    Scholarship.deadline != None,
+                    Scholarship.deadline >= filters.deadline_after,
                 )
+            )
 
-            # Academic year filter
-            if filters.academic_year:
-                query = query.filter(
-                    Scholarship.for_academic_year == filters.academic_year
-                )
+        # Academic year filter
+        if filters.academic_year:
+            query = query.filter(Scholarship.for_academic_year == filters.academic_year)
 
-            # Count total before pagination
-            total = query.count()
-
-            # Priority sorting - specific scholarships first
-            priority_order = case(
-                (Scholarship.title.ilike("%Lowe%Educational%"), 1),
-                (Scholarship.title.ilike("%Target%Community%"), 2),
-                (Scholarship.title.ilike("%Google%Lime%"), 3),
-                (Scholarship.title.ilike("%Coca%Cola%"), 4),
-                (Scholarship.title.ilike("%Violet%Richardson%"), 5),
-                (Scholarship.title.ilike("%National%Merit%"), 6),
-                (Scholarship.title.ilike("%Do%Something%"), 7),
-                # Then other scholarships with images
-                (Scholarship.primary_image_url.isnot(None), 8),
-                # Finally scholarships without images
-                else_=9,
+        return query, search_rank
+
+    def search_scholarships(
+        self, filters: ScholarshipSearchFilter
+    ) -> Tuple[List[Scholarship], int]:
+        """
+        Search scholarships with all available filters
+        """
+        try:
+            query, search_rank = self._filtered_query(filters)
+
+            # Count total before pagination (cached per filter set)
+            total, _ = listing_total_sync(
+                self.read_db,
+                "scholarships",
+                filters.model_dump(exclude=NON_FILTER_FIELDS),
+                query.statement,
+                filters.count,
             )
 
-            query = query.order_by(asc(priority_order))
+            # Priority sorting - pinned scholarships first (stored rank)
+            query = query.order_by(asc(Scholarship.priority_rank))
+
+            # Best text matches next when searching
+            if search_rank is not None:
+                query = query.order_by(desc(search_rank))
 
             # Then apply user's requested sorting
             valid_sort_fields = [
@@ -238,6 +348,96 @@ class ScholarshipService:
             logger.error(f"Error searching scholarships: {str(e)}")
             raise Exception(f"Failed to search scholarships: {str(e)}")
 
+    def search_scholarships_cached(
+        self, filters: ScholarshipSearchFilter
+    ) -> Tuple[List[dict], int]:
+        """
+        search_scholarships with the page serialized (ScholarshipResponse
+        dicts) and cached per normalized filter set
+        """
+        key = count_cache_key("scholarships", filters.model_dump(), "search")
+        cached = search_cache.get(key)
+        if cached is not None:
+            return cached["items"], cached["total"]
+
+        scholarships, total = self.search_scholarships(filters)
+        items = [
+            ScholarshipResponse.model_validate(sch).model_dump(mode="json")
+            for sch in scholarships
+        ]
+        search_cache.set(key, {"items": items, "total": total})
+        return items, total
+
+    def facet_counts(self, filters: ScholarshipSearchFilter) -> dict:
+        """
+        Counts per scholarship type, amount bucket, renewable flag and
+        deadline month ("YYYY-MM", "none") for the rows matching `filters`,
+        in one GROUP BY GROUPING SETS pass. Cached per normalized filter set.
+        """
+        key = count_cache_key(
+            "scholarships", filters.model_dump(exclude=NON_FILTER_FIELDS), "facets"
+        )
+        cached = search_cache.get(key)
+        if cached is not None:
+            return cached
+
+        query, _ = self._filtered_query(filters)
+        amount_bucket = case(
+            *[
+                (Scholarship.amount_max >= lower, label)
+                for label, lower in reversed(AMOUNT_FACET_BUCKETS[1:])
+            ],
+            else_=AMOUNT_FACET_BUCKETS[0][0],
+        )
+        matching = query.with_entities(
+            Scholarship.scholarship_type.label("scholarship_type"),
+            amount_bucket.label("amount"),
+            Scholarship.is_renewable.label("renewable"),
+            func.to_char(Scholarship.deadline, "YYYY-MM").label("deadline_month"),
+        ).subquery()
+
+        facet_columns = [
+            matching.c.scholarship_type,
+            matching.c.amount,
+            matching.c.renewable,
+            matching.c.deadline_month,
+        ]
+        rows = self.read_db.execute(
+            select(
+                *facet_columns,
+                # 0 for the column being grouped in each grouping set
+                *[func.grouping(c) for c in facet_columns],
+                func.count(),
+            )
+            .select_from(matching)
+            .group_by(func.grouping_sets(*[tuple_(c) for c in facet_columns]))
+        ).all()
+
+        facets = {
+            "scholarship_type": {},
+            "amount": {label: 0 for label, _ in AMOUNT_FACET_BUCKETS},
+            "renewable": {"true": 0, "false": 0},
+            "deadline_month": {},
+        }
+        for scholarship_type, amount, renewable, month, *flags, count in rows:
+            grouped = flags.index(0)
+            if grouped == 0:
+                facets["scholarship_type"][scholarship_type.value] = count
+            elif grouped == 1:
+                facets["amount"][amount] = count
+            elif grouped == 2:
+                facets["renewable"]["true" if renewable else "false"] += count
+            else:
+                facets["deadline_month"][month or "none"] = count
+
+        facets["deadline_month"] = dict(sorted(facets["deadline_month"].items()))
+        result = {
+            "total": sum(facets["scholarship_type"].values()),
+            "facets": facets,
+        }
+        search_cache.set(key, result)
+        return result
+
     def delete_scholarship(self, scholarship_id: int) -> bool:
         """Delete a scholarship"""
         try:
@@ -253,6 +453,46 @@ class ScholarshipService:
             logger.error(f"Error deleting scholarship: {str(e)}")
             return False
 
+    def expire_past_deadline(
+        self, today: Optional[date] = None, batch_size: int = EXPIRY_BATCH_SIZE
+    ) -> int:
+        """
+        Move ACTIVE scholarships whose deadline has passed to EXPIRED, in
+        batches of `batch_size` (short row locks, one commit per batch).
+        Returns the number of scholarships expired.
+        """
+        today = today or date.today()
+        expired = 0
+        try:
+            while True:
+                batch = (
+                    select(Scholarship.id)
+                    .where(Scholarship.status == ScholarshipStatus.ACTIVE)
+                    .where(Scholarship.deadline < today)
+                    .limit(batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+                result = self.db.execute(
+                    update(Scholarship)
+                    .where(Scholarship.id.in_(batch.scalar_subquery()))
+                    .values(status=ScholarshipStatus.EXPIRED, updated_at=func.now())
+                    .execution_options(synchronize_session=False)
+                )
+                self.db.commit()
+                expired += result.rowcount
+                if result.rowcount < batch_size:
+                    break
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Error expiring scholarships: {str(e)}")
+            raise
+
+        if expired:
+            # Bulk UPDATEs bypass the ORM hooks that drop cached catalog reads
+            invalidate_namespace("scholarships")
+            logger.info(f"Expired {expired} past-deadline scholarships")
+        return expired
+
     def get_scholarships_by_deadline(
         self, days_ahead: int = 30, limit: int = 50
     ) -> List[Scholarship]:
@@ -263,26 +503,13 @@ class ScholarshipService:
             today = datetime.now().date()
             future_date = today + timedelta(days=days_ahead)
 
-            # Priority order for featured scholarships
-            priority_order = case(
-                (Scholarship.title.ilike("%Lowe%Educational%"), 1),
-                (Scholarship.title.ilike("%Target%Community%"), 2),
-                (Scholarship.title.ilike("%Google%Lime%"), 3),
-                (Scholarship.title.ilike("%Coca%Cola%"), 4),
-                (Scholarship.title.ilike("%Violet%Richardson%"), 5),
-                (Scholarship.title.ilike("%National%Merit%"), 6),
-                (Scholarship.title.ilike("%Do%Something%"), 7),
-                (Scholarship.primary_image_url.isnot(None), 8),
-                else_=9,
-            )
-
             query = (
-                self.db.query(Scholarship)
+                self.read_db.query(Scholarship)
                 .filter(Scholarship.status == ScholarshipStatus.ACTIVE)
                 .filter(Scholarship.deadline != None)
                 .filter(Scholarship.deadline >= today)
                 .filter(Scholarship.deadline <= future_date)
-                .order_by(asc(priority_order))
+                .order_by(asc(Scholarship.priority_rank))
                 .order_by(asc(Scholarship.deadline))
                 .limit(limit)
             )
@@ -313,7 +540,7 @@ class ScholarshipService:
         """
 
         try:
-            query = self.db.query(Scholarship)
+            query = self.read_db.query(Scholarship)
 
             # Filter by active status
             if only_active:
@@ -328,19 +555,7 @@ class ScholarshipService:
             )
 
             # Apply priority ordering (same as your other methods)
-            priority_order = case(
-                (Scholarship.title.ilike("%Lowe%Educational%"), 1),
-                (Scholarship.title.ilike("%Target%Community%"), 2),
-                (Scholarship.title.ilike("%Google%Lime%"), 3),
-                (Scholarship.title.ilike("%Coca%Cola%"), 4),
-                (Scholarship.title.ilike("%Violet%Richardson%"), 5),
-                (Scholarship.title.ilike("%National%Merit%"), 6),
-                (Scholarship.title.ilike("%Do%Something%"), 7),
-                (Scholarship.primary_image_url.isnot(None), 8),
-                else_=9,
-            )
-
-            query = query.order_by(asc(priority_order))
+            query = query.order_by(asc(Scholarship.priority_rank))
 
             # Then order by amount (highest first)
             query = query.order_by(desc(Scholarship.amount_max))
@@ -362,10 +577,14 @@ class ScholarshipService:
     ) -> List[Scholarship]:
         """
         Find scholarships matching user profile criteria
-        (For future use when adding more matching logic)
 
-        Currently only uses GPA matching.
-        Future: Will add state, graduation year, major matching.
+        Uses the in-process matching engine (scholarship_matcher), which
+        filters and scores every active scholarship in one vectorized pass:
+        - GPA meets min_gpa (or no requirement)
+        - Deadline not passed
+        - for_academic_year unset or starting at/after graduation_year
+        - STEM/arts scholarships only for matching intended majors
+        Scholarships carry no geographic data yet, so `state` is unused.
 
         Args:
             gpa: User's GPA
@@ -375,49 +594,26 @@ class ScholarshipService:
             limit: Maximum number of results
 
         Returns:
-            List of matching scholarships
+            List of matching scholarships, best match first
         """
 
         try:
-            query = self.db.query(Scholarship)
-            query = query.filter(Scholarship.status == ScholarshipStatus.ACTIVE)
-
-            # GPA matching (if provided)
-            if gpa is not None:
-                query = query.filter(
-                    or_(Scholarship.min_gpa.is_(None), Scholarship.min_gpa <= gpa)
-                )
-
-            # Future: Add state-based matching
-            # if state:
-            #     query = query.filter(...)
-
-            # Future: Add graduation year matching
-            # if graduation_year:
-            #     query = query.filter(...)
-
-            # Future: Add major-based matching
-            # if intended_major:
-            #     query = query.filter(...)
-
-            # Apply priority ordering
-            priority_order = case(
-                (Scholarship.title.ilike("%Lowe%Educational%"), 1),
-                (Scholarship.title.ilike("%Target%Community%"), 2),
-                (Scholarship.title.ilike("%Google%Lime%"), 3),
-                (Scholarship.title.ilike("%Coca%Cola%"), 4),
-                (Scholarship.title.ilike("%Violet%Richardson%"), 5),
-                (Scholarship.title.ilike("%National%Merit%"), 6),
-                (Scholarship.title.ilike("%Do%Something%"), 7),
-                (Scholarship.primary_image_url.isnot(None), 8),
-                else_=9,
+            matches = scholarship_matcher.match(
+                self.read_db,
+                gpa=gpa,
+                graduation_year=graduation_year,
+                intended_major=intended_major,
+                limit=limit,
             )
+            if not matches:
+                return []
 
-            query = query.order_by(asc(priority_order))
-            query = query.order_by(desc(Scholarship.amount_max))
-            query = query.limit(limit)
-
-            return query.all()
+            ids = [scholarship_id for scholarship_id, _ in matches]
+            rows = (
+                self.read_db.query(Scholarship).filter(Scholarship.id.in_(ids)).all()
+            )
+            by_id = {scholarship.id: scholarship for scholarship in rows}
+            return [by_id[i] for i in ids if i in by_id]
 
         except Exception as e:
             logger.error(f"Error finding scholarships by profile: {str(e)}")
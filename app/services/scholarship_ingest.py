@@ -0,0 +1,205 @@
+# app/services/scholarship_ingest.py
+"""
+Bulk scholarship ingest.
+
+Rows are validated with ScholarshipCreate, deduplicated on
+(organization, title), streamed into a temp staging table with Postgres
+COPY and merged into scholarships with one INSERT ... ON CONFLICT.
+
+CLI (CSV with a header row of ScholarshipCreate field names):
+
+    python -m app.services.scholarship_ingest scholarships.csv
+"""
+
+import csv
+import io
+import logging
+import sys
+from typing import Any, Dict, Iterable, List, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.core.cache import invalidate_namespace
+from app.models.scholarship import Scholarship, compute_priority_rank
+from app.schemas.scholarship import BulkIngestResult, ScholarshipCreate
+
+logger = logging.getLogger(__name__)
+
+STAGING_TABLE = "scholarship_ingest"
+
+# Columns loaded from each row, in COPY order
+INGEST_COLUMNS = list(ScholarshipCreate.model_fields) + ["priority_rank"]
+
+# Enum columns are staged as text (member names) and cast on merge
+ENUM_COLUMNS = ("scholarship_type", "difficulty_level")
+
+# Errors echoed back in the result (the rejected count is always exact)
+MAX_REPORTED_ERRORS = 50
+
+
+def _pg_type(column_name: str) -> str:
+    """Staging column type (enums are staged as text)"""
+    if column_name in ENUM_COLUMNS:
+        return "text"
+    column = Scholarship.__table__.c[column_name]
+    return column.type.compile(dialect=postgresql.dialect())
+
+
+def _enum_type_name(column_name: str) -> str:
+    return Scholarship.__table__.c[column_name].type.name
+
+
+def _blank_to_none(row: Dict[str, Any]) -> Dict[str, Any]:
+    """CSV cells are strings; empty cells mean 'not provided'"""
+    return {
+        key.strip(): (None if isinstance(value, str) and not value.strip() else value)
+        for key, value in row.items()
+        if key
+    }
+
+
+class ScholarshipIngestService:
+    """COPY-based bulk upsert into scholarships"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def validate(
+        self, rows: Iterable[Dict[str, Any]]
+    ) -> Tuple[List[ScholarshipCreate], BulkIngestResult]:
+        """
+        Validate rows and deduplicate on (organization, title); the last
+        occurrence wins. Returns the rows to load and a partial result.
+        """
+        result = BulkIngestResult()
+        unique: Dict[Tuple[str, str], ScholarshipCreate] = {}
+
+        for line, row in enumerate(rows, start=1):
+            try:
+                scholarship = ScholarshipCreate(**_blank_to_none(row))
+            except (ValidationError, TypeError) as e:
+                result.rejected += 1
+                if len(result.errors) < MAX_REPORTED_ERRORS:
+                    result.errors.append({"row": line, "error": str(e)})
+                continue
+
+            # ScholarshipCreate strips the natural key (the ON CONFLICT target)
+            key = (scholarship.organization, scholarship.title)
+            if key in unique:
+                result.duplicates += 1
+            unique[key] = scholarship
+
+        return list(unique.values()), result
+
+    def _copy_rows(self, scholarships: List[ScholarshipCreate]) -> None:
+        """Stream rows into the staging table with COPY ... FROM STDIN"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for scholarship in scholarships:
+            values = scholarship.model_dump()
+            values["priority_rank"] = compute_priority_rank(
+                values["title"], values["primary_image_url"]
+            )
+            for column in ENUM_COLUMNS:
+                values[column] = values[column].name
+            # \N marks NULL so empty strings stay empty strings
+            writer.writerow(
+                "\\N" if values[c] is None else values[c] for c in INGEST_COLUMNS
+            )
+        buffer.seek(0)
+
+        cursor = self.db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {STAGING_TABLE} ({', '.join(INGEST_COLUMNS)}) "
+                "FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+                buffer,
+            )
+        finally:
+            cursor.close()
+
+    def _merge(self) -> Tuple[int, int]:
+        """Upsert staged rows; returns (inserted, updated)"""
+        selected = ", ".join(
+            f"{c}::{_enum_type_name(c)}" if c in ENUM_COLUMNS else c
+            for c in INGEST_COLUMNS
+        )
+        updates = ", ".join(
+            f"{c} = EXCLUDED.{c}"
+            for c in INGEST_COLUMNS
+            if c not in ("organization", "title")
+        )
+        rows = self.db.execute(
+            text(
+                f"""
+                INSERT INTO scholarships (
+                    {', '.join(INGEST_COLUMNS)}, status, verified, featured,
+                    views_count, applications_count, created_at
+                )
+                SELECT {selected}, 'ACTIVE', false, false, 0, 0, now()
+                FROM {STAGING_TABLE}
+                ON CONFLICT (organization, title) DO UPDATE
+                SET {updates}, updated_at = now()
+                RETURNING (xmax = 0) AS inserted
+                """
+            )
+        ).all()
+        inserted = sum(1 for (was_inserted,) in rows if was_inserted)
+        return inserted, len(rows) - inserted
+
+    def ingest(self, rows: Iterable[Dict[str, Any]]) -> BulkIngestResult:
+        """Validate, COPY and merge `rows` in one transaction"""
+        scholarships, result = self.validate(rows)
+        if not scholarships:
+            return result
+
+        columns = ", ".join(f"{c} {_pg_type(c)}" for c in INGEST_COLUMNS)
+        try:
+            # A caller's outer transaction may still hold an earlier one
+            self.db.execute(text(f"DROP TABLE IF EXISTS pg_temp.{STAGING_TABLE}"))
+            self.db.execute(
+                text(
+                    f"CREATE TEMP TABLE {STAGING_TABLE} ({columns}) ON COMMIT DROP"
+                )
+            )
+            self._copy_rows(scholarships)
+            result.inserted, result.updated = self._merge()
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        # Raw SQL bypasses the ORM hooks that drop cached catalog reads
+        invalidate_namespace("scholarships")
+        logger.info(
+            f"Scholarship ingest: {result.inserted} inserted, {result.updated} "
+            f"updated, {result.rejected} rejected, {result.duplicates} duplicates"
+        )
+        return result
+
+    def ingest_csv(self, lines: Iterable[str]) -> BulkIngestResult:
+        """ingest() for CSV text lines with a header row"""
+        return self.ingest(csv.DictReader(lines))
+
+
+if __name__ == "__main__":
+    from app.core.database import SessionLocal
+    from app.services.scholarship_matches import refresh_all_matches
+
+    logging.basicConfig(level=logging.INFO)
+    if len(sys.argv) != 2:
+        sys.exit("usage: python -m app.services.scholarship_ingest <file.csv>")
+
+    db = SessionLocal()
+    try:
+        with open(sys.argv[1], newline="", encoding="utf-8") as f:
+            ingest_result = ScholarshipIngestService(db).ingest_csv(f)
+    finally:
+        db.close()
+
+    print(ingest_result.model_dump_json(indent=2))
+    if ingest_result.inserted or ingest_result.updated:
+        refresh_all_matches()
@@ -0,0 +1,264 @@
+# app/services/scholarship_matches.py
+"""
+Precomputed per-user scholarship matches (user_scholarship_matches).
+
+Matches are computed with the in-process matching engine and stored so
+reads are one indexed lookup by user_id. Only the affected slice is
+recomputed:
+- a user, when their profile's matching fields change
+- the users holding a scholarship, or newly eligible for it with room in
+  (or a lower score at the bottom of) their top N, after it is created or
+  edited (a background task, see refresh_matches_for_scholarship)
+refresh_all() rebuilds every profile (batch job):
+
+    python -m app.services.scholarship_matches
+"""
+
+import logging
+from datetime import date, datetime
+from typing import Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import delete, func, insert, or_
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.profile import UserProfile
+from app.models.scholarship import Scholarship, ScholarshipStatus
+from app.models.scholarship_matches import UserScholarshipMatch
+from app.services.scholarship_matching import (
+    TYPE_REQUIREMENTS,
+    academic_year_start,
+    max_score,
+    profile_eligibility,
+    scholarship_matcher,
+    score_matches,
+)
+
+logger = logging.getLogger(__name__)
+
+# Profile fields that change a user's matches
+MATCH_FIELDS = ("gpa", "graduation_year", "intended_major")
+
+# Profiles refreshed per delete/insert round in refresh_for_scholarship
+REFRESH_BATCH_SIZE = 500
+
+
+class ScholarshipMatchService:
+    """Maintains and reads user_scholarship_matches"""
+
+    def __init__(self, db: Session, read_db: Optional[Session] = None):
+        self.db = db
+        self.read_db = read_db or db
+
+    def get_matches(
+        self, user_id: int, limit: int = 20
+    ) -> List[Tuple[Scholarship, float]]:
+        """A user's stored matches, best first (skips expired/inactive)"""
+        return (
+            self.read_db.query(Scholarship, UserScholarshipMatch.score)
+            .join(
+                UserScholarshipMatch,
+                UserScholarshipMatch.scholarship_id == Scholarship.id,
+            )
+            .filter(UserScholarshipMatch.user_id == user_id)
+            .filter(Scholarship.status == ScholarshipStatus.ACTIVE)
+            .filter(
+                or_(
+                    Scholarship.deadline.is_(None),
+                    Scholarship.deadline >= date.today(),
+                )
+            )
+            .order_by(UserScholarshipMatch.score.desc())
+            .limit(limit)
+            .all()
+        )
+
+    def get_or_compute_matches(
+        self, user_id: int, limit: int = 20
+    ) -> List[Tuple[Scholarship, float]]:
+        """
+        get_matches(), computing and storing the user's matches first if none
+        are stored yet (self.db must be the primary session)
+        """
+        matches = self.get_matches(user_id, limit=limit)
+        if not matches and self.refresh_user(user_id):
+            matches = self.get_matches(user_id, limit=limit)
+        return matches
+
+    def _replace(self, profiles: Iterable[UserProfile]) -> int:
+        """Recompute and store matches for `profiles`; returns rows written"""
+        profiles = list(profiles)
+        if not profiles:
+            return 0
+
+        arrays = scholarship_matcher.arrays(self.db)
+        now = datetime.utcnow()
+        rows = []
+        for profile in profiles:
+            matches = score_matches(
+                arrays,
+                gpa=profile.gpa,
+                graduation_year=profile.graduation_year,
+                intended_major=profile.intended_major,
+                limit=settings.SCHOLARSHIP_MATCHES_PER_USER,
+            )
+            rows.extend(
+                {
+                    "user_id": profile.user_id,
+                    "scholarship_id": scholarship_id,
+                    "score": score,
+                    "computed_at": now,
+                }
+                for scholarship_id, score in matches
+            )
+
+        self.db.execute(
+            delete(UserScholarshipMatch).where(
+                UserScholarshipMatch.user_id.in_([p.user_id for p in profiles])
+            )
+        )
+        if rows:
+            self.db.execute(insert(UserScholarshipMatch), rows)
+        self.db.commit()
+        return len(rows)
+
+    def refresh_user(self, user_id: int) -> int:
+        """Recompute one user's matches"""
+        profile = (
+            self.db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
+        )
+        if not profile:
+            return 0
+        return self._replace([profile])
+
+    def refresh_for_scholarship(self, scholarship_id: int) -> int:
+        """
+        Recompute matches for users affected by a created/edited scholarship:
+        those currently holding it, and those it is now eligible for whose
+        stored top N it could enter (set not full, or lowest stored score
+        below the scholarship's max_score(); every eligible user when there
+        is no bound). Returns the users refreshed.
+        """
+        affected: Set[int] = {
+            user_id
+            for (user_id,) in self.db.query(UserScholarshipMatch.user_id).filter(
+                UserScholarshipMatch.scholarship_id == scholarship_id
+            )
+        }
+
+        scholarship = (
+            self.db.query(Scholarship).filter(Scholarship.id == scholarship_id).first()
+        )
+        if (
+            scholarship
+            and scholarship.status == ScholarshipStatus.ACTIVE
+            and (scholarship.deadline is None or scholarship.deadline >= date.today())
+        ):
+            eligible = self._eligible_user_ids(scholarship)
+            bound = max_score(scholarship_matcher.arrays(self.db), scholarship_id)
+            if bound is not None:
+                eligible -= self._saturated(bound)
+            affected |= eligible
+
+        user_ids = sorted(affected)
+        for start in range(0, len(user_ids), REFRESH_BATCH_SIZE):
+            batch = user_ids[start : start + REFRESH_BATCH_SIZE]
+            self._replace(
+                self.db.query(UserProfile).filter(UserProfile.user_id.in_(batch))
+            )
+        return len(user_ids)
+
+    def _saturated(self, score: float) -> Set[int]:
+        """
+        Users whose stored set is full of live scholarships scoring at least
+        `score`: a scholarship scoring at most `score` can't enter their top
+        N. Expired or inactive entries don't count, since a recompute drops
+        them and makes room.
+        """
+        return {
+            user_id
+            for (user_id,) in self.db.query(UserScholarshipMatch.user_id)
+            .join(Scholarship, Scholarship.id == UserScholarshipMatch.scholarship_id)
+            .filter(Scholarship.status == ScholarshipStatus.ACTIVE)
+            .filter(
+                or_(
+                    Scholarship.deadline.is_(None),
+                    Scholarship.deadline >= date.today(),
+                )
+            )
+            .group_by(UserScholarshipMatch.user_id)
+            .having(
+                func.count() >= settings.SCHOLARSHIP_MATCHES_PER_USER,
+                func.min(UserScholarshipMatch.score) >= score,
+            )
+        }
+
+    def _eligible_user_ids(self, scholarship: Scholarship) -> Set[int]:
+        """Users whose profile passes the scholarship's eligibility rules"""
+        query = self.db.query(UserProfile.user_id, UserProfile.intended_major)
+        if scholarship.min_gpa is not None:
+            query = query.filter(
+                or_(UserProfile.gpa.is_(None), UserProfile.gpa >= scholarship.min_gpa)
+            )
+        year_start = academic_year_start(scholarship.for_academic_year)
+        if year_start:
+            query = query.filter(
+                or_(
+                    UserProfile.graduation_year.is_(None),
+                    UserProfile.graduation_year <= year_start,
+                )
+            )
+
+        requires = TYPE_REQUIREMENTS.get(scholarship.scholarship_type, 0)
+        return {
+            user_id
+            for user_id, intended_major in query
+            if not requires & ~profile_eligibility(intended_major)
+        }
+
+    def refresh_all(self, batch_size: int = 500) -> int:
+        """Rebuild matches for every profile; returns profiles processed"""
+        processed = 0
+        last_id = 0
+        while True:
+            profiles = (
+                self.db.query(UserProfile)
+                .filter(UserProfile.id > last_id)
+                .order_by(UserProfile.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not profiles:
+                break
+            self._replace(profiles)
+            processed += len(profiles)
+            last_id = profiles[-1].id
+        logger.info(f"Rebuilt scholarship matches for {processed} profiles")
+        return processed
+
+
+def refresh_all_matches() -> int:
+    """refresh_all() on its own session (background tasks, CLI)"""
+    from app.core.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return ScholarshipMatchService(db).refresh_all()
+    finally:
+        db.close()
+
+
+def refresh_matches_for_scholarship(scholarship_id: int) -> int:
+    """refresh_for_scholarship() on its own session (background tasks)"""
+    from app.core.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return ScholarshipMatchService(db).refresh_for_scholarship(scholarship_id)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    refresh_all_matches()
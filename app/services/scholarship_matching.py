@@ -0,0 +1,322 @@
+# app/services/scholarship_matching.py
+"""
+In-process scholarship matching engine.
+
+Active scholarships are loaded once into NumPy arrays (min GPA, amount
+range, deadline ordinal, type code, academic year, eligibility bitmask) so
+a profile is filtered and scored against the whole catalog in one
+vectorized pass. The arrays are rebuilt after scholarship writes (via the
+catalog cache invalidation hooks) or when older than max_age_seconds.
+"""
+
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.core.cache import register_cache
+from app.core.config import settings
+from app.models.scholarship import (
+    PRIORITY_PINS,
+    Scholarship,
+    ScholarshipStatus,
+    ScholarshipType,
+)
+
+logger = logging.getLogger(__name__)
+
+# Scholarship type <-> array code
+TYPE_CODES = {
+    scholarship_type: code for code, scholarship_type in enumerate(ScholarshipType)
+}
+
+# Eligibility bits: a scholarship requires some bits, a profile holds some
+ELIGIBLE_STEM = 1 << 0
+ELIGIBLE_ARTS = 1 << 1
+ELIGIBLE_ALL = ELIGIBLE_STEM | ELIGIBLE_ARTS
+
+# Field-restricted scholarship types and the bit a profile needs for them
+TYPE_REQUIREMENTS = {
+    ScholarshipType.STEM: ELIGIBLE_STEM,
+    ScholarshipType.ARTS: ELIGIBLE_ARTS,
+}
+
+# Intended-major keywords (matched at word starts) that grant each bit
+MAJOR_KEYWORDS = {
+    ELIGIBLE_STEM: (
+        "engineer",
+        "comput",
+        "math",
+        "statistic",
+        "science",
+        "biolog",
+        "chemi",
+        "physics",
+        "technolog",
+        "data",
+        "software",
+        "nursing",
+        "pre-med",
+        "medicine",
+    ),
+    ELIGIBLE_ARTS: (
+        "arts",
+        "fine art",
+        "studio art",
+        "art history",
+        "music",
+        "theater",
+        "theatre",
+        "design",
+        "film",
+        "dance",
+        "drama",
+        "photograph",
+        "creative writing",
+        "animation",
+    ),
+}
+
+_MAJOR_PATTERNS = {
+    bit: re.compile(r"\b(" + "|".join(re.escape(k) for k in keywords) + ")", re.I)
+    for bit, keywords in MAJOR_KEYWORDS.items()
+}
+
+# Deadline sentinel for scholarships without one (always open)
+NO_DEADLINE = date.max.toordinal()
+
+# Score weights: pinned scholarships first, then award size, field match
+# and an approaching deadline
+PIN_WEIGHT = 2.0
+AFFINITY_WEIGHT = 0.5
+URGENCY_WEIGHT = 0.25
+URGENCY_WINDOW_DAYS = 365
+
+
+def profile_eligibility(intended_major: Optional[str]) -> int:
+    """Eligibility bits for an intended major (all bits when unknown)"""
+    if not intended_major or not intended_major.strip():
+        return ELIGIBLE_ALL
+    bits = 0
+    for bit, pattern in _MAJOR_PATTERNS.items():
+        if pattern.search(intended_major):
+            bits |= bit
+    return bits
+
+
+def academic_year_start(academic_year: Optional[str]) -> int:
+    """First year of "2027-2028" style values; 0 when unset/unparseable"""
+    match = re.match(r"\s*(\d{4})", academic_year or "")
+    return int(match.group(1)) if match else 0
+
+
+@dataclass(frozen=True)
+class CatalogArrays:
+    """Column arrays for the active catalog (row i = one scholarship)"""
+
+    ids: np.ndarray  # int64
+    min_gpa: np.ndarray  # float64, 0.0 = no requirement
+    amount_min: np.ndarray  # int64
+    amount_max: np.ndarray  # int64
+    deadline: np.ndarray  # int64 date ordinals, NO_DEADLINE if none
+    type_code: np.ndarray  # int8, see TYPE_CODES
+    year_start: np.ndarray  # int16, 0 = any academic year
+    requires: np.ndarray  # uint8 eligibility bits a profile must hold
+    pinned: np.ndarray  # bool
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def build_arrays(rows) -> CatalogArrays:
+    """Build CatalogArrays from (id, min_gpa, amount_min, amount_max,
+    deadline, scholarship_type, for_academic_year, priority_rank) rows"""
+    rows = list(rows)
+    return CatalogArrays(
+        ids=np.array([r[0] for r in rows], dtype=np.int64),
+        min_gpa=np.array(
+            [float(r[1]) if r[1] is not None else 0.0 for r in rows],
+            dtype=np.float64,
+        ),
+        amount_min=np.array([r[2] or 0 for r in rows], dtype=np.int64),
+        amount_max=np.array([r[3] or 0 for r in rows], dtype=np.int64),
+        deadline=np.array(
+            [r[4].toordinal() if r[4] else NO_DEADLINE for r in rows],
+            dtype=np.int64,
+        ),
+        type_code=np.array([TYPE_CODES[r[5]] for r in rows], dtype=np.int8),
+        year_start=np.array(
+            [academic_year_start(r[6]) for r in rows], dtype=np.int16
+        ),
+        requires=np.array(
+            [TYPE_REQUIREMENTS.get(r[5], 0) for r in rows], dtype=np.uint8
+        ),
+        pinned=np.array([r[7] <= len(PRIORITY_PINS) for r in rows], dtype=bool),
+    )
+
+
+def score_matches(
+    arrays: CatalogArrays,
+    gpa: Optional[float] = None,
+    graduation_year: Optional[int] = None,
+    intended_major: Optional[str] = None,
+    min_amount: Optional[int] = None,
+    scholarship_type: Optional[ScholarshipType] = None,
+    today: Optional[date] = None,
+    limit: int = 20,
+) -> List[Tuple[int, float]]:
+    """
+    Filter and score every scholarship against a profile in one pass.
+    Returns the top `limit` (scholarship_id, score), best first.
+    """
+    if len(arrays) == 0:
+        return []
+
+    today_ordinal = (today or date.today()).toordinal()
+    profile_bits = profile_eligibility(intended_major)
+
+    eligible = arrays.deadline >= today_ordinal
+    # No required bits the profile lacks
+    eligible &= (arrays.requires & ~np.uint8(profile_bits)) == 0
+    if gpa is not None:
+        eligible &= arrays.min_gpa <= gpa
+    if graduation_year is not None:
+        eligible &= (arrays.year_start == 0) | (arrays.year_start >= graduation_year)
+    if min_amount is not None:
+        eligible &= arrays.amount_max >= min_amount
+    if scholarship_type is not None:
+        eligible &= arrays.type_code == TYPE_CODES[ScholarshipType(scholarship_type)]
+
+    candidates = np.flatnonzero(eligible)
+    if candidates.size == 0:
+        return []
+
+    amount = np.log1p(arrays.amount_max[candidates].astype(np.float64))
+    score = amount / max(amount.max(), 1.0)
+    score += PIN_WEIGHT * arrays.pinned[candidates]
+    if profile_bits != ELIGIBLE_ALL:
+        score += AFFINITY_WEIGHT * ((arrays.requires[candidates] & profile_bits) > 0)
+    days_left = arrays.deadline[candidates] - today_ordinal
+    score += URGENCY_WEIGHT * np.clip(1 - days_left / URGENCY_WINDOW_DAYS, 0, 1)
+
+    # Top-N without sorting the whole candidate set; ties broken by id
+    ids = arrays.ids[candidates]
+    if candidates.size > limit:
+        top = np.argpartition(-score, limit - 1)[:limit]
+    else:
+        top = np.arange(candidates.size)
+    order = top[np.lexsort((ids[top], -score[top]))]
+
+    return [(int(ids[i]), round(float(score[i]), 4)) for i in order]
+
+
+def max_score(
+    arrays: CatalogArrays, scholarship_id: int, today: Optional[date] = None
+) -> Optional[float]:
+    """
+    Upper bound on the score_matches() score of one scholarship for any
+    profile. The award term is normalized by the largest other award open
+    to every profile (a floor under each profile's own maximum), and the
+    field-affinity bonus is assumed.
+
+    None when the scholarship isn't in the active catalog, or when its
+    award is above that floor: it may then become some profiles' largest
+    award, which lowers every other score they have stored, so a bound
+    compared against stored scores proves nothing.
+    """
+    found = np.flatnonzero(arrays.ids == scholarship_id)
+    if found.size == 0:
+        return None
+    index = found[0]
+
+    today_ordinal = (today or date.today()).toordinal()
+    open_to_all = (
+        (arrays.deadline >= today_ordinal)
+        & (arrays.requires == 0)
+        & (arrays.min_gpa == 0)
+        & (arrays.year_start == 0)
+    )
+    open_to_all[index] = False
+    amount = np.log1p(arrays.amount_max.astype(np.float64))
+    floor = max(amount[open_to_all].max(initial=0.0), 1.0)
+    if amount[index] > floor:
+        return None
+
+    score = amount[index] / floor + PIN_WEIGHT * arrays.pinned[index]
+    if arrays.requires[index]:
+        score += AFFINITY_WEIGHT
+    days_left = arrays.deadline[index] - today_ordinal
+    score += URGENCY_WEIGHT * min(max(1 - days_left / URGENCY_WINDOW_DAYS, 0), 1)
+    return float(score)
+
+
+class ScholarshipMatcher:
+    """
+    Holds the active catalog as CatalogArrays and reloads it when stale.
+    Registered with app.core.cache so scholarship writes mark it stale.
+    """
+
+    def __init__(self, max_age_seconds: float = 300):
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        self._arrays: Optional[CatalogArrays] = None
+        self._loaded_at = 0.0
+
+    def invalidate(self, namespace: str) -> None:
+        if namespace == "scholarships":
+            self._arrays = None
+
+    def clear(self) -> None:
+        self._arrays = None
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._arrays is not None
+            and time.monotonic() - self._loaded_at < self.max_age_seconds
+        )
+
+    def refresh(self, db: Session) -> CatalogArrays:
+        """Reload the active catalog from the database"""
+        rows = (
+            db.query(
+                Scholarship.id,
+                Scholarship.min_gpa,
+                Scholarship.amount_min,
+                Scholarship.amount_max,
+                Scholarship.deadline,
+                Scholarship.scholarship_type,
+                Scholarship.for_academic_year,
+                Scholarship.priority_rank,
+            )
+            .filter(Scholarship.status == ScholarshipStatus.ACTIVE)
+            .all()
+        )
+        arrays = build_arrays(rows)
+        self._arrays, self._loaded_at = arrays, time.monotonic()
+        logger.info(f"Scholarship matcher loaded {len(arrays)} scholarships")
+        return arrays
+
+    def arrays(self, db: Session) -> CatalogArrays:
+        """Current arrays, reloading once (per process) when stale"""
+        with self._lock:
+            arrays = self._arrays
+            if arrays is not None and self._is_fresh():
+                return arrays
+            return self.refresh(db)
+
+    def match(self, db: Session, limit: int = 20, **profile) -> List[Tuple[int, float]]:
+        """Top `limit` (scholarship_id, score) for a profile"""
+        return score_matches(self.arrays(db), limit=limit, **profile)
+
+
+# Shared per-process matcher; scholarship writes mark it stale
+# (see app.core.cache)
+scholarship_matcher = register_cache(
+    ScholarshipMatcher(settings.SCHOLARSHIP_MATCHER_MAX_AGE_SECONDS)
+)
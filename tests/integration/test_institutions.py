@@ -18,6 +18,8 @@ from decimal import Decimal
 from app.models.institution import ControlType
 
 from app.models.institution import Institution
+from app.schemas.institution import InstitutionSummary
+from app.services.institution_snapshot import data_version, institution_snapshot
 
 
 @pytest.mark.integration
@@ -337,6 +339,52 @@ class TestInstitutionStatistics:
                 data.get("by_control_type") or data.get("control_types"), (list, dict)
             )
 
+    def test_statistics_served_from_snapshot(
+        self, client: TestClient, test_institution: Institution
+    ):
+        """A repeat request reads the mapped snapshot without queries"""
+        first = client.get("/api/v1/institutions/stats/summary")
+        second = client.get("/api/v1/institutions/stats/summary")
+
+        assert first.json() == second.json()
+        assert first.json()["by_state"]["MA"] >= 1
+        assert int(second.headers["X-DB-Queries"]) == 0
+
+    def test_refresh_publishes_institution_writes(
+        self, client: TestClient, db_session: Session, test_institution: Institution
+    ):
+        """Requests serve the published snapshot until the refresh task runs"""
+        before = client.get("/api/v1/institutions/stats/summary").json()
+
+        db_session.add(
+            Institution(
+                ipeds_id=900301,
+                name="Snapshot College",
+                city="Burlington",
+                state="VT",
+                control_type=ControlType.PUBLIC,
+            )
+        )
+        db_session.commit()
+        assert client.get("/api/v1/institutions/stats/summary").json() == before
+
+        institution_snapshot.refresh(db_session)
+
+        after = client.get("/api/v1/institutions/stats/summary").json()
+        assert after["total_institutions"] == before["total_institutions"] + 1
+        assert after["by_state"]["VT"] == before["by_state"].get("VT", 0) + 1
+
+    def test_version_tracks_in_place_edits(
+        self, db_session: Session, test_institution: Institution
+    ):
+        """Edits that leave updated_at alone still change the data version"""
+        before = data_version(db_session)
+        test_institution.city = "Somerville"
+        test_institution.updated_at = test_institution.updated_at
+        db_session.flush()
+
+        assert data_version(db_session) != before
+
 
 @pytest.mark.integration
 class TestInstitutionDataIntegrity:
@@ -442,3 +490,444 @@ class TestInstitutionEdgeCases:
 
         # Should reject invalid limit
         assert response.status_code == 422
+
+
+@pytest.mark.integration
+class TestInstitutionKeysetPagination:
+    """Test cursor (keyset) pagination of the institution listing"""
+
+    @pytest.fixture
+    def keyset_rows(self, make_institution):
+        # Repeated scores and names exercise every tie-breaker in the sort key
+        for i, (name, score) in enumerate(
+            [
+                ("Alpha College", 90),
+                ("Beta College", 90),
+                ("Beta College", 90),
+                ("Gamma College", 75),
+                ("Delta College", 60),
+            ]
+        ):
+            make_institution(
+                900100 + i, name, state="WY", data_completeness_score=score
+            )
+
+    def test_cursor_pages_match_offset_order(self, client: TestClient, keyset_rows):
+        """Walking next_cursor visits every row once, in the offset order"""
+        offset_data = client.get("/api/v1/institutions/?state=WY&limit=100").json()
+        expected = [item["id"] for item in offset_data["items"]]
+
+        first = client.get("/api/v1/institutions/?state=WY&limit=2").json()
+        seen = [item["id"] for item in first["items"]]
+        cursor = first["next_cursor"]
+        while cursor:
+            response = client.get(
+                f"/api/v1/institutions/?state=WY&limit=2&cursor={cursor}"
+            )
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total"] is None
+            seen.extend(item["id"] for item in data["items"])
+            cursor = data["next_cursor"]
+
+        assert seen == expected
+        assert len(seen) == 5
+
+    def test_last_page_has_no_cursor(self, client: TestClient, keyset_rows):
+        """The final page reports has_more false and no next_cursor"""
+        data = client.get("/api/v1/institutions/?state=WY&limit=10").json()
+        assert data["has_more"] is False
+        assert data["next_cursor"] is None
+
+    def test_invalid_cursor(self, client: TestClient):
+        """A malformed cursor is a client error"""
+        response = client.get("/api/v1/institutions/?cursor=not-a-cursor")
+        assert response.status_code == 400
+
+
+@pytest.mark.integration
+class TestInstitutionListingTotals:
+    """Test cached and estimated totals on the institution listing"""
+
+    def test_total_is_cached_per_filter(self, client: TestClient, make_institution):
+        """A repeat request skips the COUNT query"""
+        make_institution(900201, state="VT")
+
+        first = client.get("/api/v1/institutions/?state=VT")
+        second = client.get("/api/v1/institutions/?state=vt")
+
+        assert first.json()["total"] == second.json()["total"] == 1
+        assert int(second.headers["X-DB-Queries"]) == (
+            int(first.headers["X-DB-Queries"]) - 1
+        )
+
+    def test_catalog_write_invalidates_total(
+        self, client: TestClient, make_institution
+    ):
+        """Committing an institution drops cached institution totals"""
+        make_institution(900202, state="VT")
+        assert client.get("/api/v1/institutions/?state=VT").json()["total"] == 1
+
+        make_institution(900203, state="VT")
+        assert client.get("/api/v1/institutions/?state=VT").json()["total"] == 2
+
+    def test_estimate_mode(self, client: TestClient, make_institution, monkeypatch):
+        """count=estimate reports a planner estimate for broad filters"""
+        monkeypatch.setattr(
+            "app.core.pagination.settings.COUNT_ESTIMATE_EXACT_BELOW", 0
+        )
+        make_institution(900204, state="VT")
+
+        data = client.get("/api/v1/institutions/?count=estimate").json()
+        assert data["total_estimated"] is True
+        assert isinstance(data["total"], int)
+
+    def test_estimate_mode_counts_small_results_exactly(
+        self, client: TestClient, make_institution
+    ):
+        """Estimates below the threshold fall back to an exact count"""
+        make_institution(900205, state="VT")
+
+        data = client.get("/api/v1/institutions/?state=VT&count=estimate").json()
+        assert data["total_estimated"] is False
+        assert data["total"] == 1
+
+    def test_invalid_count_mode(self, client: TestClient):
+        response = client.get("/api/v1/institutions/?count=approximate")
+        assert response.status_code == 422
+
+
+@pytest.mark.integration
+class TestInstitutionTrigramSearch:
+    """Test trigram name/city search"""
+
+    def test_tolerates_typos(self, client: TestClient, make_institution):
+        """A misspelled name still finds the institution"""
+        make_institution(900301, "Quillfeather University", city="Keene", state="NH")
+
+        response = client.get("/api/v1/institutions/search?q=quilfeathr")
+        assert response.status_code == 200
+        names = [item["name"] for item in response.json()["items"]]
+        assert "Quillfeather University" in names
+
+    def test_matches_city(self, client: TestClient, make_institution):
+        make_institution(
+            900302, "Lakes Region College", city="Wolfeborough", state="NH"
+        )
+
+        data = client.get("/api/v1/institutions/search?q=wolfeborough").json()
+        assert data["items"][0]["name"] == "Lakes Region College"
+
+    def test_ranked_by_similarity(self, client: TestClient, make_institution):
+        make_institution(900303, "Brindlewood College", city="Keene", state="NH")
+        make_institution(900304, "Brindlewoods Institute", city="Keene", state="NH")
+
+        items = client.get(
+            "/api/v1/institutions/search?q=brindlewood college&state=NH"
+        ).json()["items"]
+        assert items[0]["name"] == "Brindlewood College"
+        assert items[0]["similarity"] >= items[1]["similarity"]
+
+    def test_returns_summary_fields(self, client: TestClient, make_institution):
+        make_institution(900305, "Summaryfield College", city="Keene", state="NH")
+
+        item = client.get("/api/v1/institutions/search?q=summaryfield").json()[
+            "items"
+        ][0]
+        assert item["ipeds_id"] == 900305
+        assert "tuition_private" not in item
+        assert "similarity" in item
+
+    def test_query_too_short(self, client: TestClient):
+        response = client.get("/api/v1/institutions/search?q=a")
+        assert response.status_code == 422
+
+
+@pytest.mark.integration
+class TestInstitutionMultiCriteriaFilter:
+    """Test InstitutionSearchFilter criteria on the listing"""
+
+    @pytest.fixture
+    def filter_rows(self, make_institution):
+        # name, control, locale, tuition, acceptance, SAT math/reading, ACT
+        rows = [
+            (
+                "Filter A",
+                ControlType.PUBLIC,
+                "City: Large",
+                9000,
+                80,
+                (500, 600),
+                (20, 26),
+            ),
+            (
+                "Filter B",
+                ControlType.PUBLIC,
+                "Rural: Fringe",
+                12000,
+                45,
+                (650, 750),
+                (28, 33),
+            ),
+            (
+                "Filter C",
+                ControlType.PRIVATE_NONPROFIT,
+                "City: Small",
+                52000,
+                12,
+                (720, 780),
+                (32, 35),
+            ),
+        ]
+        for i, (name, control, locale, tuition, rate, sat, act) in enumerate(rows):
+            make_institution(
+                900400 + i,
+                name,
+                state="ND",
+                control_type=control,
+                size_category="Small",
+                locale=locale,
+                tuition_in_state=Decimal(tuition),
+                tuition_out_of_state=Decimal(tuition * 2),
+                acceptance_rate=Decimal(rate),
+                sat_math_25th=sat[0] - 50,
+                sat_math_75th=sat[0] + 50,
+                sat_reading_25th=sat[1] - 50,
+                sat_reading_75th=sat[1] + 50,
+                act_composite_25th=act[0],
+                act_composite_75th=act[1],
+            )
+
+    def _names(self, client: TestClient, **params) -> list:
+        response = client.get("/api/v1/institutions/", params={"state": "ND", **params})
+        assert response.status_code == 200
+        return sorted(item["name"] for item in response.json()["items"])
+
+    def test_control_type_and_locale(self, client: TestClient, filter_rows):
+        assert self._names(client, control_type="PUBLIC") == ["Filter A", "Filter B"]
+        assert self._names(client, locale="City") == ["Filter A", "Filter C"]
+        assert self._names(client, size_category="Small", locale="Rural") == [
+            "Filter B"
+        ]
+
+    def test_tuition_range(self, client: TestClient, filter_rows):
+        assert self._names(client, max_tuition=15000) == ["Filter A", "Filter B"]
+        out_of_state = {"tuition_residency": "out_of_state"}
+        assert self._names(
+            client, min_tuition=20000, max_tuition=30000, **out_of_state
+        ) == ["Filter B"]
+
+    def test_acceptance_rate_range(self, client: TestClient, filter_rows):
+        assert self._names(client, max_acceptance_rate=50) == ["Filter B", "Filter C"]
+        assert self._names(client, min_acceptance_rate=40, max_acceptance_rate=50) == [
+            "Filter B"
+        ]
+
+    def test_test_score_bands(self, client: TestClient, filter_rows):
+        # Combined bands: A 1000-1200, B 1300-1500, C 1400-1600
+        assert self._names(client, sat_score=1450) == ["Filter B", "Filter C"]
+        assert self._names(client, act_score=22) == ["Filter A"]
+
+    def test_keyset_walk_with_custom_sort(self, client: TestClient, filter_rows):
+        params = {"state": "ND", "sort_by": "name", "sort_order": "desc", "limit": 1}
+
+        names = []
+        cursor = None
+        while True:
+            response = client.get(
+                "/api/v1/institutions/",
+                params={**params, **({"cursor": cursor} if cursor else {})},
+            )
+            data = response.json()
+            names.extend(item["name"] for item in data["items"])
+            cursor = data["next_cursor"]
+            if not cursor:
+                break
+
+        assert names == ["Filter C", "Filter B", "Filter A"]
+
+    def test_cursor_from_other_sort_is_rejected(self, client: TestClient, filter_rows):
+        cursor = client.get("/api/v1/institutions/?state=ND&limit=1").json()[
+            "next_cursor"
+        ]
+
+        response = client.get(
+            "/api/v1/institutions/",
+            params={"state": "ND", "sort_by": "name", "cursor": cursor},
+        )
+        assert response.status_code == 400
+
+    def test_invalid_score(self, client: TestClient):
+        response = client.get("/api/v1/institutions/?sat_score=1700")
+        assert response.status_code == 422
+
+
+@pytest.mark.integration
+class TestInstitutionCostListing:
+    """Test precomputed cost of attendance and the cost-sorted listing"""
+
+    @pytest.fixture
+    def cost_rows(self, make_institution):
+        # In-state total 20000 / out-of-state 45000 (room + board)
+        make_institution(
+            900501,
+            "Cost Home U",
+            state="SD",
+            tuition_in_state=Decimal("10000"),
+            tuition_out_of_state=Decimal("35000"),
+            room_cost=Decimal("6000"),
+            board_cost=Decimal("4000"),
+        )
+        # 30000 for everyone (private tuition + combined room and board)
+        make_institution(
+            900502,
+            "Cost Private College",
+            state="MT",
+            tuition_private=Decimal("18000"),
+            room_and_board=Decimal("12000"),
+        )
+        # In-state 15000 / out-of-state 25000, but not in the student's state
+        make_institution(
+            900503,
+            "Cost Away U",
+            state="MT",
+            tuition_in_state=Decimal("15000"),
+            tuition_out_of_state=Decimal("25000"),
+        )
+        # No tuition data: left out of the cost listing
+        make_institution(900504, "Cost Unknown U", state="MT")
+
+    def test_costs_are_stored(self, db_session: Session, make_institution):
+        institution = make_institution(
+            900505,
+            "Cost Stored U",
+            state="SD",
+            tuition_in_state=Decimal("8000"),
+            tuition_out_of_state=Decimal("20000"),
+            room_and_board=Decimal("9000"),
+        )
+        assert institution.cost_in_state == Decimal("17000")
+        assert institution.cost_out_of_state == Decimal("29000")
+
+        institution.tuition_in_state = Decimal("9000")
+        db_session.commit()
+        db_session.refresh(institution)
+        assert institution.cost_in_state == Decimal("18000")
+
+    def test_sorted_by_cost_for_residency(self, client: TestClient, cost_rows):
+        data = client.get(
+            "/api/v1/institutions/",
+            params={
+                "search_query": "Cost",
+                "sort_by": "cost",
+                "sort_order": "asc",
+                "residency_state": "sd",
+            },
+        ).json()
+
+        assert [item["name"] for item in data["items"]] == [
+            "Cost Home U",
+            "Cost Away U",
+            "Cost Private College",
+        ]
+        assert [Decimal(str(i["cost_of_attendance"])) for i in data["items"]] == [
+            Decimal("20000"),
+            Decimal("25000"),
+            Decimal("30000"),
+        ]
+        assert data["total"] == 3
+
+    def test_cost_keyset_walk(self, client: TestClient, cost_rows):
+        params = {
+            "search_query": "Cost",
+            "sort_by": "cost",
+            "sort_order": "desc",
+            "residency_state": "SD",
+            "limit": 1,
+        }
+
+        names = []
+        cursor = None
+        while True:
+            data = client.get(
+                "/api/v1/institutions/",
+                params={**params, **({"cursor": cursor} if cursor else {})},
+            ).json()
+            names.extend(item["name"] for item in data["items"])
+            cursor = data["next_cursor"]
+            if not cursor:
+                break
+
+        assert names == ["Cost Private College", "Cost Away U", "Cost Home U"]
+
+
+@pytest.mark.integration
+class TestInstitutionSummaryView:
+    """Test the slim view=summary listing"""
+
+    def test_returns_summary_fields_only(self, client: TestClient, make_institution):
+        make_institution(
+            900601,
+            "Slim Placeholder U",
+            state="ND",
+            primary_image_url="/images/default-institution.jpg",
+        )
+
+        data = client.get(
+            "/api/v1/institutions/", params={"state": "ND", "view": "summary"}
+        ).json()
+
+        assert data["total"] == 1
+        item = data["items"][0]
+        assert set(item) == set(InstitutionSummary.model_fields)
+        assert item["name"] == "Slim Placeholder U"
+        assert item["primary_image_url"] is None
+
+    def test_matches_full_view_order(self, client: TestClient, make_institution):
+        for offset, name in enumerate(["Slim A", "Slim B", "Slim C"]):
+            make_institution(900610 + offset, name, state="ND")
+        params = {"state": "ND", "sort_by": "name", "sort_order": "desc"}
+
+        full = client.get("/api/v1/institutions/", params=params).json()
+        slim = client.get(
+            "/api/v1/institutions/", params={**params, "view": "summary"}
+        ).json()
+
+        assert [i["id"] for i in slim["items"]] == [i["id"] for i in full["items"]]
+
+    def test_cost_keyset_walk(self, client: TestClient, make_institution):
+        for offset, tuition in enumerate([30000, 10000, 20000]):
+            make_institution(
+                900620 + offset,
+                f"Slim Cost {offset}",
+                state="ND",
+                tuition_in_state=Decimal(tuition),
+                tuition_out_of_state=Decimal(tuition),
+            )
+        params = {
+            "state": "ND",
+            "sort_by": "cost",
+            "sort_order": "asc",
+            "view": "summary",
+            "limit": 1,
+        }
+
+        costs = []
+        cursor = None
+        while True:
+            data = client.get(
+                "/api/v1/institutions/",
+                params={**params, **({"cursor": cursor} if cursor else {})},
+            ).json()
+            costs.extend(
+                Decimal(str(item["cost_of_attendance"])) for item in data["items"]
+            )
+            cursor = data["next_cursor"]
+            if not cursor:
+                break
+
+        assert costs == [Decimal("10000"), Decimal("20000"), Decimal("30000")]
+
+    def test_invalid_view(self, client: TestClient):
+        response = client.get("/api/v1/institutions/", params={"view": "tiny"})
+        assert response.status_code == 422
@@ -9,16 +9,27 @@ Tests cover:
 - File uploads (headshot, resume)
 - Resume parsing
 - Matching institutions
+- Precomputed scholarship matches
+- Admissions fit (reach/match/safety)
 - Profile validation
 """
 
 import pytest
 from starlette.testclient import TestClient
 from sqlalchemy.orm import Session
+from datetime import datetime, timedelta
 import io
 
+from app.api.v1 import scholarships
 from app.models.user import User
 from app.models.profile import UserProfile
+from app.models.scholarship_matches import UserScholarshipMatch
+from app.schemas.scholarship import ScholarshipCreate
+from app.services.scholarship import ScholarshipService
+from app.services.scholarship_matches import ScholarshipMatchService
+from app.services.institution_directory import InstitutionDirectoryService
+from app.core.cache import clear_caches
+from app.core.config import settings
 
 
 @pytest.mark.integration
@@ -347,3 +358,390 @@ class TestMatchingInstitutions:
         )
 
         assert response.status_code == 200
+
+    def _prefer(self, db_session: Session, profile: UserProfile, state: str):
+        profile.location_preference = state
+        db_session.commit()
+
+    def test_directory_is_cached(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_profile: UserProfile,
+        db_session: Session,
+        make_institution,
+    ):
+        """A repeat request skips the institution query"""
+        make_institution(900701, "Directory B", state="WY")
+        make_institution(900702, "Directory A", state="WY")
+        self._prefer(db_session, test_profile, "WY")
+
+        url = "/api/v1/profiles/me/matching-institutions"
+        first = client.get(url, headers=auth_headers)
+        second = client.get(url, headers=auth_headers)
+
+        assert first.json() == second.json()
+        assert first.json()["total"] == 2
+        assert [i["name"] for i in first.json()["institutions"]] == [
+            "Directory A",
+            "Directory B",
+        ]
+        assert int(second.headers["X-DB-Queries"]) == (
+            int(first.headers["X-DB-Queries"]) - 1
+        )
+
+    def test_institution_write_invalidates_directory(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_profile: UserProfile,
+        db_session: Session,
+        make_institution,
+    ):
+        make_institution(900711, "Directory One", state="WY")
+        self._prefer(db_session, test_profile, "WY")
+        url = "/api/v1/profiles/me/matching-institutions"
+        assert client.get(url, headers=auth_headers).json()["total"] == 1
+
+        make_institution(900712, "Directory Two", state="WY")
+
+        assert client.get(url, headers=auth_headers).json()["total"] == 2
+
+    def test_limit_beyond_directory_size(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_profile: UserProfile,
+        db_session: Session,
+        monkeypatch,
+        make_institution,
+    ):
+        """Limits larger than a directory are counted and limited in SQL"""
+        monkeypatch.setattr(settings, "INSTITUTION_DIRECTORY_SIZE", 1)
+        for offset in range(3):
+            make_institution(900720 + offset, f"Directory {offset}", state="WY")
+        self._prefer(db_session, test_profile, "WY")
+
+        data = client.get(
+            "/api/v1/profiles/me/matching-institutions?limit=2", headers=auth_headers
+        ).json()
+
+        assert data["total"] == 3
+        assert [i["name"] for i in data["institutions"]] == [
+            "Directory 0",
+            "Directory 1",
+        ]
+
+    def test_warm_fills_every_state(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_profile: UserProfile,
+        db_session: Session,
+        make_institution,
+    ):
+        make_institution(900731, "Directory Warm", state="WY")
+        self._prefer(db_session, test_profile, "WY")
+        url = "/api/v1/profiles/me/matching-institutions"
+        cold = client.get(url, headers=auth_headers)
+        clear_caches()
+
+        assert InstitutionDirectoryService(db_session).warm() >= 1
+        warm = client.get(url, headers=auth_headers)
+
+        assert warm.json() == cold.json()
+        assert int(warm.headers["X-DB-Queries"]) == (
+            int(cold.headers["X-DB-Queries"]) - 1
+        )
+
+
+@pytest.mark.integration
+class TestScholarshipMatches:
+    """Test precomputed per-user scholarship matches"""
+
+    def _scholarship_data(self, title: str, **fields) -> ScholarshipCreate:
+        values = dict(
+            title=title,
+            organization="Match Table Fund",
+            scholarship_type="other",
+            amount_min=1000,
+            amount_max=2000,
+            deadline=(datetime.now() + timedelta(days=60)).date(),
+        )
+        values.update(fields)
+        return ScholarshipCreate(**values)
+
+    def _match_titles(self, db_session: Session, user_id: int):
+        matches = ScholarshipMatchService(db_session).get_matches(user_id, limit=1000)
+        return [scholarship.title for scholarship, _ in matches]
+
+    def test_new_scholarship_reaches_eligible_users(
+        self, db_session: Session, test_profile: UserProfile
+    ):
+        service = ScholarshipService(db_session)
+        match_service = ScholarshipMatchService(db_session)
+        for data in (
+            self._scholarship_data("Match Table Open"),
+            self._scholarship_data("Match Table Arts", scholarship_type="arts"),
+        ):
+            scholarship = service.create_scholarship(data)
+            match_service.refresh_for_scholarship(scholarship.id)
+
+        titles = self._match_titles(db_session, test_profile.user_id)
+        assert "Match Table Open" in titles
+        assert "Match Table Arts" not in titles  # Computer Science major
+
+    def test_profile_change_refreshes_matches(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        db_session: Session,
+        test_profile: UserProfile,
+    ):
+        ScholarshipService(db_session).create_scholarship(
+            self._scholarship_data("Match Table High GPA", min_gpa=3.9)
+        )
+        assert "Match Table High GPA" not in self._match_titles(
+            db_session, test_profile.user_id
+        )
+
+        response = client.put(
+            "/api/v1/profiles/me", json={"gpa": 3.95}, headers=auth_headers
+        )
+        assert response.status_code == 200
+
+        response = client.get(
+            "/api/v1/profiles/me/scholarship-matches", headers=auth_headers
+        )
+        assert response.status_code == 200
+        titles = [match["title"] for match in response.json()["matches"]]
+        assert "Match Table High GPA" in titles
+
+    def test_full_sets_scoring_higher_are_skipped(
+        self, db_session: Session, test_profile: UserProfile, monkeypatch
+    ):
+        """A new scholarship only refreshes users whose top N it could enter"""
+        service = ScholarshipService(db_session)
+        held = service.create_scholarship(self._scholarship_data("Match Table Held"))
+        monkeypatch.setattr(settings, "SCHOLARSHIP_MATCHES_PER_USER", 1)
+        db_session.query(UserScholarshipMatch).filter(
+            UserScholarshipMatch.user_id == test_profile.user_id
+        ).delete()
+        db_session.add(
+            UserScholarshipMatch(
+                user_id=test_profile.user_id, scholarship_id=held.id, score=100.0
+            )
+        )
+        db_session.commit()
+
+        new = service.create_scholarship(self._scholarship_data("Match Table Skip"))
+
+        assert ScholarshipMatchService(db_session).refresh_for_scholarship(new.id) == 0
+        assert self._match_titles(db_session, test_profile.user_id) == [
+            "Match Table Held"
+        ]
+
+    def test_new_largest_award_refreshes_full_sets(
+        self, db_session: Session, test_profile: UserProfile, monkeypatch
+    ):
+        """It lowers every other stored score, so full sets aren't skipped"""
+        service = ScholarshipService(db_session)
+        held = service.create_scholarship(self._scholarship_data("Match Table Held"))
+        monkeypatch.setattr(settings, "SCHOLARSHIP_MATCHES_PER_USER", 1)
+        ScholarshipMatchService(db_session).refresh_user(test_profile.user_id)
+        assert self._match_titles(db_session, test_profile.user_id) == [held.title]
+
+        large = service.create_scholarship(
+            self._scholarship_data("Match Table Large", amount_max=10**9)
+        )
+
+        assert ScholarshipMatchService(db_session).refresh_for_scholarship(large.id)
+        assert self._match_titles(db_session, test_profile.user_id) == [large.title]
+
+    def test_write_routes_refresh_in_background(
+        self, client: TestClient, admin_headers: dict, monkeypatch
+    ):
+        refreshed = []
+        monkeypatch.setattr(
+            scholarships, "refresh_matches_for_scholarship", refreshed.append
+        )
+        payload = self._scholarship_data("Match Table Route").model_dump(mode="json")
+
+        created = client.post(
+            "/api/v1/scholarships/", json=payload, headers=admin_headers
+        ).json()
+        client.patch(
+            f"/api/v1/scholarships/{created['id']}",
+            json={"amount_max": 3000},
+            headers=admin_headers,
+        )
+
+        assert refreshed == [created["id"], created["id"]]
+
+    def test_get_or_compute_matches(
+        self, db_session: Session, test_profile: UserProfile, make_scholarship
+    ):
+        """Users without stored matches get them computed on first read"""
+        make_scholarship("Match Table First Read", scholarship_type="other")
+        service = ScholarshipMatchService(db_session)
+        assert service.get_matches(test_profile.user_id) == []
+
+        matches = service.get_or_compute_matches(test_profile.user_id, limit=1000)
+
+        assert "Match Table First Read" in [s.title for s, _ in matches]
+        assert service.get_matches(test_profile.user_id)
+
+    def test_refresh_all(
+        self, db_session: Session, test_profile: UserProfile, make_scholarship
+    ):
+        make_scholarship("Match Table Direct Insert", scholarship_type="other")
+
+        assert ScholarshipMatchService(db_session).refresh_all() >= 1
+        assert "Match Table Direct Insert" in self._match_titles(
+            db_session, test_profile.user_id
+        )
+
+
+@pytest.mark.integration
+class TestAdmissionsFit:
+    """Test the reach/match/safety endpoint (profile SAT 1400, ACT 32)"""
+
+    @pytest.fixture
+    def fit_rows(self, make_institution):
+        make_institution(
+            900601,
+            "Fit Reach U",
+            state="ID",
+            sat_math_25th=730,
+            sat_math_75th=780,
+            sat_reading_25th=720,
+            sat_reading_75th=780,
+            act_composite_25th=33,
+            act_composite_75th=35,
+        )
+        make_institution(
+            900602,
+            "Fit Match U",
+            state="ID",
+            sat_math_25th=650,
+            sat_math_75th=730,
+            sat_reading_25th=650,
+            sat_reading_75th=720,
+        )
+        make_institution(
+            900603,
+            "Fit Safety U",
+            state="ID",
+            act_composite_25th=22,
+            act_composite_75th=28,
+            acceptance_rate=70,
+        )
+        make_institution(
+            900604,
+            "Fit Selective U",
+            state="ID",
+            act_composite_25th=22,
+            act_composite_75th=28,
+            acceptance_rate=9,
+        )
+        make_institution(900605, "Fit Unknown U", state="ID")
+
+    def test_classifies_filtered_institutions(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        fit_rows,
+        test_profile: UserProfile,
+    ):
+        response = client.get(
+            "/api/v1/profiles/me/admissions-fit",
+            params={"state": "ID"},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        fits = {item["name"]: item["admissions_fit"] for item in data["items"]}
+        assert fits == {
+            "Fit Reach U": "reach",
+            "Fit Match U": "match",
+            "Fit Safety U": "safety",
+            "Fit Selective U": "reach",
+            "Fit Unknown U": "unknown",
+        }
+        assert data["counts"] == {"unknown": 1, "reach": 2, "match": 1, "safety": 1}
+        assert data["total"] == 5
+
+    def test_category_filter_and_pagination(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        fit_rows,
+        test_profile: UserProfile,
+    ):
+        params = {"state": "ID", "category": "reach", "limit": 1}
+
+        first = client.get(
+            "/api/v1/profiles/me/admissions-fit", params=params, headers=auth_headers
+        ).json()
+        second = client.get(
+            "/api/v1/profiles/me/admissions-fit",
+            params={**params, "page": 2},
+            headers=auth_headers,
+        ).json()
+
+        assert first["total"] == 2 and first["has_more"] is True
+        names = {first["items"][0]["name"], second["items"][0]["name"]}
+        assert names == {"Fit Reach U", "Fit Selective U"}
+
+    def test_placeholder_image_is_null(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_profile: UserProfile,
+        make_institution,
+    ):
+        make_institution(
+            900606,
+            "Fit Placeholder U",
+            state="ID",
+            primary_image_url="/images/default-institution.jpg",
+        )
+        make_institution(900607, "Fit Photo U", state="ID", primary_image_url="/a.jpg")
+
+        response = client.get(
+            "/api/v1/profiles/me/admissions-fit",
+            params={"state": "ID"},
+            headers=auth_headers,
+        )
+
+        images = {
+            item["name"]: item["primary_image_url"] for item in response.json()["items"]
+        }
+        assert images == {"Fit Placeholder U": None, "Fit Photo U": "/a.jpg"}
+
+    def test_sort_params_are_not_accepted(self, client: TestClient):
+        """Results are always in the default listing order"""
+        schema = client.get("/openapi.json").json()
+        parameters = schema["paths"]["/api/v1/profiles/me/admissions-fit"]["get"][
+            "parameters"
+        ]
+        names = {parameter["name"] for parameter in parameters}
+        assert "state" in names
+        assert not names & {"sort_by", "sort_order", "residency_state"}
+
+    def test_requires_test_scores(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        db_session: Session,
+        test_profile: UserProfile,
+    ):
+        test_profile.sat_score = None
+        test_profile.act_score = None
+        db_session.commit()
+
+        response = client.get(
+            "/api/v1/profiles/me/admissions-fit", headers=auth_headers
+        )
+        assert response.status_code == 400
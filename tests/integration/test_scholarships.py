@@ -17,6 +17,11 @@ from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 
 from app.models.scholarship import Scholarship
+from app.schemas.scholarship import ScholarshipSearchFilter
+from app.core.counters import BufferedCounter
+from app.core.pagination import encode_cursor
+from app.services.scholarship import ScholarshipService, scholarship_views
+from app.services.scholarship_ingest import ScholarshipIngestService
 
 
 @pytest.mark.integration
@@ -633,3 +638,520 @@ class TestScholarshipUpcomingDeadlines:
         response = client.get("/api/v1/scholarships/upcoming-deadlines?days_ahead=60")
 
         assert response.status_code == 200
+
+
+@pytest.mark.integration
+class TestScholarshipKeysetPagination:
+    """Test cursor (keyset) pagination of the scholarship listing"""
+
+    def test_cursor_pages_cover_all_rows(self, client: TestClient, db_session: Session):
+        """Walking next_cursor visits every active scholarship once, in order"""
+        # Two "Keyset B" rows (distinct organizations) exercise the id tie-break
+        for title, organization in [
+            ("Keyset A", "Keyset Foundation"),
+            ("Keyset B", "Keyset Foundation"),
+            ("Keyset B", "Keyset Trust"),
+            ("Keyset C", "Keyset Foundation"),
+        ]:
+            db_session.add(
+                Scholarship(
+                    title=title,
+                    organization=organization,
+                    scholarship_type="stem",
+                    amount_min=1000,
+                    amount_max=2000,
+                    deadline=datetime.now() + timedelta(days=30),
+                    status="active",
+                    difficulty_level="moderate",
+                    is_renewable=False,
+                )
+            )
+        db_session.commit()
+
+        offset_data = client.get("/api/v1/scholarships/?limit=100").json()
+        expected = [item["id"] for item in offset_data["items"]]
+
+        first = client.get("/api/v1/scholarships/?limit=3").json()
+        seen = [item["id"] for item in first["items"]]
+        cursor = first["next_cursor"]
+        while cursor:
+            response = client.get(f"/api/v1/scholarships/?limit=3&cursor={cursor}")
+            assert response.status_code == 200
+            data = response.json()
+            assert data["page"] is None
+            seen.extend(item["id"] for item in data["items"])
+            cursor = data["next_cursor"]
+
+        assert seen == expected
+
+    def test_invalid_cursor(self, client: TestClient):
+        """A malformed cursor is a client error"""
+        response = client.get("/api/v1/scholarships/?cursor=%7Bbroken")
+        assert response.status_code == 400
+
+    def test_mistyped_cursor(self, client: TestClient):
+        """Cursor values of the wrong type are rejected before the query"""
+        cursor = encode_cursor({"k": [1, "x"]})
+        response = client.get(f"/api/v1/scholarships/?cursor={cursor}")
+        assert response.status_code == 400
+
+
+@pytest.mark.integration
+class TestScholarshipSearchTotals:
+    """Test the cached total in ScholarshipService.search_scholarships"""
+
+    def test_write_invalidates_cached_total(
+        self, db_session: Session, make_scholarship
+    ):
+        service = ScholarshipService(db_session)
+        filters = ScholarshipSearchFilter(search_query="Totals Foundation")
+
+        make_scholarship("Totals One", organization="Totals Foundation")
+        assert service.search_scholarships(filters)[1] == 1
+
+        make_scholarship("Totals Two", organization="Totals Foundation")
+        assert service.search_scholarships(filters)[1] == 2
+
+    def test_view_counts_keep_cached_total(self, db_session: Session, make_scholarship):
+        service = ScholarshipService(db_session)
+        filters = ScholarshipSearchFilter(search_query="Totals Foundation")
+        scholarship = make_scholarship("Totals One", organization="Totals Foundation")
+        service.search_scholarships(filters)
+        assert service.increment_view_count(scholarship.id)
+
+        # Bypasses the ORM, so only the cache can answer with the old total
+        db_session.execute(
+            Scholarship.__table__.delete().where(Scholarship.id == scholarship.id)
+        )
+
+        assert service.search_scholarships(filters)[1] == 1
+
+
+@pytest.mark.integration
+class TestScholarshipFullTextSearch:
+    """Test full-text search_query in ScholarshipService.search_scholarships"""
+
+    def _titles(self, db_session: Session, search_query: str):
+        filters = ScholarshipSearchFilter(search_query=search_query)
+        scholarships, _ = ScholarshipService(db_session).search_scholarships(filters)
+        return [s.title for s in scholarships]
+
+    def test_matches_word_stems(self, db_session: Session, make_scholarship):
+        make_scholarship("Future Engineers Award")
+        assert "Future Engineers Award" in self._titles(db_session, "engineering")
+
+    def test_websearch_syntax(self, db_session: Session, make_scholarship):
+        make_scholarship("Nursing Leaders Grant")
+        make_scholarship("Coding Leaders Grant")
+
+        titles = self._titles(db_session, "leaders -nursing")
+        assert "Coding Leaders Grant" in titles
+        assert "Nursing Leaders Grant" not in titles
+
+    def test_title_matches_rank_first(self, db_session: Session, make_scholarship):
+        make_scholarship("Community Service Award", description="For volunteers")
+        make_scholarship(
+            "Hometown Award", description="Rewards volunteers doing service"
+        )
+
+        titles = self._titles(db_session, "volunteers service")
+        assert titles.index("Community Service Award") < titles.index(
+            "Hometown Award"
+        )
+
+    def test_short_terms_use_substring_match(
+        self, db_session: Session, make_scholarship
+    ):
+        make_scholarship("QZ Robotics Prize")
+        assert "QZ Robotics Prize" in self._titles(db_session, "qz")
+
+
+@pytest.mark.integration
+class TestScholarshipPriorityRank:
+    """Test the stored priority_rank used to order scholarship listings"""
+
+    def test_rank_set_on_insert(self, make_scholarship):
+        assert make_scholarship("Coca-Cola Scholars").priority_rank == 4
+        art = make_scholarship("Art Award", primary_image_url="/img/a.png")
+        assert art.priority_rank == 8
+        assert make_scholarship("Plain Award").priority_rank == 9
+
+    def test_rank_updated_with_title(self, db_session: Session, make_scholarship):
+        scholarship = make_scholarship("Plain Award")
+
+        scholarship.title = "National Merit Scholarship"
+        db_session.commit()
+        db_session.refresh(scholarship)
+
+        assert scholarship.priority_rank == 6
+
+    def test_pinned_scholarships_sort_first(
+        self, db_session: Session, make_scholarship
+    ):
+        make_scholarship("Priority Plain Award")
+        make_scholarship("Lowe's Educational Priority Award")
+
+        filters = ScholarshipSearchFilter(search_query="priority")
+        scholarships, _ = ScholarshipService(db_session).search_scholarships(filters)
+
+        assert scholarships[0].title == "Lowe's Educational Priority Award"
+
+
+@pytest.mark.integration
+class TestScholarshipSearchEndpoint:
+    """Test the public /api/v1/scholarships/search endpoint and its cache"""
+
+    def test_applies_filters(self, client: TestClient, make_scholarship):
+        make_scholarship("Endpoint Big Award", amount_min=8000, amount_max=9000)
+        make_scholarship("Endpoint Small Award")
+
+        response = client.get(
+            "/api/v1/scholarships/search",
+            params={"search_query": "endpoint", "min_amount": 5000},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["title"] for item in data["items"]] == ["Endpoint Big Award"]
+        assert data["total"] == 1
+
+    def test_repeat_search_is_cached(self, client: TestClient, make_scholarship):
+        make_scholarship("Endpoint Cached Award")
+        params = {"search_query": "endpoint"}
+
+        first = client.get("/api/v1/scholarships/search", params=params)
+        second = client.get("/api/v1/scholarships/search", params=params)
+
+        assert second.json() == first.json()
+        assert int(second.headers["X-DB-Queries"]) == 0
+
+    def test_write_invalidates_cached_results(
+        self, client: TestClient, db_session: Session, make_scholarship
+    ):
+        params = {"search_query": "endpoint"}
+        scholarship = make_scholarship("Endpoint Old Title")
+        assert client.get("/api/v1/scholarships/search", params=params).json()[
+            "total"
+        ] == 1
+
+        scholarship.title = "Endpoint New Title"
+        db_session.commit()
+        titles = [
+            item["title"]
+            for item in client.get(
+                "/api/v1/scholarships/search", params=params
+            ).json()["items"]
+        ]
+        assert titles == ["Endpoint New Title"]
+
+        db_session.delete(scholarship)
+        db_session.commit()
+        assert client.get("/api/v1/scholarships/search", params=params).json()[
+            "total"
+        ] == 0
+
+    def test_invalid_sort(self, client: TestClient):
+        response = client.get("/api/v1/scholarships/search?sort_by=priority_rank")
+        assert response.status_code == 422
+
+
+@pytest.mark.integration
+class TestBufferedViewCount:
+    """Test write-behind views_count increments"""
+
+    def test_flush_applies_batched_increments(
+        self, db_session: Session, make_scholarship
+    ):
+        counter = BufferedCounter(Scholarship.__table__, "views_count")
+        first = make_scholarship("Views One")
+        second = make_scholarship("Views Two")
+
+        for _ in range(3):
+            counter.increment(first.id)
+        counter.increment(second.id)
+        counter.increment(-1)  # No such row - skipped by the join
+
+        assert counter.flush(db_session) == 2
+        db_session.refresh(first)
+        db_session.refresh(second)
+        assert (first.views_count, second.views_count) == (3, 1)
+        assert counter.pending() == {}
+
+    def test_increment_skips_database(self, db_session: Session, make_scholarship):
+        scholarship = make_scholarship("Views Hot Path")
+        service = ScholarshipService(db_session)
+
+        assert service.increment_view_count(scholarship.id)
+        db_session.refresh(scholarship)
+        assert scholarship.views_count == 0
+        assert scholarship_views.pending()[scholarship.id] == 1
+
+
+@pytest.mark.integration
+class TestFindByProfile:
+    """Test ScholarshipService.find_by_profile (matching engine)"""
+
+    def test_matches_profile(self, db_session: Session, make_scholarship):
+        stem = make_scholarship("Match STEM", scholarship_type="stem")
+        make_scholarship("Match Arts", scholarship_type="arts")
+        make_scholarship("Match High GPA", scholarship_type="other", min_gpa=3.95)
+        make_scholarship(
+            "Match Expired",
+            scholarship_type="other",
+            deadline=(datetime.now() - timedelta(days=1)).date(),
+        )
+
+        results = ScholarshipService(db_session).find_by_profile(
+            gpa=3.5, intended_major="Computer Science", limit=10000
+        )
+        titles = [s.title for s in results]
+
+        assert stem in results
+        assert "Match Arts" not in titles
+        assert "Match High GPA" not in titles
+        assert "Match Expired" not in titles
+
+    def test_new_scholarship_refreshes_engine(
+        self, db_session: Session, make_scholarship
+    ):
+        service = ScholarshipService(db_session)
+        service.find_by_profile(gpa=3.5, limit=10000)
+
+        added = make_scholarship("Match Added Later", scholarship_type="other")
+
+        assert added in service.find_by_profile(gpa=3.5, limit=10000)
+
+
+@pytest.mark.integration
+class TestScholarshipBulkIngest:
+    """Test COPY-based bulk ingest with upsert"""
+
+    CSV = (
+        "title,organization,scholarship_type,amount_min,amount_max,min_gpa\n"
+        "Ingest Alpha,Ingest Org,stem,1000,2000,3.0\n"
+        "Ingest Beta,Ingest Org,arts,500,500,\n"
+        "Ingest Alpha,Ingest Org,stem,1500,2500,3.2\n"
+        "Ingest Broken,Ingest Org,not_a_type,100,200,\n"
+    )
+
+    def test_ingest_inserts_and_reports(self, db_session: Session):
+        result = ScholarshipIngestService(db_session).ingest_csv(
+            self.CSV.splitlines(keepends=True)
+        )
+
+        assert (result.inserted, result.updated) == (2, 0)
+        assert result.rejected == 1
+        assert result.duplicates == 1
+        assert result.errors[0]["row"] == 4
+
+        alpha = (
+            db_session.query(Scholarship)
+            .filter(Scholarship.title == "Ingest Alpha")
+            .one()
+        )
+        assert alpha.amount_max == 2500  # Last duplicate wins
+        assert alpha.status.value == "active"
+
+    def test_ingest_updates_existing(self, db_session: Session):
+        service = ScholarshipIngestService(db_session)
+        service.ingest_csv(self.CSV.splitlines(keepends=True))
+
+        result = service.ingest(
+            [
+                {
+                    "title": "Ingest Beta",
+                    "organization": "Ingest Org",
+                    "scholarship_type": "arts",
+                    "amount_min": 700,
+                    "amount_max": 900,
+                }
+            ]
+        )
+
+        assert (result.inserted, result.updated) == (0, 1)
+        beta = (
+            db_session.query(Scholarship)
+            .filter(Scholarship.title == "Ingest Beta")
+            .one()
+        )
+        db_session.refresh(beta)
+        assert beta.amount_max == 900
+
+    def test_endpoint_requires_admin(self, client: TestClient, auth_headers: dict):
+        response = client.post(
+            "/api/v1/scholarships/bulk-ingest",
+            files={"file": ("s.csv", self.CSV, "text/csv")},
+            headers=auth_headers,
+        )
+        assert response.status_code == 403
+
+    def test_endpoint_ingests_csv(self, client: TestClient, admin_headers: dict):
+        response = client.post(
+            "/api/v1/scholarships/bulk-ingest",
+            files={"file": ("s.csv", self.CSV, "text/csv")},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["inserted"] == 2
+        assert data["rejected"] == 1
+
+
+@pytest.mark.integration
+class TestScholarshipNaturalKey:
+    """Test (organization, title) conflicts on single create/update"""
+
+    PAYLOAD = {
+        "title": "Conflict Award",
+        "organization": "Conflict Org",
+        "scholarship_type": "other",
+        "amount_min": 500,
+        "amount_max": 1000,
+    }
+
+    def test_duplicate_create_is_409(self, client: TestClient, admin_headers: dict):
+        first = client.post(
+            "/api/v1/scholarships/", json=self.PAYLOAD, headers=admin_headers
+        )
+        second = client.post(
+            "/api/v1/scholarships/", json=self.PAYLOAD, headers=admin_headers
+        )
+
+        assert first.status_code == 201
+        assert second.status_code == 409
+        assert "Conflict Award" in second.json()["detail"]
+        assert "Conflict Org" in second.json()["detail"]
+
+    def test_update_onto_existing_key_is_409(
+        self, client: TestClient, admin_headers: dict
+    ):
+        client.post("/api/v1/scholarships/", json=self.PAYLOAD, headers=admin_headers)
+        other = client.post(
+            "/api/v1/scholarships/",
+            json={**self.PAYLOAD, "title": "Conflict Other"},
+            headers=admin_headers,
+        ).json()
+
+        response = client.patch(
+            f"/api/v1/scholarships/{other['id']}",
+            json={"title": "Conflict Award"},
+            headers=admin_headers,
+        )
+
+        assert response.status_code == 409
+
+    def test_key_is_stripped(self, client: TestClient, admin_headers: dict):
+        """Surrounding whitespace doesn't make a new key (as in bulk ingest)"""
+        first = client.post(
+            "/api/v1/scholarships/", json=self.PAYLOAD, headers=admin_headers
+        )
+        padded = {
+            **self.PAYLOAD,
+            "title": " Conflict Award ",
+            "organization": "Conflict Org ",
+        }
+        second = client.post(
+            "/api/v1/scholarships/", json=padded, headers=admin_headers
+        )
+
+        assert first.json()["title"] == "Conflict Award"
+        assert second.status_code == 409
+
+    def test_create_requires_admin(self, client: TestClient, auth_headers: dict):
+        response = client.post(
+            "/api/v1/scholarships/", json=self.PAYLOAD, headers=auth_headers
+        )
+        assert response.status_code == 403
+
+
+@pytest.mark.integration
+class TestScholarshipExpiry:
+    """Test the past-deadline expiration sweep"""
+
+    def test_expires_past_deadline_in_batches(
+        self, db_session: Session, make_scholarship
+    ):
+        today = datetime.now().date()
+        past = [
+            make_scholarship(f"Expiry Past {i}", deadline=today - timedelta(days=1 + i))
+            for i in range(3)
+        ]
+        future = make_scholarship("Expiry Future", deadline=today + timedelta(days=10))
+
+        expired = ScholarshipService(db_session).expire_past_deadline(batch_size=2)
+
+        assert expired >= 3
+        for scholarship in past + [future]:
+            db_session.refresh(scholarship)
+        assert all(s.status.value == "expired" for s in past)
+        assert future.status.value == "active"
+
+    def test_expired_leave_active_listing(
+        self, client: TestClient, db_session: Session, make_scholarship
+    ):
+        make_scholarship(
+            "Expiry Listed Past", deadline=datetime.now().date() - timedelta(days=5)
+        )
+        ScholarshipService(db_session).expire_past_deadline()
+
+        response = client.get("/api/v1/scholarships/search?search_query=Expiry")
+
+        titles = [s["title"] for s in response.json()["items"]]
+        assert "Expiry Listed Past" not in titles
+
+
+@pytest.mark.integration
+class TestScholarshipFacets:
+    """Test faceted counts for the search filters"""
+
+    @pytest.fixture
+    def facet_rows(self, make_scholarship):
+        deadline = datetime(2031, 3, 15).date()
+        rows = [
+            ("Facet One", "stem", 500, True, deadline),
+            ("Facet Two", "stem", 7500, False, deadline),
+            ("Facet Three", "arts", 30000, False, None),
+        ]
+        for title, scholarship_type, amount, renewable, due in rows:
+            make_scholarship(
+                title,
+                scholarship_type=scholarship_type,
+                amount_min=amount,
+                amount_max=amount,
+                is_renewable=renewable,
+                deadline=due,
+            )
+
+    def test_counts_every_facet(self, client: TestClient, facet_rows):
+        response = client.get(
+            "/api/v1/scholarships/facets", params={"search_query": "Facet"}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        facets = data["facets"]
+        assert data["total"] == 3
+        assert facets["scholarship_type"] == {"stem": 2, "arts": 1}
+        assert facets["amount"]["under_1000"] == 1
+        assert facets["amount"]["5000_9999"] == 1
+        assert facets["amount"]["25000_plus"] == 1
+        assert facets["renewable"] == {"true": 1, "false": 2}
+        assert facets["deadline_month"] == {"2031-03": 2, "none": 1}
+
+    def test_facets_follow_filters(self, client: TestClient, facet_rows):
+        data = client.get(
+            "/api/v1/scholarships/facets",
+            params={"search_query": "Facet", "scholarship_type": "stem"},
+        ).json()
+
+        assert data["total"] == 2
+        assert data["facets"]["scholarship_type"] == {"stem": 2}
+        assert data["facets"]["amount"]["25000_plus"] == 0
+
+    def test_facets_are_cached(self, client: TestClient, facet_rows):
+        params = {"search_query": "Facet"}
+        client.get("/api/v1/scholarships/facets", params=params)
+
+        response = client.get("/api/v1/scholarships/facets", params=params)
+
+        assert int(response.headers["X-DB-Queries"]) == 0
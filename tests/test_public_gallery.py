@@ -224,6 +224,31 @@ class TestInstitutionGalleryByIpeds:
 
         assert response.status_code == 200
 
+    def test_get_images_by_ipeds_single_query(
+        self,
+        client: TestClient,
+        test_institution: Institution,
+        institution_gallery_images: list[EntityImage],
+    ):
+        """The institution and its images are read with one joined query."""
+        response = client.get(
+            f"/api/v1/public-gallery/institutions/ipeds/{test_institution.ipeds_id}/images"
+        )
+
+        assert response.status_code == 200
+        assert int(response.headers["X-DB-Queries"]) == 1
+
+    def test_get_images_by_ipeds_without_images(
+        self, client: TestClient, test_institution: Institution
+    ):
+        """A known institution without images has an empty gallery, not a 404."""
+        response = client.get(
+            f"/api/v1/public-gallery/institutions/ipeds/{test_institution.ipeds_id}/images"
+        )
+
+        assert response.status_code == 200
+        assert response.json() == []
+
 
 class TestInstitutionFeaturedByIpeds:
     """Tests for GET /api/v1/public-gallery/institutions/ipeds/{ipeds_id}/featured"""
@@ -304,6 +329,26 @@ class TestInstitutionFeaturedByIpeds:
 
         assert response.status_code == 200
 
+    def test_get_featured_by_ipeds_without_featured(
+        self,
+        client: TestClient,
+        test_institution: Institution,
+        institution_gallery_images: list[EntityImage],
+        db: Session,
+    ):
+        """A known institution without a featured image returns null in one query."""
+        for image in institution_gallery_images:
+            image.is_featured = False
+        db.commit()
+
+        response = client.get(
+            f"/api/v1/public-gallery/institutions/ipeds/{test_institution.ipeds_id}/featured"
+        )
+
+        assert response.status_code == 200
+        assert response.json() is None
+        assert int(response.headers["X-DB-Queries"]) == 1
+
 
 class TestScholarshipGallery:
     """Tests for GET /api/v1/public-gallery/scholarships/{scholarship_id}/images"""
@@ -510,3 +555,105 @@ class TestGalleryEdgeCases:
         if data:
             image_urls = [img["image_url"] for img in data]
             assert "scholarship_only.jpg" not in str(image_urls)
+
+
+class TestBatchGallery:
+    """Tests for the batch featured/gallery endpoints (one query per page)"""
+
+    def test_institutions_featured(
+        self,
+        client: TestClient,
+        test_institution: Institution,
+        institution_gallery_images: list[EntityImage],
+    ):
+        """Featured image per id; ids without one map to null."""
+        response = client.get(
+            "/api/v1/public-gallery/institutions/featured",
+            params={"ids": [test_institution.id, 999999]},
+        )
+
+        assert response.status_code == 200
+        images = response.json()["images"]
+        assert images[str(test_institution.id)]["filename"] == "campus1.jpg"
+        assert images["999999"] is None
+        assert int(response.headers["X-DB-Queries"]) == 1
+
+    def test_institutions_galleries(
+        self,
+        client: TestClient,
+        test_institution: Institution,
+        institution_gallery_images: list[EntityImage],
+    ):
+        """Galleries per id, each in display order."""
+        response = client.get(
+            "/api/v1/public-gallery/institutions/images",
+            params={"ids": [test_institution.id, 999999, test_institution.id]},
+        )
+
+        assert response.status_code == 200
+        galleries = response.json()["galleries"]
+        assert list(galleries) == [str(test_institution.id), "999999"]
+        orders = [img["display_order"] for img in galleries[str(test_institution.id)]]
+        assert orders == [1, 2, 3]
+        assert galleries["999999"] == []
+        assert int(response.headers["X-DB-Queries"]) == 1
+
+    def test_by_ipeds(
+        self,
+        client: TestClient,
+        test_institution: Institution,
+        institution_gallery_images: list[EntityImage],
+    ):
+        """IPEDS ids are resolved in the same query."""
+        ipeds_id = str(test_institution.ipeds_id)
+
+        featured = client.get(
+            "/api/v1/public-gallery/institutions/ipeds/featured",
+            params={"ids": [test_institution.ipeds_id, 123]},
+        )
+        galleries = client.get(
+            "/api/v1/public-gallery/institutions/ipeds/images",
+            params={"ids": [test_institution.ipeds_id]},
+        )
+
+        assert featured.status_code == 200
+        assert featured.json()["images"][ipeds_id]["filename"] == "campus1.jpg"
+        assert featured.json()["images"]["123"] is None
+        assert int(featured.headers["X-DB-Queries"]) == 1
+        assert len(galleries.json()["galleries"][ipeds_id]) == 3
+
+    def test_scholarships(
+        self,
+        client: TestClient,
+        test_scholarship: Scholarship,
+        scholarship_gallery_images: list[EntityImage],
+        test_institution: Institution,
+        institution_gallery_images: list[EntityImage],
+    ):
+        """Scholarship batches never include institution images."""
+        response = client.get(
+            "/api/v1/public-gallery/scholarships/images",
+            params={"ids": [test_scholarship.id, test_institution.id]},
+        )
+
+        galleries = response.json()["galleries"]
+        assert all(
+            img["entity_type"] == "scholarship"
+            for gallery in galleries.values()
+            for img in gallery
+        )
+        assert len(galleries[str(test_scholarship.id)]) == len(
+            scholarship_gallery_images
+        )
+
+    def test_id_limits(self, client: TestClient):
+        """At least one and at most 100 ids."""
+        url = "/api/v1/public-gallery/institutions/featured"
+        assert client.get(url).status_code == 422
+        assert client.get(url, params={"ids": list(range(101))}).status_code == 422
+
+    def test_invalid_ids(self, client: TestClient):
+        """Ids that are not positive Postgres integers are rejected."""
+        url = "/api/v1/public-gallery/scholarships/images"
+        for ids in (["abc"], [0], [2**31]):
+            assert client.get(url, params={"ids": ids}).status_code == 422
@@ -5,6 +5,7 @@ Fixed to handle plain text response from /routes-simple.
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
 
 
 class TestRootEndpoint:
@@ -120,6 +121,133 @@ class TestHealthEndpoint:
             assert isinstance(data.get("timestamp") or data.get("time"), str)
 
 
+class TestDatabaseHealthEndpoint:
+    """Tests for GET /health/db (connection pool telemetry)"""
+
+    def test_pool_status_success(self, client: TestClient):
+        """Test pool telemetry is reported for every engine."""
+        response = client.get("/health/db")
+
+        assert response.status_code == 200
+        pools = response.json()["pools"]
+        assert "primary" in pools
+        assert "catalog" in pools
+
+    def test_pool_status_structure(self, client: TestClient):
+        """Test each pool exposes gauges, counters and liveness."""
+        response = client.get("/health/db")
+
+        for stats in response.json()["pools"].values():
+            for key in ["size", "checked_out", "overflow", "checkouts", "wait_ms_max"]:
+                assert key in stats
+            assert "healthy" in stats["liveness"]
+
+    def test_liveness_check_marks_engines_healthy(self, client: TestClient):
+        """Test a liveness pass records a healthy result."""
+        import asyncio
+        from app.core.db_pool import check_liveness, pool_status
+
+        asyncio.run(check_liveness())
+
+        assert all(s["liveness"]["healthy"] for s in pool_status().values())
+
+
+class TestReadYourWrites:
+    """Tests for the read-your-writes cookie set after authenticated writes"""
+
+    def test_authenticated_write_sets_cookie(
+        self, client: TestClient, auth_headers: dict, monkeypatch
+    ):
+        """Test a successful write pins follow-up reads to the primary."""
+        from app.core.config import settings
+        from app.core.database import RECENT_WRITE_COOKIE
+
+        monkeypatch.setattr(settings, "DATABASE_REPLICA_URL", "postgresql://replica")
+        response = client.put(
+            "/api/v1/profiles/me", json={"city": "Boston"}, headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        assert RECENT_WRITE_COOKIE in response.cookies
+
+    def test_reads_do_not_set_cookie(
+        self, client: TestClient, auth_headers: dict, monkeypatch
+    ):
+        """Test GET requests never open a read-your-writes window."""
+        from app.core.config import settings
+        from app.core.database import RECENT_WRITE_COOKIE
+
+        monkeypatch.setattr(settings, "DATABASE_REPLICA_URL", "postgresql://replica")
+        response = client.get("/api/v1/profiles/me", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert RECENT_WRITE_COOKIE not in response.cookies
+
+    def test_no_cookie_without_replica(self, client: TestClient, auth_headers: dict):
+        """Test no cookie is set when reads already go to the primary."""
+        from app.core.database import RECENT_WRITE_COOKIE
+
+        response = client.put(
+            "/api/v1/profiles/me", json={"city": "Boston"}, headers=auth_headers
+        )
+
+        assert RECENT_WRITE_COOKIE not in response.cookies
+
+
+class TestQueryStatsHeaders:
+    """Tests for per-request X-DB-Queries / X-DB-Time-ms headers"""
+
+    def test_headers_present(self, client: TestClient):
+        """Test every response reports query count and DB time."""
+        response = client.get("/health")
+
+        assert response.headers["X-DB-Queries"] == "0"
+        assert float(response.headers["X-DB-Time-ms"]) == 0.0
+
+    def test_queries_counted(self, client: TestClient):
+        """Test queries from the request's session are counted."""
+        response = client.get("/api/v1/institutions/")
+
+        assert response.status_code == 200
+        # COUNT(*) + page query
+        assert int(response.headers["X-DB-Queries"]) >= 2
+        assert float(response.headers["X-DB-Time-ms"]) > 0
+
+    def test_repeated_statements_logged_as_n_plus_one(
+        self, client: TestClient, db: Session, auth_headers: dict, test_user, caplog
+    ):
+        """Test lazy loads repeated per row are flagged as probable N+1."""
+        import logging
+        from app.models.scholarship import Scholarship
+        from app.models.scholarship_applications import ScholarshipApplication
+
+        for i in range(6):
+            scholarship = Scholarship(
+                title=f"N+1 Scholarship {i}",
+                organization="Query Stats Org",
+                scholarship_type="stem",
+                amount_min=1000,
+                amount_max=2000,
+            )
+            db.add(scholarship)
+            db.flush()
+            db.add(
+                ScholarshipApplication(
+                    user_id=test_user.id, scholarship_id=scholarship.id
+                )
+            )
+        db.commit()
+        db.expire_all()
+
+        with caplog.at_level(logging.WARNING, logger="app.main"):
+            response = client.get(
+                "/api/v1/scholarship-tracking/dashboard", headers=auth_headers
+            )
+
+        assert response.status_code == 200
+        assert "Probable N+1" in caplog.text
+
+
 class TestRoutesSimpleEndpoint:
     """Tests for GET /routes-simple"""
 
@@ -0,0 +1,91 @@
+"""
+Unit tests for the vectorized admissions-fit classifier.
+"""
+
+import pytest
+
+from app.services.admissions_fit import (
+    MATCH,
+    REACH,
+    SAFETY,
+    UNKNOWN,
+    category_counts,
+    classify,
+)
+from app.services.institution_snapshot import build_arrays
+
+
+def half(value):
+    return None if value is None else value // 2
+
+
+def row(id, sat=None, act=None, acceptance_rate=None):
+    """sat=(25th, 75th) combined, split evenly across math and reading"""
+    sat_low, sat_high = sat or (None, None)
+    act_low, act_high = act or (None, None)
+    return (
+        id,
+        half(sat_low),
+        half(sat_high),
+        half(sat_low),
+        half(sat_high),
+        act_low,
+        act_high,
+        acceptance_rate,
+    )
+
+
+@pytest.mark.unit
+class TestClassify:
+    """Test reach/match/safety rules"""
+
+    def test_band_position(self):
+        arrays = build_arrays(
+            [
+                row(1, sat=(1450, 1550)),
+                row(2, sat=(1300, 1450)),
+                row(3, sat=(1100, 1300)),
+                row(4),
+            ]
+        )
+        assert list(classify(arrays, sat_score=1400)) == [
+            REACH,
+            MATCH,
+            SAFETY,
+            UNKNOWN,
+        ]
+
+    def test_better_test_counts(self):
+        arrays = build_arrays([row(1, sat=(1450, 1550), act=(28, 31))])
+        assert classify(arrays, sat_score=1400, act_score=32)[0] == SAFETY
+
+    def test_missing_test_band_is_ignored(self):
+        arrays = build_arrays([row(1, act=(28, 33))])
+        assert classify(arrays, sat_score=1600, act_score=30)[0] == MATCH
+        assert classify(arrays, sat_score=1600)[0] == UNKNOWN
+
+    def test_selectivity(self):
+        arrays = build_arrays(
+            [
+                row(1, sat=(1100, 1300), acceptance_rate=8),
+                row(2, sat=(1100, 1300), acceptance_rate=25),
+                row(3, acceptance_rate=5),
+                row(4, sat=(1100, 1300), acceptance_rate=60),
+            ]
+        )
+        assert list(classify(arrays, sat_score=1500)) == [
+            REACH,
+            MATCH,
+            REACH,
+            SAFETY,
+        ]
+
+    def test_empty_snapshot(self):
+        arrays = build_arrays([])
+        assert len(classify(arrays, sat_score=1200)) == 0
+        assert category_counts(classify(arrays, sat_score=1200)) == {
+            "unknown": 0,
+            "reach": 0,
+            "match": 0,
+            "safety": 0,
+        }
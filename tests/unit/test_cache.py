@@ -0,0 +1,85 @@
+"""
+Unit tests for the catalog caches.
+"""
+
+import pytest
+
+from app.core import cache as cache_module
+from app.core.cache import (
+    RedisTTLCache,
+    TTLCache,
+    invalidate_namespace,
+    register_cache,
+)
+
+
+@pytest.mark.unit
+class TestTTLCache:
+    """Test expiry, eviction and namespace invalidation"""
+
+    def test_get_and_set(self):
+        cache = TTLCache(ttl_seconds=60)
+        cache.set(("scholarships", "a"), 10)
+        assert cache.get(("scholarships", "a")) == 10
+        assert cache.get(("scholarships", "b")) is None
+
+    def test_expired_entries_are_misses(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("app.core.cache.time.monotonic", lambda: now[0])
+        cache = TTLCache(ttl_seconds=5)
+        cache.set(("institutions", "MA"), 3)
+
+        now[0] += 6
+        assert cache.get(("institutions", "MA")) is None
+
+    def test_zero_ttl_disables_caching(self):
+        cache = TTLCache(ttl_seconds=0)
+        cache.set(("institutions", "MA"), 3)
+        assert cache.get(("institutions", "MA")) is None
+
+    def test_max_entries_evicts(self):
+        cache = TTLCache(ttl_seconds=60, max_entries=2)
+        for i in range(3):
+            cache.set(("scholarships", i), i)
+        assert cache.get(("scholarships", 2)) == 2
+        assert len(cache._entries) == 2
+
+    def test_invalidate_only_drops_namespace(self):
+        cache = register_cache(TTLCache(ttl_seconds=60))
+        cache.set(("scholarships", "a"), 1)
+        cache.set(("institutions", "a"), 2)
+
+        invalidate_namespace("scholarships")
+
+        assert cache.get(("scholarships", "a")) is None
+        assert cache.get(("institutions", "a")) == 2
+
+
+@pytest.mark.unit
+class TestRedisTTLCache:
+    """Test the in-process fallback of the Redis-backed cache"""
+
+    def test_falls_back_without_redis_url(self):
+        cache = RedisTTLCache("", ttl_seconds=60, prefix="test")
+        cache.set(("scholarships", "a"), {"total": 1})
+        assert cache.get(("scholarships", "a")) == {"total": 1}
+
+    def test_invalidate_reaches_fallback(self):
+        cache = register_cache(RedisTTLCache("", ttl_seconds=60, prefix="test"))
+        cache.set(("scholarships", "a"), 1)
+
+        invalidate_namespace("scholarships")
+
+        assert cache.get(("scholarships", "a")) is None
+
+    def test_unreachable_redis_uses_fallback(self):
+        if cache_module.redis is None:
+            pytest.skip("redis package not installed")
+
+        cache = RedisTTLCache(
+            "redis://127.0.0.1:1/0", ttl_seconds=60, prefix="test"
+        )
+        cache.set(("scholarships", "a"), 1)
+
+        assert cache.get(("scholarships", "a")) == 1
+        assert cache._down_until > 0
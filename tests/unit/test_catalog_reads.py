@@ -0,0 +1,50 @@
+"""
+Unit tests for the Core column sets behind the public catalog reads.
+"""
+
+import pytest
+
+from app.schemas.entity_image import EntityImageResponse
+from app.schemas.institution import (
+    InstitutionResponse,
+    InstitutionSearchFilter,
+    InstitutionSummary,
+)
+from app.schemas.scholarship import ScholarshipResponse
+from app.services.catalog_reads import (
+    ENTITY_IMAGE_COLUMNS,
+    INSTITUTION_COLUMNS,
+    SCHOLARSHIP_COLUMNS,
+)
+from app.services.institution import listing_columns
+
+
+def keys(columns):
+    return [column.key for column in columns]
+
+
+@pytest.mark.unit
+class TestCatalogColumns:
+    """Rows carry exactly the response schema fields"""
+
+    @pytest.mark.parametrize(
+        "columns, schema",
+        [
+            (INSTITUTION_COLUMNS, InstitutionResponse),
+            (SCHOLARSHIP_COLUMNS, ScholarshipResponse),
+            (ENTITY_IMAGE_COLUMNS, EntityImageResponse),
+        ],
+    )
+    def test_columns_match_schema(self, columns, schema):
+        assert keys(columns) == list(schema.model_fields)
+
+    def test_listing_views(self):
+        filters = InstitutionSearchFilter()
+        assert keys(listing_columns(filters)) == list(InstitutionResponse.model_fields)
+        assert keys(listing_columns(filters, "summary")) == list(
+            InstitutionSummary.model_fields
+        )
+
+    def test_cost_sort_adds_cost_of_attendance(self):
+        filters = InstitutionSearchFilter(sort_by="cost")
+        assert keys(listing_columns(filters, "summary"))[-1] == "cost_of_attendance"
@@ -0,0 +1,84 @@
+"""
+Unit tests for write-behind counters.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.core.counters import BufferedCounter
+from app.models.scholarship import Scholarship
+
+
+@pytest.mark.unit
+class TestBufferedCounter:
+    """Test in-process buffering (no Redis URL)"""
+
+    def test_increments_accumulate(self):
+        counter = BufferedCounter(Scholarship.__table__, "views_count")
+        counter.increment(1)
+        counter.increment(1)
+        counter.increment(2, amount=5)
+        assert counter.pending() == {1: 2, 2: 5}
+
+    def test_drain_empties_buffer(self):
+        counter = BufferedCounter(Scholarship.__table__, "views_count")
+        counter.increment(3)
+
+        assert counter._drain_local() == {3: 1}
+        assert counter.pending() == {}
+
+    def test_flush_without_increments_skips_db(self):
+        counter = BufferedCounter(Scholarship.__table__, "views_count")
+        assert counter.flush(db=None) == 0
+
+
+@pytest.mark.unit
+class TestSharedFlush:
+    """Test the Redis flushing hash survives failed flushes"""
+
+    def _counter(self, monkeypatch, client):
+        counter = BufferedCounter(Scholarship.__table__, "views_count")
+        monkeypatch.setattr(counter, "_redis", lambda: client)
+        return counter
+
+    def _client(self):
+        client = MagicMock()
+        client.set.return_value = True
+        client.eval.return_value = [b"7", b"2"]
+        return client
+
+    def test_failed_flush_keeps_flushing_hash(self, monkeypatch):
+        client = self._client()
+        counter = BufferedCounter(Scholarship.__table__, "views_count")
+        counter.increment(4)  # No Redis URL: buffered in process
+        monkeypatch.setattr(counter, "_redis", lambda: client)
+        db = MagicMock()
+        db.execute.side_effect = RuntimeError("database down")
+
+        with pytest.raises(RuntimeError):
+            counter.flush(db)
+
+        client.delete.assert_not_called()
+        # Only in-process increments are re-buffered; Redis keeps its own
+        assert counter.pending() == {4: 1}
+        # The lock is released so the next flush retries the flushing hash
+        assert client.eval.call_args.args[2] == counter.lock_key
+
+    def test_flush_releases_flushing_hash(self, monkeypatch):
+        client = self._client()
+        counter = self._counter(monkeypatch, client)
+        db = MagicMock()
+        db.execute.return_value.rowcount = 1
+
+        assert counter.flush(db) == 1
+        client.delete.assert_called_once_with(counter.flushing_key)
+        db.commit.assert_called_once_with()
+
+    def test_locked_by_another_worker(self, monkeypatch):
+        client = self._client()
+        client.set.return_value = None
+        counter = self._counter(monkeypatch, client)
+
+        assert counter.flush(db=None) == 0
+        client.eval.assert_not_called()
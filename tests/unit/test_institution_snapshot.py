@@ -0,0 +1,116 @@
+"""
+Unit tests for the memory-mapped institution snapshot files.
+"""
+
+import json
+import os
+from datetime import datetime
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.models.institution import ControlType, Institution
+from app.services.institution_snapshot import (
+    MANIFEST,
+    _column_array,
+    load_snapshot,
+    read_manifest,
+    summary_stats,
+)
+
+COLUMNS = Institution.__table__.c
+
+
+def write_snapshot(directory, columns):
+    """Publish `columns` ({name: (column, values)}) like export_snapshot"""
+    os.makedirs(os.path.join(directory, "v1"))
+    for name, (column, values) in columns.items():
+        array = _column_array(column, values)
+        np.save(os.path.join(directory, "v1", f"{name}.npy"), array)
+    with open(os.path.join(directory, MANIFEST), "w") as f:
+        json.dump(
+            {"version": "v1", "path": "v1", "rows": 2, "columns": list(columns)}, f
+        )
+    return load_snapshot(directory, read_manifest(directory))
+
+
+@pytest.mark.unit
+class TestColumnArrays:
+    """Test column type mapping"""
+
+    def test_nullable_numbers_use_nan(self):
+        array = _column_array(COLUMNS.acceptance_rate, [Decimal("4.5"), None])
+        assert array.dtype == np.float64
+        assert array[0] == 4.5 and np.isnan(array[1])
+
+    def test_required_integers(self):
+        array = _column_array(COLUMNS.id, [1, 2])
+        assert array.dtype == np.int64
+
+    def test_enums_store_values(self):
+        array = _column_array(
+            COLUMNS.control_type, [ControlType.PUBLIC, ControlType.PRIVATE_NONPROFIT]
+        )
+        assert list(array) == ["PUBLIC", "PRIVATE_NONPROFIT"]
+
+    def test_strings_and_datetimes(self):
+        assert list(_column_array(COLUMNS.locale, ["City: Large", None])) == [
+            "City: Large",
+            "",
+        ]
+        dates = _column_array(COLUMNS.created_at, [datetime(2024, 1, 2), None])
+        assert np.isnat(dates[1])
+
+
+@pytest.mark.unit
+class TestMappedSnapshot:
+    """Test reading published snapshot files"""
+
+    def test_columns_are_mapped_read_only(self, tmp_path):
+        snapshot = write_snapshot(
+            str(tmp_path),
+            {"id": (COLUMNS.id, [7, 8]), "state": (COLUMNS.state, ["MA", "VT"])},
+        )
+        assert isinstance(snapshot["id"], np.memmap)
+        assert not snapshot["id"].flags.writeable
+        assert len(snapshot) == 2
+
+    def test_record_converts_missing_values(self, tmp_path):
+        snapshot = write_snapshot(
+            str(tmp_path),
+            {
+                "id": (COLUMNS.id, [7, 8]),
+                "acceptance_rate": (COLUMNS.acceptance_rate, [None, Decimal("9")]),
+                "primary_image_url": (COLUMNS.primary_image_url, [None, "/a.jpg"]),
+            },
+        )
+        assert snapshot.record(0, ["id", "acceptance_rate", "primary_image_url"]) == {
+            "id": 7,
+            "acceptance_rate": None,
+            "primary_image_url": None,
+        }
+        assert snapshot.record(1, ["acceptance_rate"]) == {"acceptance_rate": 9.0}
+
+    def test_summary_stats(self, tmp_path):
+        snapshot = write_snapshot(
+            str(tmp_path),
+            {
+                "id": (COLUMNS.id, [7, 8]),
+                "state": (COLUMNS.state, ["MA", "MA"]),
+                "control_type": (
+                    COLUMNS.control_type,
+                    [ControlType.PUBLIC, ControlType.PRIVATE_NONPROFIT],
+                ),
+                "primary_image_url": (
+                    COLUMNS.primary_image_url,
+                    ["/images/default-institution.jpg", "/a.jpg"],
+                ),
+            },
+        )
+        assert summary_stats(snapshot) == {
+            "total_institutions": 2,
+            "by_control_type": {"PRIVATE_NONPROFIT": 1, "PUBLIC": 1},
+            "by_state": {"MA": 2},
+            "with_images": 1,
+        }
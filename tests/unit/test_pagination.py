@@ -0,0 +1,121 @@
+"""
+Unit tests for keyset pagination cursors and listing totals.
+"""
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+
+from app.core.pagination import (
+    count_cache_key,
+    decode_cursor,
+    decode_sort_values,
+    encode_cursor,
+    explain_query,
+    keyset_after,
+    plan_rows,
+)
+from app.models.institution import Institution
+from app.models.scholarship import Scholarship
+
+
+@pytest.mark.unit
+class TestCursors:
+    """Test cursor encoding round trips and rejects garbage"""
+
+    def test_round_trip(self):
+        key = {"s": 90, "n": "Beta College", "i": 42}
+        assert decode_cursor(encode_cursor(key)) == key
+
+    def test_cursor_is_url_safe(self):
+        cursor = encode_cursor({"t": "Women in STEM?/+", "i": 1})
+        assert "=" not in cursor
+        assert "+" not in cursor and "/" not in cursor
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "W10", ""])
+    def test_invalid_cursor_raises(self, cursor):
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+
+@pytest.mark.unit
+class TestDecodeSortValues:
+    """Test cursor values are checked against the sort key columns"""
+
+    KEYS = [(Scholarship.title, False), (Scholarship.id, False)]
+
+    def test_round_trip(self):
+        cursor = encode_cursor({"k": ["Keyset B", 7]})
+        assert decode_sort_values(cursor, self.KEYS) == ["Keyset B", 7]
+
+    def test_decimals_restored(self):
+        keys = [(Institution.cost_in_state, False), (Institution.id, False)]
+        cursor = encode_cursor({"k": [Decimal("31500.00"), 7]})
+        assert decode_sort_values(cursor, keys) == [Decimal("31500.00"), 7]
+
+    @pytest.mark.parametrize(
+        "values",
+        [{"t": "A", "i": 1}, {"k": [1, "x"]}, {"k": ["A", True]}, {"k": ["A"]}],
+    )
+    def test_mismatched_values_raise(self, values):
+        with pytest.raises(ValueError):
+            decode_sort_values(encode_cursor(values), self.KEYS)
+
+
+@pytest.mark.unit
+class TestKeysetAfter:
+    """Test the keyset predicate for mixed-direction sort keys"""
+
+    def _sql(self, clause) -> str:
+        return str(clause.compile(compile_kwargs={"literal_binds": True}))
+
+    def test_mixed_directions(self):
+        keys = [
+            (Institution.data_completeness_score, True),
+            (Institution.name, False),
+            (Institution.id, False),
+        ]
+        sql = self._sql(keyset_after(keys, [90, "Beta", 7]))
+
+        assert "institutions.data_completeness_score <= 90" in sql
+        assert "institutions.data_completeness_score < 90" in sql
+        assert "institutions.name > 'Beta'" in sql
+        assert "institutions.name = 'Beta' AND institutions.id > 7" in sql
+
+    def test_single_ascending_key(self):
+        sql = self._sql(keyset_after([(Institution.id, False)], [5]))
+        assert "institutions.id >= 5" in sql
+        assert "institutions.id > 5" in sql
+
+
+@pytest.mark.unit
+class TestListingTotals:
+    """Test count cache keys and planner estimate parsing"""
+
+    def test_equivalent_filters_share_a_key(self):
+        a = count_cache_key("institutions", {"state": "MA", "city": None}, "exact")
+        b = count_cache_key("institutions", {"state": " MA "}, "exact")
+        assert a == b
+
+    def test_filter_order_does_not_matter(self):
+        a = count_cache_key("scholarships", {"x": 1, "y": True}, "exact")
+        b = count_cache_key("scholarships", {"y": True, "x": 1}, "exact")
+        assert a == b
+
+    def test_mode_is_part_of_key(self):
+        filters = {"active_only": True}
+        assert count_cache_key("scholarships", filters, "exact") != count_cache_key(
+            "scholarships", filters, "estimate"
+        )
+
+    def test_plan_rows_reads_top_node(self):
+        plan = [{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 1234}}]
+        assert plan_rows(plan) == 1234
+        assert plan_rows('[{"Plan": {"Plan Rows": 7}}]') == 7
+
+    def test_explain_inlines_and_escapes_literals(self):
+        query = select(Scholarship.id).where(Scholarship.title == "Note: 10:30")
+        sql = explain_query(query).text
+        assert sql.startswith("EXPLAIN (FORMAT JSON)")
+        assert "Note\\: 10\\:30" in sql
@@ -0,0 +1,52 @@
+"""
+Unit tests for per-request query stats and N+1 detection.
+"""
+
+import pytest
+
+from app.core.query_stats import (
+    QueryStats,
+    current_request_stats,
+    start_request_stats,
+    statement_shape,
+)
+
+
+@pytest.mark.unit
+class TestStatementShape:
+    """Test statement normalization"""
+
+    def test_whitespace_collapsed(self):
+        assert statement_shape("SELECT 1\n  FROM  t") == "SELECT 1 FROM t"
+
+    def test_in_lists_share_a_shape(self):
+        short = "SELECT * FROM t WHERE id IN (%(id_1)s, %(id_2)s)"
+        long = "SELECT * FROM t WHERE id IN (%(id_1)s, %(id_2)s, %(id_3)s)"
+        assert statement_shape(short) == statement_shape(long)
+
+
+@pytest.mark.unit
+class TestQueryStats:
+    """Test counting and repeated-shape detection"""
+
+    def test_record_counts_and_times(self):
+        stats = QueryStats()
+        stats.record("SELECT 1", 1.5)
+        stats.record("SELECT 2", 2.5)
+
+        assert stats.count == 2
+        assert stats.total_ms == 4.0
+
+    def test_repeated_shapes_flag_n_plus_one(self):
+        stats = QueryStats()
+        for _ in range(6):
+            stats.record("SELECT * FROM scholarships WHERE id = %(pk_1)s", 0.1)
+        stats.record("SELECT count(*) FROM scholarships", 0.1)
+
+        repeated = stats.repeated_shapes(threshold=5)
+        assert len(repeated) == 1
+        assert repeated[0][1] == 6
+
+    def test_start_request_stats_sets_context(self):
+        stats = start_request_stats()
+        assert current_request_stats() is stats
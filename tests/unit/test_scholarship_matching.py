@@ -0,0 +1,175 @@
+"""
+Unit tests for the vectorized scholarship matching engine.
+"""
+
+from datetime import date
+
+import pytest
+
+from app.models.scholarship import ScholarshipType
+from app.services.scholarship_matching import (
+    ELIGIBLE_ALL,
+    ELIGIBLE_ARTS,
+    ELIGIBLE_STEM,
+    ScholarshipMatcher,
+    academic_year_start,
+    build_arrays,
+    max_score,
+    profile_eligibility,
+    score_matches,
+)
+
+TODAY = date(2026, 1, 15)
+
+
+def row(
+    id,
+    min_gpa=None,
+    amount_max=1000,
+    deadline=date(2026, 6, 1),
+    scholarship_type=ScholarshipType.OTHER,
+    academic_year=None,
+    priority_rank=9,
+):
+    return (
+        id,
+        min_gpa,
+        amount_max,
+        amount_max,
+        deadline,
+        scholarship_type,
+        academic_year,
+        priority_rank,
+    )
+
+
+def ids(matches):
+    return [scholarship_id for scholarship_id, _ in matches]
+
+
+@pytest.mark.unit
+class TestProfileEligibility:
+    def test_unknown_major_is_eligible_for_everything(self):
+        assert profile_eligibility(None) == ELIGIBLE_ALL
+        assert profile_eligibility("  ") == ELIGIBLE_ALL
+
+    def test_major_keywords(self):
+        assert profile_eligibility("Mechanical Engineering") == ELIGIBLE_STEM
+        assert profile_eligibility("Music Performance") == ELIGIBLE_ARTS
+        assert profile_eligibility("Business") == 0
+
+    def test_academic_year_start(self):
+        assert academic_year_start("2027-2028") == 2027
+        assert academic_year_start(None) == 0
+        assert academic_year_start("next year") == 0
+
+
+@pytest.mark.unit
+class TestScoreMatches:
+    def test_filters_gpa_and_deadline(self):
+        arrays = build_arrays(
+            [
+                row(1, min_gpa=3.0),
+                row(2, min_gpa=3.9),
+                row(3, deadline=date(2025, 12, 1)),
+                row(4, deadline=None),
+            ]
+        )
+        assert sorted(ids(score_matches(arrays, gpa=3.5, today=TODAY))) == [1, 4]
+
+    def test_field_restricted_types(self):
+        arrays = build_arrays(
+            [
+                row(1, scholarship_type=ScholarshipType.STEM),
+                row(2, scholarship_type=ScholarshipType.ARTS),
+                row(3),
+            ]
+        )
+        matches = score_matches(arrays, intended_major="Biology", today=TODAY)
+        # STEM match ranks above the open scholarship; arts is excluded
+        assert ids(matches) == [1, 3]
+
+    def test_graduation_year(self):
+        arrays = build_arrays(
+            [
+                row(1, academic_year="2025-2026"),
+                row(2, academic_year="2027-2028"),
+                row(3),
+            ]
+        )
+        matches = score_matches(arrays, graduation_year=2027, today=TODAY)
+        assert sorted(ids(matches)) == [2, 3]
+
+    def test_top_n_by_score(self):
+        rows = [row(i, amount_max=1000 * i) for i in range(1, 11)]
+        arrays = build_arrays(rows + [row(11, priority_rank=1)])
+        matches = score_matches(arrays, limit=3, today=TODAY)
+        # Pinned first, then the largest awards
+        assert ids(matches) == [11, 10, 9]
+        scores = [score for _, score in matches]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_empty_catalog(self):
+        assert score_matches(build_arrays([]), gpa=4.0) == []
+
+
+@pytest.mark.unit
+class TestMaxScore:
+    def test_bounds_every_profile_score(self):
+        arrays = build_arrays(
+            [
+                row(1, amount_max=50000),
+                row(2, amount_max=1000, min_gpa=3.5),
+                row(3, amount_max=40000, scholarship_type=ScholarshipType.STEM),
+                row(4, amount_max=500, priority_rank=1),
+            ]
+        )
+        profiles = [
+            {},
+            {"gpa": 3.9, "intended_major": "Biology"},
+            {"gpa": 3.0, "intended_major": "History"},
+        ]
+        bounds = {i: max_score(arrays, i, today=TODAY) for i in (2, 3, 4)}
+        for profile in profiles:
+            for scholarship_id, score in score_matches(arrays, today=TODAY, **profile):
+                if scholarship_id in bounds:
+                    # Scores are rounded to 4 places
+                    assert score <= bounds[scholarship_id] + 1e-4
+
+    def test_small_award_scores_below_larger_award(self):
+        arrays = build_arrays(
+            [
+                row(1, amount_max=50000),
+                row(2, amount_max=1000),
+                row(3, amount_max=20000),
+            ]
+        )
+        assert max_score(arrays, 2, today=TODAY) < max_score(arrays, 3, today=TODAY)
+
+    def test_unknown_scholarship(self):
+        assert max_score(build_arrays([row(1)]), 99) is None
+
+    def test_new_largest_award_has_no_bound(self):
+        """It would renormalize (lower) other stored scores"""
+        arrays = build_arrays(
+            [
+                row(1, amount_max=5000),
+                row(2, amount_max=50000, scholarship_type=ScholarshipType.STEM),
+                row(3, amount_max=10000),
+            ]
+        )
+        assert max_score(arrays, 2, today=TODAY) is None
+        assert max_score(arrays, 1, today=TODAY) is not None
+
+
+@pytest.mark.unit
+class TestScholarshipMatcher:
+    def test_scholarship_writes_mark_stale(self):
+        matcher = ScholarshipMatcher()
+        matcher._arrays = build_arrays([row(1)])
+
+        matcher.invalidate("institutions")
+        assert matcher._arrays is not None
+
+        matcher.invalidate("scholarships")
+        assert matcher._arrays is None